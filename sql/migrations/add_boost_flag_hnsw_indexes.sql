@@ -0,0 +1,25 @@
+-- Migration to add partial HNSW indexes for metadata-boosted search
+-- Unfiltered boosted searches take the nearest chunks with the boost flag set
+-- through these indexes, and fill up from the rest only when fewer than k are
+-- flagged. Requires the generated boost columns
+-- (add_metadata_boost_columns.sql).
+
+CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding_addresses
+ON document_vectors USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64) WHERE contains_addresses;
+
+CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding_money
+ON document_vectors USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64) WHERE contains_money;
+
+CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding_emails
+ON document_vectors USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64) WHERE contains_emails;
+
+CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding_phone_numbers
+ON document_vectors USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64) WHERE contains_phone_numbers;
+
+CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding_contact
+ON document_vectors USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64) WHERE contains_contact;
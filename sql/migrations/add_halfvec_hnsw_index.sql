@@ -0,0 +1,17 @@
+-- Migration to add a half-precision HNSW index on document_vectors embeddings
+-- Similarity search shortlists candidates on embedding::halfvec(768) and then
+-- reranks them on the full-precision column, so the stored vectors stay
+-- vector(768) while the index holds 2-byte components (about half the size).
+-- Requires pgvector 0.7.0 or later for the halfvec type; the application's
+-- similarity search needs it too, so upgrade pgvector before deploying.
+
+DO $$
+BEGIN
+  IF (SELECT string_to_array(extversion, '.')::int[] FROM pg_extension WHERE extname = 'vector')
+     < ARRAY[0, 7, 0] THEN
+    RAISE EXCEPTION 'pgvector 0.7.0 or later is required (run ALTER EXTENSION vector UPDATE)';
+  END IF;
+END $$;
+
+CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding_halfvec
+ON document_vectors USING hnsw ((embedding::halfvec(768)) halfvec_cosine_ops);
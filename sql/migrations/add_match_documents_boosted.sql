@@ -0,0 +1,71 @@
+-- Migration to add the metadata-boosted match function for Supabase
+-- Requires the generated boost columns from add_metadata_boost_columns.sql
+-- Lets SupabaseVectorStoreWrapper run boosted searches over RPC instead of a
+-- direct database connection
+
+-- Metadata-boosted vector matching function
+-- Ranks chunks with the boost flag first, then by its count, then by distance
+-- (the same ordering as the direct-SQL boosted search)
+CREATE OR REPLACE FUNCTION match_documents_boosted(
+  query_embedding vector(768),
+  boost_field text,
+  match_count int DEFAULT 5,
+  filter jsonb DEFAULT '{}'::jsonb,
+  candidate_count int DEFAULT 100
+) RETURNS TABLE(
+  id uuid,
+  document_id text,
+  content text,
+  metadata jsonb,
+  similarity float
+) LANGUAGE plpgsql STABLE AS $$
+BEGIN
+  IF boost_field NOT IN ('contains_addresses', 'contains_money', 'contains_emails',
+                         'contains_phone_numbers', 'contains_contact') THEN
+    RAISE EXCEPTION 'Unknown boost field: %', boost_field;
+  END IF;
+
+  RETURN QUERY
+  WITH candidates AS (
+    SELECT
+      dv.id AS candidate_id,
+      dv.embedding <=> query_embedding AS distance,
+      CASE boost_field
+        WHEN 'contains_addresses' THEN dv.contains_addresses
+        WHEN 'contains_money' THEN dv.contains_money
+        WHEN 'contains_emails' THEN dv.contains_emails
+        WHEN 'contains_phone_numbers' THEN dv.contains_phone_numbers
+        WHEN 'contains_contact' THEN dv.contains_contact
+      END AS boost_flag,
+      CASE boost_field
+        WHEN 'contains_addresses' THEN dv.address_count
+        WHEN 'contains_money' THEN dv.money_count
+        WHEN 'contains_emails' THEN dv.email_count
+        WHEN 'contains_phone_numbers' THEN dv.phone_count
+        WHEN 'contains_contact' THEN dv.contact_count
+      END AS boost_count
+    FROM document_vectors dv
+    WHERE
+      -- Apply JSON filter conditions
+      CASE
+        WHEN filter ? 'domain_id' THEN
+          dv.domain_id = filter->>'domain_id'
+        WHEN filter ? 'document_id' THEN
+          dv.document_id = filter->>'document_id'
+        ELSE TRUE
+      END
+    ORDER BY boost_flag DESC, boost_count DESC, distance
+    LIMIT candidate_count
+  )
+  SELECT
+    d.id,
+    d.document_id,
+    d.content,
+    d.metadata,
+    1 - c.distance AS similarity
+  FROM candidates c
+  JOIN document_vectors d ON d.id = c.candidate_id
+  ORDER BY c.boost_flag DESC, c.boost_count DESC, c.distance
+  LIMIT match_count;
+END;
+$$;
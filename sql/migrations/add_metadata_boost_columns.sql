@@ -0,0 +1,16 @@
+-- Migration to add generated metadata boost columns to document_vectors
+-- Metadata-boosted search ranks chunks by these flags and counts; reading them
+-- from stored columns avoids parsing the metadata JSON of every candidate row.
+-- Existing rows are filled in when the columns are added (this rewrites the table).
+
+ALTER TABLE document_vectors
+    ADD COLUMN IF NOT EXISTS contains_addresses BOOLEAN GENERATED ALWAYS AS (COALESCE(metadata->>'contains_addresses' = 'true', false)) STORED,
+    ADD COLUMN IF NOT EXISTS address_count INTEGER GENERATED ALWAYS AS (COALESCE((metadata->>'address_count')::integer, 0)) STORED,
+    ADD COLUMN IF NOT EXISTS contains_money BOOLEAN GENERATED ALWAYS AS (COALESCE(metadata->>'contains_money' = 'true', false)) STORED,
+    ADD COLUMN IF NOT EXISTS money_count INTEGER GENERATED ALWAYS AS (COALESCE((metadata->>'money_count')::integer, 0)) STORED,
+    ADD COLUMN IF NOT EXISTS contains_emails BOOLEAN GENERATED ALWAYS AS (COALESCE(metadata->>'contains_emails' = 'true', false)) STORED,
+    ADD COLUMN IF NOT EXISTS email_count INTEGER GENERATED ALWAYS AS (COALESCE((metadata->>'email_count')::integer, 0)) STORED,
+    ADD COLUMN IF NOT EXISTS contains_phone_numbers BOOLEAN GENERATED ALWAYS AS (COALESCE(metadata->>'contains_phone_numbers' = 'true', false)) STORED,
+    ADD COLUMN IF NOT EXISTS phone_count INTEGER GENERATED ALWAYS AS (COALESCE((metadata->>'phone_count')::integer, 0)) STORED,
+    ADD COLUMN IF NOT EXISTS contains_contact BOOLEAN GENERATED ALWAYS AS (COALESCE(metadata->>'contains_contact' = 'true', false)) STORED,
+    ADD COLUMN IF NOT EXISTS contact_count INTEGER GENERATED ALWAYS AS (COALESCE((metadata->>'contact_count')::integer, 0)) STORED;
@@ -0,0 +1,12 @@
+-- Migration to replace the IVFFlat embedding index with an HNSW index
+-- HNSW does not depend on the data present when the index was built (IVFFlat
+-- lists go stale as documents are added) and gives better recall per query.
+-- The operator class must match the <=> (cosine distance) operator used by
+-- match_documents and the search queries, or the index is not used at all.
+-- Local searches raise hnsw.ef_search per transaction to cover their LIMIT.
+
+DROP INDEX IF EXISTS idx_document_vectors_embedding;
+
+CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding
+ON document_vectors USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64);
@@ -20,6 +20,15 @@ CREATE EXTENSION IF NOT EXISTS vector;
 CREATE EXTENSION IF NOT EXISTS pg_trgm; -- For text search optimization
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp"; -- For UUID generation
 
+-- Similarity search casts embeddings to halfvec, added in pgvector 0.7.0
+DO $$
+BEGIN
+  IF (SELECT string_to_array(extversion, '.')::int[] FROM pg_extension WHERE extname = 'vector')
+     < ARRAY[0, 7, 0] THEN
+    RAISE EXCEPTION 'pgvector 0.7.0 or later is required (run ALTER EXTENSION vector UPDATE)';
+  END IF;
+END $$;
+
 -- ============================================
 -- 2. Create Document Vectors Table
 -- ============================================
@@ -30,6 +39,18 @@ CREATE TABLE IF NOT EXISTS document_vectors (
   embedding vector(768),  -- nomic-embed-text uses 768 dimensions
   metadata JSONB DEFAULT '{}',
 
+  -- Metadata boost fields, generated from metadata for search ranking
+  contains_addresses BOOLEAN GENERATED ALWAYS AS (COALESCE(metadata->>'contains_addresses' = 'true', false)) STORED,
+  address_count INTEGER GENERATED ALWAYS AS (COALESCE((metadata->>'address_count')::integer, 0)) STORED,
+  contains_money BOOLEAN GENERATED ALWAYS AS (COALESCE(metadata->>'contains_money' = 'true', false)) STORED,
+  money_count INTEGER GENERATED ALWAYS AS (COALESCE((metadata->>'money_count')::integer, 0)) STORED,
+  contains_emails BOOLEAN GENERATED ALWAYS AS (COALESCE(metadata->>'contains_emails' = 'true', false)) STORED,
+  email_count INTEGER GENERATED ALWAYS AS (COALESCE((metadata->>'email_count')::integer, 0)) STORED,
+  contains_phone_numbers BOOLEAN GENERATED ALWAYS AS (COALESCE(metadata->>'contains_phone_numbers' = 'true', false)) STORED,
+  phone_count INTEGER GENERATED ALWAYS AS (COALESCE((metadata->>'phone_count')::integer, 0)) STORED,
+  contains_contact BOOLEAN GENERATED ALWAYS AS (COALESCE(metadata->>'contains_contact' = 'true', false)) STORED,
+  contact_count INTEGER GENERATED ALWAYS AS (COALESCE((metadata->>'contact_count')::integer, 0)) STORED,
+
   -- Domain-aware fields
   domain TEXT,
   domain_id VARCHAR(12),
@@ -48,9 +69,39 @@ CREATE TABLE IF NOT EXISTS document_vectors (
 -- ============================================
 -- 3. Create Indexes for Efficient Querying
 -- ============================================
+-- Vector indexes use cosine operator classes to match the <=> operator in
+-- the search queries; an index built for another operator is never used
 CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding
-ON document_vectors USING ivfflat (embedding vector_cosine_ops)
-WITH (lists = 100);
+ON document_vectors USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64);
+
+-- Half-precision copy of the embedding for the similarity search shortlist
+-- (requires pgvector 0.7.0+; results are reranked on the full-precision column)
+CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding_halfvec
+ON document_vectors USING hnsw ((embedding::halfvec(768)) halfvec_cosine_ops)
+WITH (m = 16, ef_construction = 64);
+
+-- Partial HNSW indexes per boost flag: unfiltered metadata-boosted searches
+-- scan the flagged chunks through these instead of sorting the whole table
+CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding_addresses
+ON document_vectors USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64) WHERE contains_addresses;
+
+CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding_money
+ON document_vectors USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64) WHERE contains_money;
+
+CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding_emails
+ON document_vectors USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64) WHERE contains_emails;
+
+CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding_phone_numbers
+ON document_vectors USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64) WHERE contains_phone_numbers;
+
+CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding_contact
+ON document_vectors USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64) WHERE contains_contact;
 
 CREATE INDEX IF NOT EXISTS idx_document_vectors_domain
 ON document_vectors(domain);
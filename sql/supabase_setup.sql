@@ -17,6 +17,15 @@ CREATE EXTENSION IF NOT EXISTS vector;
 CREATE EXTENSION IF NOT EXISTS pg_trgm; -- For text search optimization
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp"; -- For UUID generation
 
+-- Similarity search casts embeddings to halfvec, added in pgvector 0.7.0
+DO $$
+BEGIN
+  IF (SELECT string_to_array(extversion, '.')::int[] FROM pg_extension WHERE extname = 'vector')
+     < ARRAY[0, 7, 0] THEN
+    RAISE EXCEPTION 'pgvector 0.7.0 or later is required (run ALTER EXTENSION vector UPDATE)';
+  END IF;
+END $$;
+
 -- ============================================
 -- 2. Create Document Vectors Table
 -- ============================================
@@ -27,6 +36,18 @@ CREATE TABLE IF NOT EXISTS document_vectors (
   embedding vector(768),  -- nomic-embed-text uses 768 dimensions
   metadata JSONB DEFAULT '{}',
 
+  -- Metadata boost fields, generated from metadata for search ranking
+  contains_addresses BOOLEAN GENERATED ALWAYS AS (COALESCE(metadata->>'contains_addresses' = 'true', false)) STORED,
+  address_count INTEGER GENERATED ALWAYS AS (COALESCE((metadata->>'address_count')::integer, 0)) STORED,
+  contains_money BOOLEAN GENERATED ALWAYS AS (COALESCE(metadata->>'contains_money' = 'true', false)) STORED,
+  money_count INTEGER GENERATED ALWAYS AS (COALESCE((metadata->>'money_count')::integer, 0)) STORED,
+  contains_emails BOOLEAN GENERATED ALWAYS AS (COALESCE(metadata->>'contains_emails' = 'true', false)) STORED,
+  email_count INTEGER GENERATED ALWAYS AS (COALESCE((metadata->>'email_count')::integer, 0)) STORED,
+  contains_phone_numbers BOOLEAN GENERATED ALWAYS AS (COALESCE(metadata->>'contains_phone_numbers' = 'true', false)) STORED,
+  phone_count INTEGER GENERATED ALWAYS AS (COALESCE((metadata->>'phone_count')::integer, 0)) STORED,
+  contains_contact BOOLEAN GENERATED ALWAYS AS (COALESCE(metadata->>'contains_contact' = 'true', false)) STORED,
+  contact_count INTEGER GENERATED ALWAYS AS (COALESCE((metadata->>'contact_count')::integer, 0)) STORED,
+
   -- Domain-aware fields
   domain TEXT,
   domain_id VARCHAR(12),
@@ -45,9 +66,39 @@ CREATE TABLE IF NOT EXISTS document_vectors (
 -- ============================================
 -- 3. Create Indexes for Efficient Querying
 -- ============================================
+-- Vector indexes use cosine operator classes to match the <=> operator in
+-- the search queries; an index built for another operator is never used
 CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding
-ON document_vectors USING ivfflat (embedding vector_cosine_ops)
-WITH (lists = 100);
+ON document_vectors USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64);
+
+-- Half-precision copy of the embedding for the similarity search shortlist
+-- (requires pgvector 0.7.0+; results are reranked on the full-precision column)
+CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding_halfvec
+ON document_vectors USING hnsw ((embedding::halfvec(768)) halfvec_cosine_ops)
+WITH (m = 16, ef_construction = 64);
+
+-- Partial HNSW indexes per boost flag: unfiltered metadata-boosted searches
+-- scan the flagged chunks through these instead of sorting the whole table
+CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding_addresses
+ON document_vectors USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64) WHERE contains_addresses;
+
+CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding_money
+ON document_vectors USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64) WHERE contains_money;
+
+CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding_emails
+ON document_vectors USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64) WHERE contains_emails;
+
+CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding_phone_numbers
+ON document_vectors USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64) WHERE contains_phone_numbers;
+
+CREATE INDEX IF NOT EXISTS idx_document_vectors_embedding_contact
+ON document_vectors USING hnsw (embedding vector_cosine_ops)
+WITH (m = 16, ef_construction = 64) WHERE contains_contact;
 
 CREATE INDEX IF NOT EXISTS idx_document_vectors_domain
 ON document_vectors(domain);
@@ -154,6 +205,73 @@ BEGIN
 END;
 $$;
 
+-- Metadata-boosted vector matching function
+-- Ranks chunks with the boost flag first, then by its count, then by distance
+-- (the same ordering as the direct-SQL boosted search)
+CREATE OR REPLACE FUNCTION match_documents_boosted(
+  query_embedding vector(768),
+  boost_field text,
+  match_count int DEFAULT 5,
+  filter jsonb DEFAULT '{}'::jsonb,
+  candidate_count int DEFAULT 100
+) RETURNS TABLE(
+  id uuid,
+  document_id text,
+  content text,
+  metadata jsonb,
+  similarity float
+) LANGUAGE plpgsql STABLE AS $$
+BEGIN
+  IF boost_field NOT IN ('contains_addresses', 'contains_money', 'contains_emails',
+                         'contains_phone_numbers', 'contains_contact') THEN
+    RAISE EXCEPTION 'Unknown boost field: %', boost_field;
+  END IF;
+
+  RETURN QUERY
+  WITH candidates AS (
+    SELECT
+      dv.id AS candidate_id,
+      dv.embedding <=> query_embedding AS distance,
+      CASE boost_field
+        WHEN 'contains_addresses' THEN dv.contains_addresses
+        WHEN 'contains_money' THEN dv.contains_money
+        WHEN 'contains_emails' THEN dv.contains_emails
+        WHEN 'contains_phone_numbers' THEN dv.contains_phone_numbers
+        WHEN 'contains_contact' THEN dv.contains_contact
+      END AS boost_flag,
+      CASE boost_field
+        WHEN 'contains_addresses' THEN dv.address_count
+        WHEN 'contains_money' THEN dv.money_count
+        WHEN 'contains_emails' THEN dv.email_count
+        WHEN 'contains_phone_numbers' THEN dv.phone_count
+        WHEN 'contains_contact' THEN dv.contact_count
+      END AS boost_count
+    FROM document_vectors dv
+    WHERE
+      -- Apply JSON filter conditions
+      CASE
+        WHEN filter ? 'domain_id' THEN
+          dv.domain_id = filter->>'domain_id'
+        WHEN filter ? 'document_id' THEN
+          dv.document_id = filter->>'document_id'
+        ELSE TRUE
+      END
+    ORDER BY boost_flag DESC, boost_count DESC, distance
+    LIMIT candidate_count
+  )
+  SELECT
+    d.id,
+    d.document_id,
+    d.content,
+    d.metadata,
+    1 - c.distance AS similarity
+  FROM candidates c
+  JOIN document_vectors d ON d.id = c.candidate_id
+  ORDER BY c.boost_flag DESC, c.boost_count DESC, c.distance
+  LIMIT match_count;
+END;
+$$;
+
 -- Domain statistics update function
 CREATE OR REPLACE FUNCTION update_domain_stats_on_insert()
 RETURNS TRIGGER AS $$
@@ -282,7 +400,7 @@ SELECT
   (SELECT COUNT(*) FROM information_schema.tables
    WHERE table_name IN ('document_vectors', 'domain_statistics')) as tables_created,
   (SELECT COUNT(*) FROM pg_proc
-   WHERE proname IN ('match_documents', 'mark_path_as_embedded', 'get_domain_embedding_status')) as functions_created;
+   WHERE proname IN ('match_documents', 'match_documents_boosted', 'mark_path_as_embedded', 'get_domain_embedding_status')) as functions_created;
 
 -- Display table sizes
 SELECT
@@ -33,7 +33,7 @@ class TestCommand:
             'base_path': self.settings.storage.base_path
         }
         self.supabase_client = supabase_client
-        self.storage = StorageHandler(self.storage_config)
+        self.storage = StorageHandler(self.storage_config, client=supabase_client)
         self.extractor = OfficeLocationsExtractor(self.settings, supabase_client)
     
     def execute(self, domain: str, re_embed: bool = False) -> Dict[str, Any]:
@@ -85,11 +85,9 @@ class TestCommand:
         
         # Combine content (limit for testing)
         all_content = []
-        for filename in files[:10]:  # Limit to first 10 files
-            content = self.storage.download_file(domain, filename)
-            if content:
-                all_content.append(content)
-                logger.debug(f"Loaded {filename} ({len(content)} chars)")
+        for filename, content in self.storage.iter_domain_files(domain, limit=10):  # Limit to first 10 files
+            all_content.append(content)
+            logger.debug(f"Loaded {filename} ({len(content)} chars)")
         
         combined_content = "\n\n".join(all_content)
         logger.info(f"Combined content: {len(combined_content)} chars from {len(all_content)} files")
@@ -173,8 +171,8 @@ class TestCommand:
             return None
         
         # Normalize offices
-        extracted_norm = [normalize_office(o) for o in extracted if normalize_office(o)]
-        gt_norm = [normalize_office(o) for o in ground_truth if normalize_office(o)]
+        extracted_norm = [norm for norm in map(normalize_office, extracted) if norm]
+        gt_norm = [norm for norm in map(normalize_office, ground_truth) if norm]
         
         # Track matched ground truth indices
         matched_gt = set()
@@ -1,8 +1,26 @@
+"""
+Personal injury keyword taxonomy
+Phrases grouped by category and subcategory, plus a whole-phrase matcher
+"""
+
+import logging
+import re
+import sys
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterable, Iterator, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
 personal_injury_taxonomy = {
 
     # 1. Motor Vehicle Accidents
     'motor_vehicle_accidents': {
-        'car_accidents': [
+        'car_accidents': (
             # Core terms
             'car accident', 'auto accident', 'automobile accident', 'vehicle collision', 'car crash', 
             'motor vehicle accident', 'mvc', 'car wreck', 'auto wreck', 'vehicle wreck',
@@ -41,9 +59,9 @@ personal_injury_taxonomy = {
             
             # Variations and misspellings
             'car accidnet', 'auto accidnet', 'vehical accident', 'automible accident'
-        ],
+        ),
         
-        'motorcycle_accidents': [
+        'motorcycle_accidents': (
             # Core terms
             'motorcycle accident', 'motorcycle crash', 'motorcycle wreck', 'motorcycle collision',
             'motorbike accident', 'motorbike crash', 'motorcycle incident', 'mc accident',
@@ -82,9 +100,9 @@ personal_injury_taxonomy = {
             
             # Variations and misspellings
             'motorcyle accident', 'motercycle accident', 'motor cycle accident'
-        ],
+        ),
         
-        'truck_accidents': [
+        'truck_accidents': (
             # Core terms
             'truck accident', 'truck crash', 'truck wreck', 'truck collision', 'trucking accident',
             '18-wheeler', '18 wheeler', 'eighteen wheeler', 'semi truck', 'semi-truck', 'semi accident',
@@ -127,9 +145,9 @@ personal_injury_taxonomy = {
             
             # Variations and misspellings
             'truck accidnet', 'semi accidnet', '18-wheler', 'tracktor trailer'
-        ],
+        ),
         
-        'rideshare_accidents': [
+        'rideshare_accidents': (
             # Core brand terms
             'uber', 'uber accident', 'uber crash', 'uber wreck', 'uber collision',
             'lyft', 'lyft accident', 'lyft crash', 'lyft wreck', 'lyft collision',
@@ -170,9 +188,9 @@ personal_injury_taxonomy = {
             # Variations and common phrases
             'ridesharing accident', 'ride-sharing accident', 'ride-share accident',
             'accident with uber', 'accident with lyft', 'rideshare crash victim'
-        ],
+        ),
         
-        'delivery_driver_accidents': [
+        'delivery_driver_accidents': (
             # Core terms
             'delivery driver accident', 'delivery accident', 'delivery truck accident', 'delivery van accident',
             'delivery vehicle accident', 'commercial delivery accident',
@@ -217,9 +235,9 @@ personal_injury_taxonomy = {
             # Other delivery services
             'grocery delivery accident', 'package delivery accident', 'courier accident',
             'messenger accident', 'same day delivery accident'
-        ],
+        ),
         
-        'pedestrian_hit': [
+        'pedestrian_hit': (
             # Core terms
             'pedestrian accident', 'pedestrian hit', 'pedestrian struck', 'pedestrian collision',
             'hit by car while walking', 'struck by vehicle', 'vehicle hit pedestrian', 'car hit pedestrian',
@@ -264,9 +282,9 @@ personal_injury_taxonomy = {
             # Common phrases
             'pedestrian had right of way', 'pedestrian crossing legally', 'pedestrian in crosswalk',
             'pedestrian accident fault', 'who is at fault pedestrian accident'
-        ],
+        ),
         
-        'bicycle_accidents': [
+        'bicycle_accidents': (
             # Core terms
             'bicycle accident', 'cycling accident', 'cyclist accident', 'bicycle crash',
             'bicycle collision', 'bicycle wreck',
@@ -324,9 +342,9 @@ personal_injury_taxonomy = {
             # Common phrases
             'bicycle accident fault', 'who is at fault bicycle accident', 'bicycle traffic laws',
             'bicycle accident statistics'
-        ],
+        ),
         
-        'electric_scooter_accidents': [
+        'electric_scooter_accidents': (
             # Core terms
             'electric scooter accident', 'e-scooter accident', 'e scooter accident', 'scooter accident',
             'electric scooter crash', 'e-scooter crash', 'e scooter crash', 'scooter crash',
@@ -382,9 +400,9 @@ personal_injury_taxonomy = {
             # Severity indicators
             'serious scooter accident', 'severe electric scooter accident', 'fatal scooter accident',
             'catastrophic scooter injury'
-        ],
+        ),
         
-        'atv_offroad_accidents': [
+        'atv_offroad_accidents': (
             # Core terms
             'atv accident', 'atv crash', 'atv wreck', 'atv collision', 'atv incident',
             'quad accident', 'quad crash', 'quad wreck', 'quad bike accident',
@@ -432,9 +450,9 @@ personal_injury_taxonomy = {
             # Related activities
             'hunting atv accident', 'farming atv accident', 'recreational atv accident',
             'racing atv accident', 'mudding accident', 'atv racing crash'
-        ],
+        ),
         
-        'parking_lot_accidents': [
+        'parking_lot_accidents': (
             # Core terms
             'parking lot accident', 'parking lot crash', 'parking lot collision', 'parking lot wreck',
             'parking lot incident', 'car crash in parking lot', 'accident in parking lot',
@@ -487,9 +505,9 @@ personal_injury_taxonomy = {
             # Common phrases
             'parking lot accident no damage', 'parking lot accident minor', 'parking lot accident insurance',
             'parking lot private property accident'
-        ],
+        ),
         
-        'boating_accidents': [
+        'boating_accidents': (
             # Core terms
             'boating accident', 'boat accident', 'boat crash', 'boat collision', 'boat wreck',
             'maritime accident', 'watercraft accident', 'vessel accident', 'marine accident',
@@ -549,9 +567,9 @@ personal_injury_taxonomy = {
             # Coast Guard and regulations
             'coast guard boating accident', 'boating safety violation', 'maritime regulation violation',
             'boating accident report', 'vessel accident investigation'
-        ],
+        ),
         
-        'aviation_accidents': [
+        'aviation_accidents': (
             # Core terms
             'aviation accident', 'aircraft accident', 'plane accident', 'airplane accident', 'plane crash',
             'aircraft crash', 'airplane crash', 'aviation crash', 'aviation incident', 'aircraft incident',
@@ -619,9 +637,9 @@ personal_injury_taxonomy = {
             # Investigation and regulatory
             'NTSB aviation accident', 'FAA aviation accident', 'aircraft accident investigation',
             'aviation safety violation', 'aircraft certification failure'
-        ],
+        ),
         
-        'railroad_accidents': [
+        'railroad_accidents': (
             # Core terms - REMOVED standalone "train"
             'railroad accident', 'railway accident', 'rail accident', 'locomotive accident',
             'railcar accident', 'freight train accident', 'passenger train accident', 'train collision',
@@ -633,7 +651,7 @@ personal_injury_taxonomy = {
             'struck by train', 'hit by train', 'train vs person accident',
             
             # Train types
-            'freight train accident', 'cargo train accident', 'passenger train accident',
+            'cargo train accident',
             'commuter train accident', 'amtrak accident',
             
             # Collision types
@@ -682,9 +700,9 @@ personal_injury_taxonomy = {
             # Investigation and regulatory
             'FRA railroad accident', 'railroad accident investigation', 'train safety investigation',
             'railroad safety violation', 'train accident report'
-        ],
+        ),
         
-        'public_transportation': [
+        'public_transportation': (
             # Core terms
             'bus accident', 'bus crash', 'bus wreck', 'bus collision', 'bus incident',
             'transit accident', 'public transit accident', 'public transit injury', 'transit injury',
@@ -749,9 +767,9 @@ personal_injury_taxonomy = {
             # Common phrases
             'bus accident fault', 'public transit safety', 'transit accident investigation',
             'bus passenger rights', 'public transportation injury'
-        ],
+        ),
         
-        'drunk_driving': [
+        'drunk_driving': (
             # Core terms
             'drunk driving accident', 'drunk driver accident', 'dui accident', 'dwi accident',
             'intoxicated driver accident', 'impaired driver accident', 'drunk driving crash',
@@ -787,12 +805,12 @@ personal_injury_taxonomy = {
             # Common phrases
             'drunk driving accident statistics', 'drunk driving accident prevention',
             'drunk driving accident lawsuit', 'drunk driving accident insurance claim'
-        ],
+        ),
     },
 
     # 2. Premises Liability
     'premises_liability': {
-        'premise_liability': [
+        'premise_liability': (
             # Core terms - REMOVED specific property types that have their own categories
             'premise liability', 'premises liability', 'property liability', 'dangerous property',
             'hazardous property', 'unsafe premises', 'unsafe conditions', 'dangerous conditions',
@@ -813,9 +831,9 @@ personal_injury_taxonomy = {
             # Legal context
             'premise liability lawyer', 'property accident attorney', 'premise liability claim',
             'property owner liability', 'landowner liability', 'premise liability settlement'
-        ],
+        ),
         
-        'slip_trip_fall': [
+        'slip_trip_fall': (
             # Core terms - REMOVED standalone "slip" and "fall" 
             'slip and fall', 'slip and fall accident', 'slip and fall injury', 'trip and fall',
             'trip and fall accident', 'fall injury', 'fall accident', 'falling accident',
@@ -850,9 +868,9 @@ personal_injury_taxonomy = {
             # Severity
             'serious slip and fall', 'severe fall injury', 'slip and fall head injury',
             'slip and fall broken bone', 'slip and fall back injury', 'slip and fall hip fracture'
-        ],
+        ),
         
-        'store_retail_accidents': [
+        'store_retail_accidents': (
             # Store and retail - MOVED from premises liability to avoid duplication
             'store accident', 'retail store accident', 'shopping injury', 'merchandise falling',
             'store negligence', 'retail negligence', 'grocery store accident', 'supermarket accident',
@@ -866,9 +884,9 @@ personal_injury_taxonomy = {
             # Legal context
             'store accident lawyer', 'retail negligence attorney', 'store injury claim',
             'retail accident settlement', 'store liability lawsuit', 'merchant liability'
-        ],
+        ),
         
-        'restaurant_bar_accidents': [
+        'restaurant_bar_accidents': (
             # Restaurant and bar liability - MOVED from premises liability
             'restaurant liability', 'restaurant negligence', 'bar negligence', 'tavern liability',
             'dram shop', 'dram shop liability', 'over serving alcohol', 'bar fight injury',
@@ -882,9 +900,9 @@ personal_injury_taxonomy = {
             # Legal context
             'restaurant accident lawyer', 'bar negligence attorney', 'dram shop lawyer',
             'restaurant liability claim', 'bar accident settlement'
-        ],
+        ),
         
-        'amusement_park_injuries': [
+        'amusement_park_injuries': (
             # Core terms
             'amusement park accident', 'amusement park injury', 'theme park accident', 'theme park injury',
             'carnival accident', 'carnival injury', 'fair accident', 'fair injury',
@@ -914,9 +932,9 @@ personal_injury_taxonomy = {
             'amusement park accident lawyer', 'theme park injury attorney', 'ride accident lawyer',
             'amusement park negligence', 'theme park liability', 'ride manufacturer liability',
             'amusement park injury claim', 'theme park accident settlement'
-        ],
+        ),
         
-        'dog_bites': [
+        'dog_bites': (
             # Core terms
             'dog bite', 'dog attack', 'dog bite injury', 'dog attack injury', 'bitten by dog',
             'dog mauling', 'canine attack', 'animal attack', 'pet attack', 'vicious dog attack',
@@ -949,9 +967,9 @@ personal_injury_taxonomy = {
             # Related scenarios
             'dog bite while working', 'dog bite on job', 'unleashed dog attack', 'off leash dog bite',
             'dog bite provocation', 'unprovoked dog attack', 'dog bite history', 'repeat dog bite'
-        ],
+        ),
         
-        'elevator_escalator_injury': [
+        'elevator_escalator_injury': (
             # Elevator accidents
             'elevator accident', 'elevator injury', 'elevator malfunction', 'elevator failure',
             'stuck in elevator', 'elevator drop', 'elevator fall', 'elevator plunge',
@@ -973,9 +991,9 @@ personal_injury_taxonomy = {
             'elevator accident lawyer', 'escalator injury attorney', 'elevator malfunction lawsuit',
             'elevator company negligence', 'escalator manufacturer liability', 'building owner liability',
             'elevator maintenance negligence', 'escalator accident claim', 'elevator injury settlement'
-        ],
+        ),
         
-        'drowning_accidents': [
+        'drowning_accidents': (
             # Core terms
             'drowning accident', 'near drowning', 'swimming pool accident', 'pool accident',
             'pool drowning', 'swimming accident', 'water accident', 'aquatic accident',
@@ -1002,9 +1020,9 @@ personal_injury_taxonomy = {
             'drowning accident lawyer', 'pool accident attorney', 'swimming pool liability',
             'pool owner liability', 'drowning wrongful death', 'pool accident settlement',
             'swimming pool insurance claim', 'pool negligence lawsuit'
-        ],
+        ),
         
-        'food_poisoning': [
+        'food_poisoning': (
             # Core terms
             'food poisoning', 'foodborne illness', 'food contamination', 'contaminated food',
             'food safety violation', 'restaurant food poisoning', 'catering food poisoning',
@@ -1018,7 +1036,7 @@ personal_injury_taxonomy = {
             'produce contamination', 'lettuce contamination', 'spinach contamination',
             
             # Locations
-            'restaurant food poisoning', 'fast food poisoning', 'catering food poisoning',
+            'fast food poisoning',
             'wedding food poisoning', 'school food poisoning', 'nursing home food poisoning',
             'hospital food poisoning', 'cruise ship food poisoning',
             
@@ -1026,9 +1044,9 @@ personal_injury_taxonomy = {
             'food poisoning lawyer', 'foodborne illness attorney', 'food contamination lawsuit',
             'restaurant negligence food poisoning', 'food poisoning settlement', 'food safety lawsuit',
             'food poisoning compensation', 'foodborne illness claim'
-        ],
+        ),
         
-        'hotel_injuries': [
+        'hotel_injuries': (
             # Core terms
             'hotel accident', 'hotel injury', 'motel accident', 'motel injury', 'inn accident',
             'resort accident', 'resort injury', 'bed and breakfast accident',
@@ -1050,9 +1068,9 @@ personal_injury_taxonomy = {
             'hotel negligence', 'hotel liability', 'innkeeper liability', 'hotel accident lawyer',
             'hotel injury attorney', 'hotel accident claim', 'hotel negligence lawsuit',
             'hotel accident settlement', 'resort accident attorney'
-        ],
+        ),
         
-        'negligent_security': [
+        'negligent_security': (
             # Core terms
             'negligent security', 'inadequate security', 'lack of security', 'poor security',
             'insufficient security', 'security negligence', 'property security failure',
@@ -1076,9 +1094,9 @@ personal_injury_taxonomy = {
             'negligent security lawyer', 'inadequate security attorney', 'property crime lawsuit',
             'security negligence claim', 'inadequate security settlement', 'property owner liability crime',
             'landlord security negligence', 'business security negligence'
-        ],
+        ),
         
-        'snow_ice_accidents': [
+        'snow_ice_accidents': (
             # Core terms
             'snow slip and fall', 'ice slip and fall', 'winter slip and fall', 'icy slip and fall',
             'slippery conditions fall', 'winter weather accident', 'snow and ice injury',
@@ -1099,9 +1117,9 @@ personal_injury_taxonomy = {
             # Legal context
             'snow removal negligence', 'ice accident lawyer', 'winter slip and fall attorney',
             'snow and ice liability', 'property owner snow liability', 'commercial snow removal negligence'
-        ],
+        ),
         
-        'structural_failures': [
+        'structural_failures': (
             # Building collapses
             'building collapse', 'structure collapse', 'wall collapse', 'roof collapse',
             'ceiling collapse', 'floor collapse', 'partial building collapse', 'total building collapse',
@@ -1125,12 +1143,12 @@ personal_injury_taxonomy = {
             'structural failure lawyer', 'building collapse attorney', 'construction defect lawyer',
             'architect negligence', 'engineer negligence', 'contractor negligence',
             'building owner liability', 'structural failure lawsuit'
-        ],
+        ),
     },
 
     # 3. Child Injuries
     'child_injuries': {
-        'general_child_injuries': [
+        'general_child_injuries': (
             # Core terms
             'child injury', 'child accident', 'injured child', 'hurt child', 'pediatric injury',
             'child injury victim', 'injured minor', 'minor injured', 'child trauma',
@@ -1145,9 +1163,9 @@ personal_injury_taxonomy = {
             'child injury lawyer', 'pediatric injury attorney', 'minor injury claim',
             'child accident settlement', 'child injury compensation', 'minor injury lawsuit',
             'guardian ad litem', 'child injury court approval'
-        ],
+        ),
         
-        'school_playground_injuries': [
+        'school_playground_injuries': (
             # School accidents
             'school injury', 'school accident', 'injured at school', 'hurt at school',
             'school negligence', 'school liability', 'public school accident', 'private school accident',
@@ -1172,9 +1190,9 @@ personal_injury_taxonomy = {
             'school accident lawyer', 'school injury attorney', 'school negligence lawsuit',
             'playground accident lawyer', 'school district liability', 'educational negligence',
             'school accident claim', 'playground injury settlement'
-        ],
+        ),
         
-        'childcare_facility_injuries': [
+        'childcare_facility_injuries': (
             # Daycare accidents
             'daycare injury', 'daycare accident', 'injured at daycare', 'hurt at daycare',
             'daycare negligence', 'daycare liability', 'daycare supervision negligence',
@@ -1193,9 +1211,9 @@ personal_injury_taxonomy = {
             # Legal context
             'daycare accident lawyer', 'childcare negligence attorney', 'daycare abuse lawyer',
             'childcare facility liability', 'daycare licensing violation', 'daycare insurance claim'
-        ],
+        ),
         
-        'child_abuse_and_neglect': [
+        'child_abuse_and_neglect': (
             # Physical abuse
             'child abuse', 'child physical abuse', 'child beating', 'child assault',
             'child battery', 'child violence', 'abused child', 'battered child',
@@ -1215,9 +1233,9 @@ personal_injury_taxonomy = {
             # Legal context
             'child abuse lawyer', 'child abuse attorney', 'child protection lawsuit',
             'child abuse compensation', 'mandatory reporter negligence', 'CPS negligence'
-        ],
+        ),
         
-        'hazing_injuries': [
+        'hazing_injuries': (
             # Core terms
             'hazing injury', 'hazing accident', 'hazing incident', 'hazing assault',
             'hazing abuse', 'ritual hazing', 'initiation injury', 'initiation accident',
@@ -1238,9 +1256,9 @@ personal_injury_taxonomy = {
             # Legal context
             'hazing lawsuit', 'hazing liability', 'anti-hazing law violation',
             'fraternity negligence', 'university hazing liability', 'hazing injury lawyer'
-        ],
+        ),
         
-        'child_sports_injuries': [
+        'child_sports_injuries': (
             # Core terms - REMOVED generic "sports injury" to avoid overlap with adult category
             'child sports injury', 'youth sports injury', 'minor sports injury', 
             'juvenile sports accident', 'student athlete injury', 'kids sports accident',
@@ -1261,12 +1279,12 @@ personal_injury_taxonomy = {
             # Legal context
             'youth sports injury lawyer', 'child sports accident attorney',
             'sports negligence child', 'athletic liability child', 'sports injury settlement child'
-        ],
+        ),
     },
 
     # 4. Product & Medical Device Liability
     'product_medical_device_liability': {
-        'defective_products': [
+        'defective_products': (
             # Core terms - REMOVED standalone "accident"
             'product liability', 'defective product', 'dangerous product', 'product defect',
             'faulty product', 'unsafe product', 'product failure', 'product malfunction',
@@ -1281,9 +1299,9 @@ personal_injury_taxonomy = {
             'product liability lawyer', 'defective product attorney', 'product recall lawsuit',
             'manufacturer liability', 'product liability claim', 'defective product settlement',
             'strict liability product', 'negligent design', 'failure to warn'
-        ],
+        ),
         
-        'no_warning_labels': [
+        'no_warning_labels': (
             # Warning label issues
             'missing warning label', 'inadequate warning label', 'unclear warning label',
             'insufficient warning', 'failure to warn', 'inadequate instructions',
@@ -1296,9 +1314,9 @@ personal_injury_taxonomy = {
             # Legal context
             'failure to warn lawsuit', 'inadequate warning claim', 'labeling negligence',
             'warning label attorney', 'product instruction negligence'
-        ],
+        ),
         
-        'harmful_medications': [
+        'harmful_medications': (
             # Core terms - REMOVED standalone "drug"
             'defective drug', 'dangerous drug', 'harmful medication', 'pharmaceutical liability',
             'prescription drug injury', 'medication injury', 'medication side effects', 
@@ -1313,9 +1331,9 @@ personal_injury_taxonomy = {
             'pharmaceutical lawsuit', 'prescription drug injury lawyer', 'medication injury attorney',
             'prescription drug lawyer', 'pharmaceutical negligence', 'drug company liability',
             'medication error lawsuit', 'pharmacy negligence'
-        ],
+        ),
         
-        'faulty_medical_devices': [
+        'faulty_medical_devices': (
             # Core terms
             'defective medical device', 'faulty medical device', 'medical device failure',
             'medical device malfunction', 'medical device recall', 'dangerous medical device',
@@ -1330,9 +1348,9 @@ personal_injury_taxonomy = {
             'medical device lawsuit', 'medical device attorney', 'implant failure lawyer',
             'medical device manufacturer liability', 'FDA medical device recall',
             'medical device injury claim', 'implant defect settlement'
-        ],
+        ),
         
-        'auto_defects': [
+        'auto_defects': (
             # Core terms
             'defective vehicle', 'car defect', 'auto defect', 'vehicle malfunction',
             'auto recall', 'car recall', 'vehicle recall', 'automotive defect',
@@ -1347,9 +1365,9 @@ personal_injury_taxonomy = {
             'auto defect lawyer', 'vehicle defect attorney', 'car manufacturer liability',
             'automotive lawsuit', 'lemon law', 'auto defect settlement',
             'vehicle recall lawsuit', 'car defect claim'
-        ],
+        ),
         
-        'tire_defects': [
+        'tire_defects': (
             # Core terms
             'tire blowout', 'defective tire', 'tire failure', 'tire defect',
             'tire separation', 'tire recall', 'faulty tire', 'tire tread separation',
@@ -1362,9 +1380,9 @@ personal_injury_taxonomy = {
             # Legal context
             'tire defect lawyer', 'tire blowout attorney', 'tire manufacturer liability',
             'tire defect lawsuit', 'tire recall claim', 'tire failure settlement'
-        ],
+        ),
         
-        'appliance_defects': [
+        'appliance_defects': (
             # Core terms
             'defective appliance', 'appliance malfunction', 'home appliance injury',
             'appliance defect', 'appliance recall', 'faulty appliance',
@@ -1377,12 +1395,12 @@ personal_injury_taxonomy = {
             # Legal context
             'appliance defect lawyer', 'home appliance attorney', 'appliance manufacturer liability',
             'appliance recall lawsuit', 'appliance defect claim'
-        ],
+        ),
     },
 
     # 5. Medical & Healthcare Malpractice
     'medical_healthcare_malpractice': {
-        'medical_malpractice': [
+        'medical_malpractice': (
             # Core terms
             'medical malpractice', 'medical negligence', 'doctor negligence', 'physician negligence',
             'hospital negligence', 'healthcare malpractice', 'healthcare negligence',
@@ -1396,9 +1414,9 @@ personal_injury_taxonomy = {
             'medical malpractice lawyer', 'medical negligence attorney', 'malpractice lawsuit',
             'medical malpractice claim', 'doctor malpractice suit', 'hospital malpractice suit',
             'medical expert witness', 'standard of care violation'
-        ],
+        ),
         
-        'misdiagnosis': [
+        'misdiagnosis': (
             # Core terms
             'misdiagnosis', 'missed diagnosis', 'delayed diagnosis', 'wrong diagnosis',
             'failure to diagnose', 'diagnostic error', 'diagnostic negligence',
@@ -1412,9 +1430,9 @@ personal_injury_taxonomy = {
             # Legal context
             'misdiagnosis lawyer', 'diagnostic error attorney', 'failure to diagnose lawsuit',
             'delayed diagnosis claim', 'misdiagnosis malpractice suit'
-        ],
+        ),
         
-        'surgery_mistakes': [
+        'surgery_mistakes': (
             # Core terms
             'surgical error', 'surgical negligence', 'botched surgery', 'surgery mistake',
             'surgical malpractice', 'operating room error', 'surgeon negligence',
@@ -1433,9 +1451,9 @@ personal_injury_taxonomy = {
             # Legal context
             'surgical malpractice lawyer', 'surgery error attorney', 'botched surgery lawsuit',
             'surgical negligence claim', 'operating room malpractice'
-        ],
+        ),
         
-        'medication_errors': [
+        'medication_errors': (
             # Core terms
             'medication error', 'prescription error', 'pharmacy error',
             'wrong medication', 'wrong prescription', 'incorrect medication',
@@ -1449,9 +1467,9 @@ personal_injury_taxonomy = {
             # Legal context
             'medication error lawyer', 'pharmacy malpractice attorney', 'prescription error lawsuit',
             'pharmacist negligence', 'hospital medication negligence', 'nurse medication error'
-        ],
+        ),
         
-        'birth_injuries': [
+        'birth_injuries': (
             # Core terms
             'birth injury', 'birth trauma', 'childbirth injury', 'delivery injury',
             'obstetric injury', 'labor and delivery injury', 'newborn injury',
@@ -1467,9 +1485,9 @@ personal_injury_taxonomy = {
             'birth injury lawyer', 'birth trauma attorney', 'obstetric malpractice lawyer',
             'delivery malpractice', 'childbirth negligence', 'labor and delivery malpractice',
             'birth injury lawsuit', 'cerebral palsy lawyer'
-        ],
+        ),
         
-        'nursing_home_neglect': [
+        'nursing_home_neglect': (
             # Core terms
             'nursing home abuse', 'nursing home neglect', 'elder care negligence',
             'long term care abuse', 'assisted living abuse', 'skilled nursing facility abuse',
@@ -1488,9 +1506,9 @@ personal_injury_taxonomy = {
             # Legal context
             'nursing home abuse lawyer', 'elder abuse attorney', 'nursing home negligence lawyer',
             'long term care lawsuit', 'nursing home wrongful death'
-        ],
+        ),
         
-        'dental_mistakes': [
+        'dental_mistakes': (
             # Core terms
             'dental malpractice', 'dental negligence', 'dentist negligence', 'dental error',
             'botched dental work', 'dental mistake', 'oral surgery error',
@@ -1503,9 +1521,9 @@ personal_injury_taxonomy = {
             # Legal context
             'dental malpractice lawyer', 'dentist negligence attorney', 'dental error lawsuit',
             'oral surgery malpractice', 'orthodontic malpractice'
-        ],
+        ),
         
-        'vaccine_injuries': [
+        'vaccine_injuries': (
             # Core terms
             'vaccine injury', 'vaccination injury', 'vaccine adverse event', 'vaccine reaction',
             'vaccine side effect', 'immunization injury', 'vaccine complication',
@@ -1518,9 +1536,9 @@ personal_injury_taxonomy = {
             # Legal context
             'vaccine injury lawyer', 'vaccination injury attorney', 'vaccine court',
             'VICP claim', 'vaccine compensation program', 'vaccine injury petition'
-        ],
+        ),
         
-        'hospital_infections': [
+        'hospital_infections': (
             # Core terms
             'hospital acquired infection', 'nosocomial infection', 'healthcare associated infection',
             'hospital infection', 'post-operative infection', 'surgical site infection',
@@ -1533,9 +1551,9 @@ personal_injury_taxonomy = {
             # Legal context
             'hospital infection lawyer', 'nosocomial infection attorney', 'hospital acquired infection lawsuit',
             'infection control negligence', 'hospital hygiene negligence'
-        ],
+        ),
         
-        'emergency_room_errors': [
+        'emergency_room_errors': (
             # Core terms
             'emergency room malpractice', 'ER malpractice', 'emergency room negligence',
             'ER negligence', 'emergency department error', 'urgent care negligence',
@@ -1548,9 +1566,9 @@ personal_injury_taxonomy = {
             # Legal context
             'emergency room lawyer', 'ER malpractice attorney', 'emergency medicine negligence',
             'emergency department lawsuit', 'urgent care malpractice'
-        ],
+        ),
         
-        'anesthesia_errors': [
+        'anesthesia_errors': (
             # Core terms
             'anesthesia malpractice', 'anesthesia error', 'anesthesia negligence',
             'anesthesiologist negligence', 'anesthesia complications', 'anesthesia mistake',
@@ -1563,9 +1581,9 @@ personal_injury_taxonomy = {
             # Legal context
             'anesthesia malpractice lawyer', 'anesthesia error attorney', 'anesthesiologist malpractice',
             'anesthesia negligence lawsuit', 'anesthesia complication claim'
-        ],
+        ),
         
-        'psychiatric_malpractice': [
+        'psychiatric_malpractice': (
             # Core terms
             'psychiatric malpractice', 'mental health negligence', 'psychiatrist negligence',
             'psychologist malpractice', 'therapy malpractice', 'counselor negligence',
@@ -1578,9 +1596,9 @@ personal_injury_taxonomy = {
             # Legal context
             'psychiatric malpractice lawyer', 'mental health negligence attorney',
             'therapist malpractice lawsuit', 'psychiatric negligence claim'
-        ],
+        ),
         
-        'telehealth_negligence': [
+        'telehealth_negligence': (
             # Core terms
             'telehealth negligence', 'telemedicine malpractice', 'virtual doctor mistake',
             'online diagnosis error', 'remote care malpractice', 'telehealth error',
@@ -1592,9 +1610,9 @@ personal_injury_taxonomy = {
             # Legal context
             'telehealth malpractice lawyer', 'telemedicine negligence attorney',
             'virtual care lawsuit', 'remote medicine malpractice'
-        ],
+        ),
         
-        'elder_abuse': [
+        'elder_abuse': (
             # Core terms
             'elder abuse', 'senior abuse', 'elderly abuse', 'elder neglect',
             'elderly neglect', 'senior neglect', 'elder mistreatment', 'geriatric abuse',
@@ -1611,12 +1629,12 @@ personal_injury_taxonomy = {
             # Legal context
             'elder abuse lawyer', 'senior abuse attorney', 'elder neglect lawsuit',
             'financial exploitation attorney', 'elder rights violation'
-        ],
+        ),
     },
 
     # 6. Workplace Injuries
     'workplace_injuries': {
-        'workers_compensation': [
+        'workers_compensation': (
             # Core terms
             'workers compensation', 'workers comp', 'work comp', 'workplace compensation',
             'workplace injury', 'work injury', 'injured on the job', 'occupational injury',
@@ -1637,9 +1655,9 @@ personal_injury_taxonomy = {
             'workers compensation lawyer', 'work comp attorney', 'workplace injury lawyer',
             'workers comp denial', 'work comp dispute', 'workers compensation appeal',
             'third party work injury', 'work injury lawsuit'
-        ],
+        ),
         
-        'construction_site_injury': [
+        'construction_site_injury': (
             # Core terms - REMOVED generic workplace terms to avoid overlap
             'construction accident', 'construction site injury', 'construction site accident', 
             'building site injury', 'construction zone accident', 'job site injury',
@@ -1659,9 +1677,9 @@ personal_injury_taxonomy = {
             'construction accident lawyer', 'construction injury attorney', 'construction site negligence',
             'contractor negligence', 'construction safety violation', 'OSHA violation construction',
             'construction third party claim', 'construction site lawsuit'
-        ],
+        ),
         
-        'industrial_accidents': [
+        'industrial_accidents': (
             # Core terms
             'industrial accident', 'industrial injury', 'factory accident', 'plant accident',
             'manufacturing accident', 'warehouse accident', 'mill accident',
@@ -1678,9 +1696,9 @@ personal_injury_taxonomy = {
             # Legal context
             'industrial accident lawyer', 'factory accident attorney', 'industrial negligence',
             'manufacturing injury lawyer', 'industrial safety violation', 'workplace safety negligence'
-        ],
+        ),
         
-        'toxic_exposure': [
+        'toxic_exposure': (
             # Core terms
             'toxic exposure work', 'occupational exposure', 'workplace chemical exposure',
             'toxic substance exposure', 'hazardous material exposure', 'chemical exposure work',
@@ -1697,9 +1715,9 @@ personal_injury_taxonomy = {
             # Legal context
             'toxic exposure lawyer', 'occupational disease attorney', 'workplace exposure lawsuit',
             'industrial disease claim', 'occupational illness lawyer'
-        ],
+        ),
         
-        'office_injuries': [
+        'office_injuries': (
             # Core terms
             'office injury', 'office accident', 'workplace slip and fall', 'office slip and fall',
             'cubicle injury', 'desk injury', 'office chair accident',
@@ -1716,12 +1734,12 @@ personal_injury_taxonomy = {
             # Legal context
             'office injury lawyer', 'repetitive strain attorney', 'ergonomic injury lawyer',
             'office workers comp', 'carpal tunnel workers comp', 'office negligence lawsuit'
-        ],
+        ),
     },
 
     # 7. Catastrophic & Severe Injuries
     'catastrophic_severe_injuries': {
-        'brain_injury': [
+        'brain_injury': (
             # Core terms
             'brain injury', 'traumatic brain injury', 'TBI', 'head injury', 'head trauma',
             'brain trauma', 'closed head injury', 'open head injury', 'skull fracture',
@@ -1742,9 +1760,9 @@ personal_injury_taxonomy = {
             # Legal context
             'brain injury lawyer', 'TBI attorney', 'traumatic brain injury lawyer',
             'head injury lawsuit', 'brain injury compensation', 'TBI settlement'
-        ],
+        ),
         
-        'spinal_injury': [
+        'spinal_injury': (
             # Core terms
             'spinal injury', 'spinal cord injury', 'spine injury', 'back injury',
             'neck injury', 'cervical spine injury', 'lumbar spine injury', 'thoracic spine injury',
@@ -1761,9 +1779,9 @@ personal_injury_taxonomy = {
             # Legal context
             'spinal injury lawyer', 'paralysis attorney', 'spinal cord injury lawyer',
             'back injury lawsuit', 'spinal injury compensation', 'paralysis settlement'
-        ],
+        ),
         
-        'burn_injuries': [
+        'burn_injuries': (
             # Core terms - REMOVED standalone "fire injury"
             'burn injury', 'severe burns', 'thermal injury',
             'scald injury', 'electrical burn', 'chemical burn', 'radiation burn',
@@ -1785,9 +1803,9 @@ personal_injury_taxonomy = {
             # Legal context
             'burn injury lawyer', 'fire accident attorney', 'burn injury lawsuit',
             'burn injury compensation', 'fire injury settlement', 'burn negligence case'
-        ],
+        ),
         
-        'amputation': [
+        'amputation': (
             # Core terms
             'amputation', 'loss of limb', 'limb loss', 'dismemberment', 'severed limb',
             'traumatic amputation', 'surgical amputation', 'partial amputation',
@@ -1805,9 +1823,9 @@ personal_injury_taxonomy = {
             # Legal context
             'amputation lawyer', 'limb loss attorney', 'amputation lawsuit',
             'amputation compensation', 'limb loss settlement', 'dismemberment claim'
-        ],
+        ),
         
-        'internal_organ_injury': [
+        'internal_organ_injury': (
             # Core terms
             'internal organ injury', 'internal injury', 'organ damage', 'internal trauma',
             'abdominal injury', 'chest injury', 'internal bleeding', 'organ laceration',
@@ -1825,9 +1843,9 @@ personal_injury_taxonomy = {
             # Legal context
             'internal injury lawyer', 'organ damage attorney', 'internal trauma lawsuit',
             'internal injury compensation', 'organ injury settlement'
-        ],
+        ),
         
-        'wrongful_death': [
+        'wrongful_death': (
             # Core terms - REMOVED standalone "accident"
             'wrongful death', 'fatal accident', 'death claim', 'accidental death',
             'wrongful death lawsuit', 'survivor benefits', 'death benefits',
@@ -1846,12 +1864,12 @@ personal_injury_taxonomy = {
             'wrongful death lawyer', 'wrongful death attorney', 'fatal accident lawyer',
             'wrongful death settlement', 'wrongful death compensation', 'survival action',
             'estate claim', 'loss of income death', 'loss of support death'
-        ],
+        ),
     },
 
     # 8. Mass Tort & Class Action Lawsuits
     'mass_tort_class_action_lawsuits': {
-        'mass_tort': [
+        'mass_tort': (
             # Core terms
             'mass tort', 'class action', 'class action lawsuit', 'multi-district litigation',
             'MDL', 'mass litigation', 'aggregate litigation', 'consolidated lawsuit',
@@ -1861,9 +1879,9 @@ personal_injury_taxonomy = {
             'mass tort lawyer', 'class action attorney', 'MDL attorney',
             'mass tort litigation', 'class action claim', 'opt out class action',
             'class certification', 'mass tort compensation'
-        ],
+        ),
         
-        'mesothelioma': [
+        'mesothelioma': (
             # Core terms
             'mesothelioma', 'asbestos cancer', 'asbestos disease', 'pleural mesothelioma',
             'peritoneal mesothelioma', 'pericardial mesothelioma', 'testicular mesothelioma',
@@ -1878,9 +1896,9 @@ personal_injury_taxonomy = {
             'mesothelioma lawyer', 'asbestos attorney', 'mesothelioma lawsuit',
             'asbestos trust fund', 'mesothelioma settlement', 'asbestos compensation',
             'mesothelioma claim', 'asbestos litigation'
-        ],
+        ),
         
-        'lead_poisoning': [
+        'lead_poisoning': (
             # Core terms
             'lead poisoning', 'lead exposure', 'childhood lead poisoning', 'lead contamination',
             'elevated blood lead', 'lead toxicity', 'lead intoxication',
@@ -1897,9 +1915,9 @@ personal_injury_taxonomy = {
             # Legal context
             'lead poisoning lawyer', 'lead paint attorney', 'lead exposure lawsuit',
             'lead paint lawsuit', 'lead poisoning settlement', 'lead exposure compensation'
-        ],
+        ),
         
-        'hernia_mesh': [
+        'hernia_mesh': (
             # Core terms
             'hernia mesh', 'surgical mesh', 'hernia mesh complication', 'defective hernia mesh',
             'hernia mesh failure', 'hernia mesh recall', 'mesh implant',
@@ -1912,9 +1930,9 @@ personal_injury_taxonomy = {
             # Legal context
             'hernia mesh lawyer', 'surgical mesh attorney', 'hernia mesh lawsuit',
             'mesh complication claim', 'hernia mesh settlement', 'defective mesh litigation'
-        ],
+        ),
         
-        'proton_pump': [
+        'proton_pump': (
             # Core terms
             'proton pump inhibitors', 'proton-pump inhibitors', 'PPI', 'PPI lawsuit',
             'acid reflux medication', 'heartburn medication', 'GERD medication',
@@ -1930,9 +1948,9 @@ personal_injury_taxonomy = {
             # Legal context
             'PPI lawyer', 'proton pump inhibitor attorney', 'nexium lawsuit',
             'prilosec lawsuit', 'PPI kidney lawsuit', 'acid reflux drug lawsuit'
-        ],
+        ),
         
-        'firefighting_foam': [
+        'firefighting_foam': (
             # Core terms
             'firefighting foam', 'firefighter foam', 'AFFF', 'aqueous film forming foam',
             'PFAS foam', 'PFOA foam', 'PFOS foam', 'firefighting chemicals',
@@ -1948,9 +1966,9 @@ personal_injury_taxonomy = {
             # Legal context
             'firefighting foam lawyer', 'AFFF attorney', 'PFAS lawsuit',
             'firefighting foam cancer lawsuit', 'AFFF contamination claim'
-        ],
+        ),
         
-        'hair_relaxer': [
+        'hair_relaxer': (
             # Core terms
             'hair relaxer', 'hair relaxant', 'chemical hair straightener', 'relaxer lawsuit',
             'hair straightening products', 'chemical relaxer',
@@ -1963,9 +1981,9 @@ personal_injury_taxonomy = {
             # Legal context
             'hair relaxer lawyer', 'hair straightener attorney', 'relaxer cancer lawsuit',
             'chemical hair relaxer lawsuit', 'hair relaxer settlement'
-        ],
+        ),
         
-        'ozempic': [
+        'ozempic': (
             # Core terms
             'ozempic', 'semaglutide', 'wegovy', 'rybelsus', 'GLP-1', 'GLP-1 agonist',
             'diabetes medication', 'weight loss drug',
@@ -1978,9 +1996,9 @@ personal_injury_taxonomy = {
             # Legal context
             'ozempic lawyer', 'semaglutide attorney', 'GLP-1 lawsuit',
             'ozempic gastroparesis lawsuit', 'wegovy lawsuit', 'diabetes drug lawsuit'
-        ],
+        ),
         
-        'roundup': [
+        'roundup': (
             # Core terms
             'roundup', 'glyphosate', 'roundup weed killer', 'roundup herbicide',
             'glyphosate exposure', 'roundup exposure', 'weed killer cancer',
@@ -1996,9 +2014,9 @@ personal_injury_taxonomy = {
             # Legal context
             'roundup lawyer', 'glyphosate attorney', 'roundup cancer lawsuit',
             'monsanto lawsuit', 'roundup settlement', 'weed killer lawsuit'
-        ],
+        ),
         
-        'camp_lejeune': [
+        'camp_lejeune': (
             # Core terms
             'camp lejeune', 'camp lejeune water contamination', 'marine base contamination',
             'camp lejeune toxic water', 'lejeune contamination', 'camp lejeune chemicals',
@@ -2015,9 +2033,9 @@ personal_injury_taxonomy = {
             # Legal context
             'camp lejeune lawyer', 'camp lejeune attorney', 'camp lejeune lawsuit',
             'camp lejeune justice act', 'camp lejeune claim', 'marine contamination lawsuit'
-        ],
+        ),
         
-        'suboxone': [
+        'suboxone': (
             # Core terms
             'suboxone', 'buprenorphine', 'suboxone film', 'suboxone strips',
             'opioid addiction treatment', 'suboxone medication',
@@ -2030,9 +2048,9 @@ personal_injury_taxonomy = {
             # Legal context
             'suboxone lawyer', 'suboxone attorney', 'suboxone tooth decay lawsuit',
             'suboxone dental lawsuit', 'buprenorphine lawsuit', 'suboxone settlement'
-        ],
+        ),
         
-        'biozorb_implant': [
+        'biozorb_implant': (
             # Core terms
             'biozorb implant', 'biozorb marker', 'breast surgery marker', 'surgical marker implant',
             'biozorb device', 'focal therapeutics biozorb',
@@ -2044,12 +2062,12 @@ personal_injury_taxonomy = {
             # Legal context
             'biozorb lawyer', 'biozorb attorney', 'biozorb lawsuit',
             'biozorb implant lawsuit', 'surgical marker lawsuit', 'biozorb settlement'
-        ],
+        ),
     },
 
     # 9. Intentional Torts & Personal Rights Violations
     'intentional_torts_personal_rights_violations': {
-        'false_imprisonment': [
+        'false_imprisonment': (
             # Core terms
             'false imprisonment', 'unlawful detention', 'wrongful confinement',
             'illegal detention', 'unlawful restraint', 'false arrest', 'wrongful arrest',
@@ -2058,9 +2076,9 @@ personal_injury_taxonomy = {
             # Legal context
             'false imprisonment lawsuit', 'unlawful detention claim', 'false arrest lawsuit',
             'wrongful confinement attorney', 'false imprisonment lawyer'
-        ],
+        ),
         
-        'invasion_of_privacy': [
+        'invasion_of_privacy': (
             # Core terms
             'invasion of privacy', 'privacy violation', 'breach of privacy',
             'unauthorized recording', 'illegal surveillance', 'wiretapping',
@@ -2073,9 +2091,9 @@ personal_injury_taxonomy = {
             # Legal context
             'privacy violation lawsuit', 'invasion of privacy attorney',
             'privacy rights violation', 'privacy lawsuit', 'surveillance lawsuit'
-        ],
+        ),
         
-        'assault_battery': [
+        'assault_battery': (
             # Core terms - REMOVED standalone "battery" 
             'assault', 'assault and battery', 'assault victim', 'battery victim',
             'victim of violence', 'physically assaulted', 'physical attack', 'violent assault',
@@ -2087,9 +2105,9 @@ personal_injury_taxonomy = {
             # Legal context
             'assault lawsuit', 'battery lawsuit', 'assault and battery attorney',
             'assault victim lawyer', 'violence lawsuit', 'assault compensation'
-        ],
+        ),
         
-        'sexual_assault': [
+        'sexual_assault': (
             # Core terms
             'sexual assault', 'sexual abuse', 'sexual battery', 'rape',
             'sexual harassment', 'sexual misconduct', 'sexual violence',
@@ -2103,9 +2121,9 @@ personal_injury_taxonomy = {
             # Legal context
             'sexual assault lawyer', 'sexual abuse attorney', 'sexual harassment lawsuit',
             'sexual assault claim', 'sexual abuse compensation', 'title ix lawsuit'
-        ],
+        ),
         
-        'emotional_distress': [
+        'emotional_distress': (
             # Core terms
             'emotional distress', 'psychological trauma', 'mental anguish', 'emotional trauma',
             'psychological distress', 'mental suffering', 'emotional harm',
@@ -2119,9 +2137,9 @@ personal_injury_taxonomy = {
             'emotional distress lawsuit', 'psychological trauma attorney',
             'mental anguish claim', 'emotional distress compensation',
             'psychological injury lawyer'
-        ],
+        ),
         
-        'police_misconduct': [
+        'police_misconduct': (
             # Core terms
             'police brutality', 'police misconduct', 'excessive force', 'police violence',
             'civil rights violation', 'police abuse', 'unlawful arrest', 'police negligence',
@@ -2135,9 +2153,9 @@ personal_injury_taxonomy = {
             'police brutality lawyer', 'excessive force attorney', 'civil rights lawyer',
             'police misconduct lawsuit', '1983 lawsuit', 'section 1983 claim',
             'civil rights violation attorney'
-        ],
+        ),
         
-        'government_negligence': [
+        'government_negligence': (
             # Core terms
             'government negligence', 'municipal negligence', 'city negligence',
             'county negligence', 'state negligence', 'government liability',
@@ -2151,9 +2169,9 @@ personal_injury_taxonomy = {
             # Legal context
             'government negligence lawyer', 'municipal liability attorney',
             'government lawsuit', 'public entity claim', 'sovereign immunity lawsuit'
-        ],
+        ),
         
-        'cyber_harassment': [
+        'cyber_harassment': (
             # Core terms
             'cyberbullying', 'online harassment', 'cyber stalking', 'internet harassment',
             'digital harassment', 'online abuse', 'cyber abuse', 'electronic harassment',
@@ -2166,12 +2184,12 @@ personal_injury_taxonomy = {
             # Legal context
             'cyberbullying lawyer', 'online harassment attorney', 'cyber stalking lawsuit',
             'revenge porn lawyer', 'digital harassment claim', 'cyberbullying lawsuit'
-        ],
+        ),
     },
 
     # 10. Sports & Recreational Injuries
     'sports_recreational_injuries': {
-        'recreational_facility_injuries': [
+        'recreational_facility_injuries': (
             # Facility injuries - REMOVED generic "sports injury" to avoid overlap with child category
             'gym accident', 'fitness center injury', 'health club injury', 'YMCA injury',
             'recreation center injury', 'sports complex injury', 'athletic facility injury',
@@ -2189,9 +2207,9 @@ personal_injury_taxonomy = {
             # Legal context
             'recreational facility lawyer', 'gym accident attorney', 'fitness center negligence',
             'sports facility negligence', 'recreational injury claim', 'athletic facility lawsuit'
-        ],
+        ),
         
-        'water_sports_injuries': [
+        'water_sports_injuries': (
             # Core terms
             'water sports injury', 'aquatic injury', 'water recreation injury',
             'marine sports injury', 'water activity injury',
@@ -2205,9 +2223,9 @@ personal_injury_taxonomy = {
             # Legal context
             'water sports lawyer', 'jet ski accident attorney', 'diving accident lawyer',
             'water recreation lawsuit', 'aquatic injury claim', 'marine sports negligence'
-        ],
+        ),
         
-        'extreme_sports_injuries': [
+        'extreme_sports_injuries': (
             # Core terms
             'extreme sports injury', 'adventure sports injury', 'extreme recreation injury',
             'adrenaline sports injury', 'action sports injury',
@@ -2225,12 +2243,12 @@ personal_injury_taxonomy = {
             # Legal context
             'extreme sports lawyer', 'adventure sports attorney', 'skydiving accident lawyer',
             'extreme sports negligence', 'assumption of risk sports', 'waiver enforcement sports'
-        ],
+        ),
     },
 
     # 11. Environmental & Toxic Exposure Injuries
     'environmental_toxic_exposure_injuries': {
-        'environmental_exposure': [
+        'environmental_exposure': (
             # Core terms
             'environmental exposure', 'toxic exposure', 'chemical exposure', 'environmental contamination',
             'pollution exposure', 'hazardous waste exposure', 'industrial contamination',
@@ -2244,9 +2262,9 @@ personal_injury_taxonomy = {
             # Legal context
             'environmental exposure lawyer', 'toxic exposure attorney', 'contamination lawsuit',
             'environmental contamination claim', 'pollution exposure lawsuit'
-        ],
+        ),
         
-        'toxic_mold_exposure': [
+        'toxic_mold_exposure': (
             # Core terms
             'toxic mold exposure', 'mold exposure', 'mold illness', 'mold poisoning',
             'black mold exposure', 'black mold injury', 'stachybotrys exposure',
@@ -2260,9 +2278,9 @@ personal_injury_taxonomy = {
             # Legal context
             'mold exposure lawyer', 'toxic mold attorney', 'black mold lawsuit',
             'mold contamination claim', 'landlord mold negligence', 'mold remediation negligence'
-        ],
+        ),
         
-        'carbon_monoxide_poisoning': [
+        'carbon_monoxide_poisoning': (
             # Core terms
             'carbon monoxide poisoning', 'carbon monoxide exposure', 'CO poisoning',
             'carbon monoxide leak', 'carbon monoxide leak injury', 'CO exposure',
@@ -2276,9 +2294,9 @@ personal_injury_taxonomy = {
             # Legal context
             'carbon monoxide lawyer', 'CO poisoning attorney', 'carbon monoxide lawsuit',
             'CO detector failure lawsuit', 'landlord CO negligence', 'hotel CO poisoning lawsuit'
-        ],
+        ),
         
-        'pesticide_exposure': [
+        'pesticide_exposure': (
             # Core terms
             'pesticide exposure', 'pesticide poisoning', 'chemical pesticide injury',
             'insecticide exposure', 'herbicide exposure', 'fungicide exposure',
@@ -2295,12 +2313,12 @@ personal_injury_taxonomy = {
             # Legal context
             'pesticide exposure lawyer', 'agricultural chemical attorney', 'pesticide poisoning lawsuit',
             'farm worker pesticide claim', 'pesticide drift lawsuit'
-        ],
+        ),
     },
 
     # 12. Professional Negligence
     'professional_negligence': {
-        'legal_malpractice': [
+        'legal_malpractice': (
             # Core terms
             'legal malpractice', 'attorney malpractice', 'lawyer malpractice',
             'attorney negligence', 'lawyer negligence', 'legal negligence',
@@ -2314,9 +2332,9 @@ personal_injury_taxonomy = {
             # Legal context
             'legal malpractice lawyer', 'attorney malpractice attorney', 'lawyer negligence lawsuit',
             'legal malpractice claim', 'attorney malpractice suit', 'law firm lawsuit'
-        ],
+        ),
         
-        'accounting_malpractice': [
+        'accounting_malpractice': (
             # Core terms
             'accounting malpractice', 'accountant negligence', 'CPA malpractice',
             'CPA negligence', 'accounting negligence', 'accounting error',
@@ -2330,9 +2348,9 @@ personal_injury_taxonomy = {
             # Legal context
             'accounting malpractice lawyer', 'CPA negligence attorney', 'accountant malpractice lawsuit',
             'tax preparer lawsuit', 'accounting negligence claim'
-        ],
+        ),
         
-        'insurance_bad_faith': [
+        'insurance_bad_faith': (
             # Core terms
             'insurance bad faith', 'insurance company bad faith', 'insurer bad faith',
             'insurance denial', 'wrongful denial insurance', 'insurance claim denial',
@@ -2346,7 +2364,709 @@ personal_injury_taxonomy = {
             # Legal context
             'insurance bad faith lawyer', 'insurance denial attorney', 'bad faith insurance lawsuit',
             'insurance dispute lawyer', 'insurance coverage attorney', 'insurance claim lawyer'
-        ],
+        ),
     },
 
-}
\ No newline at end of file
+}
+
+# Read-only views; the phrase tables below index into this exact order
+personal_injury_taxonomy = MappingProxyType({
+    category: MappingProxyType(subcategories)
+    for category, subcategories in personal_injury_taxonomy.items()
+})
+
+# ============================================
+# Phrase tables and matching
+# ============================================
+
+@dataclass(frozen=True)
+class PIKeywordHit:
+    """A single keyword match; ids index into CATEGORIES/SUBCATEGORIES/PHRASES"""
+
+    __slots__ = ('top', 'sub', 'start', 'end', 'phrase_id')
+
+    top: int
+    sub: int
+    start: int
+    end: int
+    phrase_id: int
+
+
+def _normalize_phrase(keyword: str) -> str:
+    """Lowercase a keyword, collapse its whitespace and intern it"""
+    return sys.intern(' '.join(keyword.lower().split()))
+
+
+@lru_cache(maxsize=1)
+def _get_phrase_table() -> Tuple[Tuple[str, ...], Tuple[Tuple[int, int], ...]]:
+    """
+    Flatten the taxonomy into parallel phrase/owner tables (built on first use)
+
+    Phrases are lowercased with whitespace collapsed, then interned, so
+    lookups keyed by them compare by identity and phrases repeated across
+    subcategories share one object.
+
+    Returns:
+        Tuple of (normalized phrases, (category id, subcategory id) per phrase)
+
+    Raises:
+        ValueError: If a subcategory lists the same phrase twice
+    """
+    phrases = []
+    owners = []
+    for top, (category, subcategories) in enumerate(personal_injury_taxonomy.items()):
+        for sub, (subcategory, keywords) in enumerate(subcategories.items()):
+            seen = set()
+            for keyword in keywords:
+                phrase = _normalize_phrase(keyword)
+                if phrase in seen:
+                    raise ValueError(
+                        f"Duplicate keyword '{phrase}' in {category}.{subcategory}"
+                    )
+                seen.add(phrase)
+                phrases.append(phrase)
+                owners.append((top, sub))
+    return tuple(phrases), tuple(owners)
+
+
+CATEGORIES: Tuple[str, ...] = tuple(personal_injury_taxonomy)
+SUBCATEGORIES: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(subcategories) for subcategories in personal_injury_taxonomy.values()
+)
+_WORD_BYTES = frozenset(b'abcdefghijklmnopqrstuvwxyz0123456789')
+
+
+def __getattr__(name: str):
+    """Build PHRASES / PHRASE_OWNERS on first access instead of at import"""
+    if name in ('PHRASES', 'PHRASE_OWNERS'):
+        phrases, owners = _get_phrase_table()
+        globals().update(PHRASES=phrases, PHRASE_OWNERS=owners)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=1)
+def _get_phrase_bytes() -> Tuple[bytes, ...]:
+    """Phrases as ASCII bytes; every phrase is ASCII, so matching skips the unicode paths"""
+    phrases, _ = _get_phrase_table()
+    return tuple(phrase.encode('ascii') for phrase in phrases)
+
+
+@lru_cache(maxsize=1)
+def _get_max_phrase_length() -> int:
+    """Length of the longest phrase in bytes"""
+    return max(len(phrase) for phrase in _get_phrase_bytes())
+
+
+def get_category(name: str) -> Mapping[str, Tuple[str, ...]]:
+    """
+    Get one category's phrases
+
+    Args:
+        name: Category key, e.g. 'workplace_injuries'
+
+    Returns:
+        Read-only mapping of subcategory -> tuple of phrases
+
+    Raises:
+        KeyError: If the category doesn't exist
+    """
+    return personal_injury_taxonomy[name]
+
+
+@lru_cache(maxsize=None)
+def get_category_bytes(name: str) -> Mapping[str, Tuple[bytes, ...]]:
+    """
+    Get one category's phrases as lowercased ASCII bytes
+
+    For scanners that already hold text encoded with
+    text.encode('ascii', 'replace').lower() and want to skip str compares.
+
+    Args:
+        name: Category key, e.g. 'workplace_injuries'
+
+    Returns:
+        Read-only mapping of subcategory -> tuple of phrase bytes
+
+    Raises:
+        KeyError: If the category doesn't exist
+    """
+    if name not in personal_injury_taxonomy:
+        raise KeyError(name)
+
+    top = CATEGORIES.index(name)
+    by_subcategory = {subcategory: [] for subcategory in SUBCATEGORIES[top]}
+    _, owners = _get_phrase_table()
+    for phrase, (owner_top, sub) in zip(_get_phrase_bytes(), owners):
+        if owner_top == top:
+            by_subcategory[SUBCATEGORIES[top][sub]].append(phrase)
+    return MappingProxyType({
+        subcategory: tuple(phrases) for subcategory, phrases in by_subcategory.items()
+    })
+
+
+@lru_cache(maxsize=None)
+def get_keyword_set(category: str, subcategory: str) -> frozenset:
+    """
+    Get one subcategory's phrases as a set for O(1) membership checks
+
+    Phrases are lowercased, so lowercase the candidate before testing it.
+    Use get_category() when the taxonomy order matters.
+
+    Args:
+        category: Category key, e.g. 'workplace_injuries'
+        subcategory: Subcategory key, e.g. 'workers_compensation'
+
+    Returns:
+        Frozenset of lowercased phrases
+
+    Raises:
+        KeyError: If the category or subcategory doesn't exist
+    """
+    keywords = personal_injury_taxonomy[category][subcategory]
+    return frozenset(_normalize_phrase(keyword) for keyword in keywords)
+
+
+@lru_cache(maxsize=None)
+def get_pattern(category: str, subcategory: str) -> re.Pattern:
+    """
+    Compile one subcategory into a single case-insensitive alternation
+
+    Longer phrases come first so the longest phrase wins at each position,
+    and word boundaries match find_keyword_hits (letters and digits only).
+
+    Args:
+        category: Category key, e.g. 'workplace_injuries'
+        subcategory: Subcategory key, e.g. 'workers_compensation'
+
+    Returns:
+        Compiled pattern
+
+    Raises:
+        KeyError: If the category or subcategory doesn't exist
+    """
+    keywords = sorted(get_keyword_set(category, subcategory), key=lambda keyword: (-len(keyword), keyword))
+    alternation = '|'.join(re.escape(keyword) for keyword in keywords)
+    return re.compile(rf'(?<![a-z0-9])(?:{alternation})(?![a-z0-9])', re.IGNORECASE)
+
+
+def findall(category: str, subcategory: str, text: str) -> List[str]:
+    """
+    Find non-overlapping phrases of one subcategory in text
+
+    Args:
+        category: Category key
+        subcategory: Subcategory key
+        text: Text to scan (case-insensitive)
+
+    Returns:
+        Matched substrings of text in order of appearance
+    """
+    return get_pattern(category, subcategory).findall(text)
+
+
+@lru_cache(maxsize=1)
+def _get_subcategory_spans() -> Tuple[Tuple[int, int, frozenset], ...]:
+    """
+    Group phrase ids by subcategory for the first-byte prefilter (built on first use)
+
+    Returns:
+        Tuple of (first phrase id, end phrase id, first bytes of its phrases)
+    """
+    _, owners = _get_phrase_table()
+    phrase_bytes = _get_phrase_bytes()
+    spans = []
+    start = 0
+    for end in range(1, len(owners) + 1):
+        if end == len(owners) or owners[end] != owners[start]:
+            first_bytes = frozenset(phrase[0] for phrase in phrase_bytes[start:end])
+            spans.append((start, end, first_bytes))
+            start = end
+    return tuple(spans)
+
+
+@lru_cache(maxsize=1)
+def _get_sorted_phrases() -> Tuple[str, ...]:
+    """Sorted, de-duplicated phrases for membership and prefix range queries"""
+    phrases, _ = _get_phrase_table()
+    return tuple(sorted(set(phrases)))
+
+
+@lru_cache(maxsize=1)
+def phrase_buffer() -> Tuple[bytes, array]:
+    """
+    Get every phrase packed into one buffer plus an offsets array
+
+    Phrase id i is buffer[offsets[i]:offsets[i + 1]]. Both objects support
+    the buffer protocol, so numpy.frombuffer can wrap them without copying.
+
+    Returns:
+        Tuple of (concatenated phrase bytes, array('I') of len(PHRASES) + 1 offsets)
+    """
+    phrase_bytes = _get_phrase_bytes()
+    offsets = array('I', [0])
+    for phrase in phrase_bytes:
+        offsets.append(offsets[-1] + len(phrase))
+    return b''.join(phrase_bytes), offsets
+
+
+@lru_cache(maxsize=1)
+def keyword_table():
+    """
+    Get the taxonomy as a flat table for analytics (built on first use)
+
+    One row per phrase id. category and subcategory are categoricals, so
+    each name is stored once and group-bys run on integer codes. The frame
+    is shared between callers; copy it before modifying.
+
+    Returns:
+        pandas.DataFrame with columns category, subcategory, phrase
+    """
+    import pandas as pd
+
+    phrases, owners = _get_phrase_table()
+    return pd.DataFrame({
+        'category': pd.Categorical.from_codes(
+            [top for top, _ in owners], categories=CATEGORIES
+        ),
+        'subcategory': pd.Categorical(
+            [SUBCATEGORIES[top][sub] for top, sub in owners],
+            categories=list(dict.fromkeys(name for names in SUBCATEGORIES for name in names)),
+        ),
+        'phrase': phrases,
+    })
+
+
+def _encode_text(text: str) -> bytes:
+    """
+    Encode text for matching against the phrase bytes
+
+    Non-ASCII characters become a single '?' byte so offsets still line up
+    with the original string.
+    """
+    return text.encode('ascii', 'replace').lower()
+
+
+def _is_word_boundary(data: bytes, start: int, end: int) -> bool:
+    """Check that data[start:end] is not embedded inside a longer word"""
+    if start > 0 and data[start - 1] in _WORD_BYTES:
+        return False
+    if end < len(data) and data[end] in _WORD_BYTES:
+        return False
+    return True
+
+
+@lru_cache(maxsize=1)
+def _get_automaton():
+    """
+    Build the Aho-Corasick automaton over every phrase (once, on first use)
+
+    Returns:
+        ahocorasick.Automaton mapping phrase -> (length, tuple of phrase ids),
+        or None if pyahocorasick is not installed
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        logger.debug("pyahocorasick not installed, using per-phrase keyword scan")
+        return None
+
+    # The same phrase can appear under several subcategories
+    phrases, _ = _get_phrase_table()
+    phrase_ids = {}
+    for phrase_id, phrase in enumerate(phrases):
+        phrase_ids.setdefault(phrase, []).append(phrase_id)
+
+    automaton = ahocorasick.Automaton()
+    for phrase, ids in phrase_ids.items():
+        automaton.add_word(phrase, (len(phrase), tuple(ids)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _scan(data: bytes) -> Iterator[Tuple[int, int, int]]:
+    """
+    Scan encoded text for whole-phrase matches in a single pass
+
+    Args:
+        data: Text encoded with _encode_text
+
+    Yields:
+        Tuples of (phrase id, start, end)
+    """
+    automaton = _get_automaton()
+    if automaton is None:
+        yield from _scan_phrases(data)
+        return
+
+    for last, (length, phrase_ids) in automaton.iter(data.decode('ascii')):
+        end = last + 1
+        start = end - length
+        if _is_word_boundary(data, start, end):
+            for phrase_id in phrase_ids:
+                yield phrase_id, start, end
+
+
+def _scan_phrases(data: bytes) -> Iterator[Tuple[int, int, int]]:
+    """
+    Scan encoded text phrase by phrase (fallback without pyahocorasick)
+
+    Args:
+        data: Text encoded with _encode_text
+
+    Yields:
+        Tuples of (phrase id, start, end)
+    """
+    # Subcategories (and phrases) whose first bytes never occur can't match;
+    # this skips most of the table for short texts
+    phrase_bytes = _get_phrase_bytes()
+    present = set(data)
+    for first_id, end_id, first_bytes in _get_subcategory_spans():
+        if first_bytes.isdisjoint(present):
+            continue
+        for phrase_id in range(first_id, end_id):
+            phrase = phrase_bytes[phrase_id]
+            if phrase[0] not in present:
+                continue
+            start = data.find(phrase)
+            while start != -1:
+                end = start + len(phrase)
+                if _is_word_boundary(data, start, end):
+                    yield phrase_id, start, end
+                start = data.find(phrase, start + 1)
+
+
+def _hits(data: bytes, offset: int = 0) -> List[PIKeywordHit]:
+    """Scan data and wrap matches as hits, shifting offsets by offset"""
+    _, owners = _get_phrase_table()
+    hits = []
+    for phrase_id, start, end in _scan(data):
+        top, sub = owners[phrase_id]
+        hits.append(PIKeywordHit(top, sub, start + offset, end + offset, phrase_id))
+
+    hits.sort(key=lambda hit: (hit.start, hit.end))
+    return hits
+
+
+def find_keyword_hits(text: str) -> List[PIKeywordHit]:
+    """
+    Find every taxonomy phrase that occurs in text as a whole phrase
+
+    Args:
+        text: Text to scan (matching is case-insensitive)
+
+    Returns:
+        List of hits ordered by start offset
+    """
+    return _hits(_encode_text(text))
+
+
+def count_keyword_hits(text: str) -> Counter:
+    """
+    Count hits per phrase without building hit records
+
+    Phrase ids are dense ints, so the counter never rehashes phrase strings.
+
+    Args:
+        text: Text to scan (matching is case-insensitive)
+
+    Returns:
+        Counter mapping phrase id to number of hits
+    """
+    return Counter(phrase_id for phrase_id, _, _ in _scan(_encode_text(text)))
+
+
+def iter_matches(text: str) -> Iterator[Tuple[str, str, str]]:
+    """
+    Yield (category, subcategory, phrase) for every keyword hit in one pass
+
+    For callers that only need names; hits come in scan order, and a phrase
+    owned by several subcategories yields once per owner.
+
+    Args:
+        text: Text to scan (matching is case-insensitive)
+
+    Yields:
+        Tuples of (category name, subcategory name, lowercased phrase)
+    """
+    phrases, owners = _get_phrase_table()
+    for phrase_id, _, _ in _scan(_encode_text(text)):
+        top, sub = owners[phrase_id]
+        yield CATEGORIES[top], SUBCATEGORIES[top][sub], phrases[phrase_id]
+
+
+def iter_keyword_hits_stream(pieces: Iterable[str]) -> Iterator[PIKeywordHit]:
+    """
+    Find keyword hits in a document that arrives in pieces
+
+    Only the tail of the previous piece is rescanned, so a phrase split across
+    two pieces is still found without buffering the whole document. Offsets
+    are relative to the concatenated stream.
+
+    Args:
+        pieces: Consecutive pieces of a single document
+
+    Yields:
+        Hits as soon as they are complete (ordered by start within each piece)
+    """
+    max_length = _get_max_phrase_length()
+    carry = b''
+    base = 0  # stream offset of carry[0]
+    emitted_to = 0  # hits ending before this offset have been yielded
+
+    for piece in pieces:
+        data = carry + _encode_text(piece)
+        limit = base + len(data)
+
+        # A hit ending exactly at the buffer end may continue into the next
+        # piece, so it is deferred until the following character is known
+        for hit in _hits(data, base):
+            if emitted_to <= hit.end < limit:
+                yield hit
+
+        emitted_to = limit
+        keep = min(len(data), max_length + 1)
+        carry = data[len(data) - keep:]
+        base = limit - keep
+
+    for hit in _hits(carry, base):
+        if hit.end >= emitted_to:
+            yield hit
+
+
+@lru_cache(maxsize=1)
+def _get_first_token_index() -> dict:
+    """Map each first token to its phrase ids, longest phrase first"""
+    phrases, _ = _get_phrase_table()
+    index = {}
+    for phrase_id, phrase in enumerate(phrases):
+        index.setdefault(phrase.split(' ', 1)[0], []).append(phrase_id)
+    return {
+        token: tuple(sorted(phrase_ids, key=lambda phrase_id: -len(phrases[phrase_id])))
+        for token, phrase_ids in index.items()
+    }
+
+
+def candidates(token: str) -> Tuple[int, ...]:
+    """
+    List phrases that start with the given token, longest first
+
+    Lets a token-by-token scanner test only the phrases that could begin at
+    the current token and stop at the first (longest) one that matches.
+
+    Args:
+        token: First word of the candidate phrases (case-insensitive)
+
+    Returns:
+        Tuple of phrase ids ordered by descending phrase length
+    """
+    return _get_first_token_index().get(token.lower(), ())
+
+
+@lru_cache(maxsize=1)
+def _get_reverse_index() -> dict:
+    """Map each phrase to every (category id, subcategory id) listing it, in taxonomy order"""
+    reverse = {}
+    for phrase, owner in zip(*_get_phrase_table()):
+        reverse[phrase] = reverse.get(phrase, ()) + (owner,)
+    return reverse
+
+
+def category_of(phrase: str) -> Tuple[int, int]:
+    """
+    Look up which subcategory a phrase belongs to
+
+    A phrase listed under several subcategories resolves to the first one
+    in taxonomy order.
+
+    Args:
+        phrase: Phrase to look up (case and whitespace are normalized)
+
+    Returns:
+        Tuple of (category id, subcategory id)
+
+    Raises:
+        KeyError: If the phrase is not in the taxonomy
+    """
+    return _get_reverse_index()[_normalize_phrase(phrase)][0]
+
+
+def lookup(phrase: str) -> Tuple[Tuple[int, int], ...]:
+    """
+    Look up every subcategory a phrase belongs to
+
+    Args:
+        phrase: Phrase to look up (case and whitespace are normalized)
+
+    Returns:
+        Tuple of (category id, subcategory id) pairs in taxonomy order,
+        empty if the phrase is not in the taxonomy
+    """
+    return _get_reverse_index().get(_normalize_phrase(phrase), ())
+
+
+def longest_keyword_prefix(text: str) -> Optional[str]:
+    """
+    Find the longest taxonomy phrase that text starts with
+
+    Only cut points at word boundaries are tried, longest first, each with
+    one dict probe, so a streaming classifier can test the text ahead of
+    its cursor without scanning phrase lists.
+
+    Args:
+        text: Text starting at the position to test (case-insensitive)
+
+    Returns:
+        The lowercased phrase, or None if no phrase starts here
+    """
+    max_length = _get_max_phrase_length()
+    head = _encode_text(text[:max_length + 1])
+    reverse = _get_reverse_index()
+    for end in range(min(len(head), max_length), 0, -1):
+        if end < len(head) and head[end] in _WORD_BYTES:
+            continue
+        phrase = head[:end].decode('ascii')
+        if phrase in reverse:
+            return phrase
+    return None
+
+
+def _subcategory_bit(top: int, sub: int) -> int:
+    """Bit for a subcategory in a flat numbering across all categories"""
+    return 1 << (sum(len(subcategories) for subcategories in SUBCATEGORIES[:top]) + sub)
+
+
+@lru_cache(maxsize=1)
+def _get_membership() -> dict:
+    """Map each phrase to the bitmask of every subcategory that lists it"""
+    membership = {}
+    for phrase, (top, sub) in zip(*_get_phrase_table()):
+        membership[phrase] = membership.get(phrase, 0) | _subcategory_bit(top, sub)
+    return membership
+
+
+def membership(phrase: str) -> int:
+    """
+    Get the subcategories a phrase belongs to as a bitmask
+
+    Bits follow the flat subcategory order (CATEGORIES, then SUBCATEGORIES
+    within each); AND the result with category_mask() to test a category.
+
+    Args:
+        phrase: Phrase to look up (case and whitespace are normalized)
+
+    Returns:
+        Bitmask of owning subcategories, 0 if the phrase is unknown
+    """
+    return _get_membership().get(_normalize_phrase(phrase), 0)
+
+
+@lru_cache(maxsize=None)
+def category_mask(category: str) -> int:
+    """
+    Get the bitmask covering every subcategory of a category
+
+    Args:
+        category: Category key, e.g. 'workplace_injuries'
+
+    Returns:
+        Bitmask usable with membership()
+
+    Raises:
+        KeyError: If the category doesn't exist
+    """
+    if category not in personal_injury_taxonomy:
+        raise KeyError(category)
+
+    top = CATEGORIES.index(category)
+    mask = 0
+    for sub in range(len(SUBCATEGORIES[top])):
+        mask |= _subcategory_bit(top, sub)
+    return mask
+
+
+def name_of(top: int, sub: int) -> Tuple[str, str]:
+    """
+    Resolve category/subcategory ids to their names
+
+    Args:
+        top: Category id (index into CATEGORIES)
+        sub: Subcategory id (index into SUBCATEGORIES[top])
+
+    Returns:
+        Tuple of (category name, subcategory name)
+    """
+    return CATEGORIES[top], SUBCATEGORIES[top][sub]
+
+
+@lru_cache(maxsize=1)
+def _get_packed_names() -> Tuple[Optional[Tuple[str, str]], ...]:
+    """Flat (category, subcategory) name table indexed by pack_ids()"""
+    names = [None] * (len(CATEGORIES) << 8)
+    for top, subcategories in enumerate(SUBCATEGORIES):
+        for sub, subcategory in enumerate(subcategories):
+            names[pack_ids(top, sub)] = (CATEGORIES[top], subcategory)
+    return tuple(names)
+
+
+def pack_ids(top: int, sub: int) -> int:
+    """
+    Pack category/subcategory ids into one small int
+
+    Args:
+        top: Category id
+        sub: Subcategory id (the taxonomy has far fewer than 256 per category)
+
+    Returns:
+        (top << 8) | sub, fits in a uint16
+    """
+    return (top << 8) | sub
+
+
+def resolve(packed_id: int) -> Tuple[str, str]:
+    """
+    Resolve a packed id from pack_ids() to names with one table load
+
+    Args:
+        packed_id: Packed category/subcategory id
+
+    Returns:
+        Tuple of (category name, subcategory name)
+    """
+    return _get_packed_names()[packed_id]
+
+
+def is_keyword(phrase: str) -> bool:
+    """
+    Check whether phrase is in the taxonomy
+
+    Args:
+        phrase: Phrase to look up (case and whitespace are normalized)
+
+    Returns:
+        True if the phrase is a known keyword
+    """
+    phrase = _normalize_phrase(phrase)
+    sorted_phrases = _get_sorted_phrases()
+    index = bisect_left(sorted_phrases, phrase)
+    return index < len(sorted_phrases) and sorted_phrases[index] == phrase
+
+
+def keywords_with_prefix(prefix: str) -> List[str]:
+    """
+    List taxonomy phrases starting with prefix (case-insensitive)
+
+    Args:
+        prefix: Prefix to search for
+
+    Returns:
+        Matching phrases in sorted order
+    """
+    prefix = prefix.lower()
+    sorted_phrases = _get_sorted_phrases()
+    matches = []
+    for phrase in sorted_phrases[bisect_left(sorted_phrases, prefix):]:
+        if not phrase.startswith(prefix):
+            break
+        matches.append(phrase)
+    return matches
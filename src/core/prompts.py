@@ -3,21 +3,55 @@ Simplified prompt management system - only handles system prompts
 Individual extractors manage their own prompts
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Tuple, Union
+
+# File types read from a prompts directory
+PROMPT_SUFFIXES = ('.md', '.json')
+
+
+@lru_cache(maxsize=None)
+def _load_prompt_dir(prompts_dir: Path) -> Mapping[str, str]:
+    """
+    Read every prompt file under a directory once per process
+
+    Args:
+        prompts_dir: Directory containing prompt files
+
+    Returns:
+        Read-only mapping of relative posix path -> file content
+    """
+    # One scandir-backed walk for all suffixes, one open() per file
+    prompts = {}
+    for root, _, filenames in os.walk(prompts_dir):
+        for filename in filenames:
+            if filename.endswith(PROMPT_SUFFIXES):
+                file_path = Path(root, filename)
+                with open(file_path, 'rb') as f:
+                    prompts[file_path.relative_to(prompts_dir).as_posix()] = f.read().decode('utf-8')
+    return MappingProxyType(prompts)
+
+
+@lru_cache(maxsize=None)
+def _split_template(template: str, placeholder: str) -> Tuple[str, ...]:
+    """Split a template around its placeholders (once per distinct template)"""
+    return tuple(template.split(placeholder))
 
 
 class PromptTemplates:
     """Manages system-level prompts only"""
 
-    def __init__(self, prompts_dir: str = "prompts"):
+    def __init__(self, prompts_dir: Union[str, Path] = "prompts"):
         """
         Initialize prompt templates
 
         Args:
-            prompts_dir: Directory containing system prompt files
+            prompts_dir: Directory containing prompt files
         """
         self.prompts_dir = Path(prompts_dir)
-        self._cache = {}
 
     def _load_file(self, relative_path: str) -> str:
         """
@@ -29,16 +63,42 @@ class PromptTemplates:
         Returns:
             File content as string
         """
-        if relative_path in self._cache:
-            return self._cache[relative_path]
+        try:
+            return _load_prompt_dir(self.prompts_dir)[relative_path]
+        except KeyError:
+            raise FileNotFoundError(f"Prompt file not found: {self.prompts_dir / relative_path}") from None
+
+    def get_prompt(self, relative_path: str) -> str:
+        """
+        Get any prompt file under the prompts directory (cached)
+
+        Args:
+            relative_path: Path relative to prompts directory
 
-        file_path = self.prompts_dir / relative_path
-        if not file_path.exists():
-            raise FileNotFoundError(f"Prompt file not found: {file_path}")
+        Returns:
+            Prompt text
+        """
+        return self._load_file(relative_path)
+
+    def get_template_parts(self, relative_path: str, placeholder: str = "{content}") -> Tuple[str, ...]:
+        """
+        Get a prompt template pre-split around a placeholder
+
+        Fill it with value.join(parts), which gives the same text as
+        template.replace(placeholder, value) without rescanning the template.
+
+        Args:
+            relative_path: Path relative to prompts directory
+            placeholder: Placeholder to split on
+
+        Returns:
+            Template pieces between placeholders
+        """
+        return _split_template(self._load_file(relative_path), placeholder)
 
-        content = file_path.read_text()
-        self._cache[relative_path] = content
-        return content
+    def reload_prompts(self):
+        """Drop the loaded prompt files so edits on disk are picked up"""
+        _load_prompt_dir.cache_clear()
 
     def get_system_prompt(self) -> str:
         """
@@ -47,4 +107,4 @@ class PromptTemplates:
         Returns:
             System prompt text
         """
-        return self._load_file("system/base.md")
\ No newline at end of file
+        return self._load_file("system/base.md")
@@ -3,8 +3,9 @@ Centralized configuration management using Pydantic Settings.
 Following best practices for type-safe, validated configuration.
 """
 
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional, Literal
+from typing import ClassVar, Optional, Literal, Set
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
@@ -17,6 +18,9 @@ class DatabaseSettings(BaseSettings):
     supabase_database_uri: Optional[str] = Field(None, env='SUPABASE_DATABASE_URI')
     supabase_url: Optional[str] = Field(None, env='SUPABASE_URL')
     supabase_key: Optional[str] = Field(None, env='SUPABASE_KEY')
+    # Connections per PostgreSQL pool, both checked out at once and kept open
+    # between queries; size to the expected query concurrency
+    pool_max_connections: int = Field(10, env='POOL_MAX_CONNECTIONS')
     
     class Config:
         env_prefix = ''
@@ -143,10 +147,15 @@ class PathSettings(BaseSettings):
     output_dir: Path = Field(Path('data/output'), env='OUTPUT_DIR')
     logs_dir: Path = Field(Path('logs'), env='LOGS_DIR')
     
+    # Directories already created in this process
+    _ensured: ClassVar[Set[Path]] = set()
+    
     def ensure_directories(self):
-        """Create directories if they don't exist."""
-        for dir_path in [self.data_dir, self.output_dir, self.logs_dir]:
-            dir_path.mkdir(parents=True, exist_ok=True)
+        """Create directories if they don't exist (once per process)."""
+        for dir_path in (self.data_dir, self.output_dir, self.logs_dir):
+            if dir_path not in self._ensured:
+                dir_path.mkdir(parents=True, exist_ok=True)
+                self._ensured.add(dir_path)
     
     class Config:
         env_prefix = ''
@@ -158,20 +167,40 @@ class Settings(BaseSettings):
     # Environment
     environment: Literal['local', 'production'] = Field('local', env='ENVIRONMENT')
     
-    # Sub-configurations
-    database: DatabaseSettings = Field(default_factory=DatabaseSettings)
-    storage: StorageSettings = Field(default_factory=StorageSettings)
-    extraction: ExtractionSettings = Field(default_factory=ExtractionSettings)
-    ollama: OllamaSettings = Field(default_factory=OllamaSettings)
-    gemini: GeminiSettings = Field(default_factory=GeminiSettings)
-    logging: LoggingSettings = Field(default_factory=LoggingSettings)
-    paths: PathSettings = Field(default_factory=PathSettings)
-    
     class Config:
         env_file = 'config/.env'
         case_sensitive = False
         extra = 'ignore'  # Ignore extra environment variables
     
+    # Sub-configurations, each read from the environment and validated on first access
+    @cached_property
+    def database(self) -> DatabaseSettings:
+        return DatabaseSettings()
+    
+    @cached_property
+    def storage(self) -> StorageSettings:
+        return StorageSettings()
+    
+    @cached_property
+    def extraction(self) -> ExtractionSettings:
+        return ExtractionSettings()
+    
+    @cached_property
+    def ollama(self) -> OllamaSettings:
+        return OllamaSettings()
+    
+    @cached_property
+    def gemini(self) -> GeminiSettings:
+        return GeminiSettings()
+    
+    @cached_property
+    def logging(self) -> LoggingSettings:
+        return LoggingSettings()
+    
+    @cached_property
+    def paths(self) -> PathSettings:
+        return PathSettings()
+    
     @property
     def is_production(self) -> bool:
         """Check if running in production environment."""
@@ -227,12 +256,18 @@ env_file = Path(__file__).parent.parent.parent / "config" / ".env"
 if env_file.exists():
     load_dotenv(env_file)
 
-# Create global settings instance
-settings = Settings()
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get the global settings instance."""
-    return settings
+    """Get the global settings instance (created on first call)."""
+    return Settings()
+
+
+def __getattr__(name: str):
+    """Keep `from src.core.settings import settings` working without an eager instance."""
+    if name == 'settings':
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Exit codes for consistent error handling
@@ -4,10 +4,16 @@ Uses the Supabase Python client library for storage access
 """
 
 import logging
-from typing import List, Dict, Optional, Tuple
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Iterator, List, Dict, Optional, Tuple, Union
 from pathlib import Path
 from supabase import create_client, Client
 from src.core.settings import get_settings
+from src.database.connection import get_database_connection
 
 logger = logging.getLogger(__name__)
 
@@ -15,39 +21,113 @@ logger = logging.getLogger(__name__)
 class StorageHandler:
     """Handles storage operations for markdown documents"""
     
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, client: Optional[Client] = None):
         """
         Initialize storage handler
         
         Args:
             config: Storage configuration from YAML
+            client: Optional Supabase client (defaults to the shared client
+                held by the global database connection)
         """
         self.config = config
         self.bucket = config.get('bucket', 'law-firm-websites')
         self.base_path = config.get('base_path', '')
         
-        # Initialize Supabase client
-        settings = get_settings()
-        supabase_url = settings.database.supabase_url
-        supabase_key = settings.database.supabase_key
+        # Items requested per storage list call (Supabase defaults to 100)
+        self.list_page_size = config.get('list_page_size', 1000)
         
-        if not supabase_url or not supabase_key:
-            raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment")
+        # Cap on concurrent downloads per domain (keeps Supabase connection use bounded)
+        self.download_concurrency = config.get('download_concurrency', 16)
         
-        self.client: Client = create_client(supabase_url, supabase_key)
+        # Bucket listings change slowly during a run; keep them for a while
+        self.listing_cache_ttl = config.get('listing_cache_ttl', 300)
+        self.listing_cache_size = config.get('listing_cache_size', 256)
+        self._listing_cache: Dict[Tuple, Tuple[float, Tuple[Any, ...]]] = {}
+        self._listing_lock = threading.RLock()
+        
+        # Reuse the shared Supabase client so its HTTP pool and auth are shared
+        if client is None:
+            client = get_database_connection().get_supabase_client()
+        
+        if client is None:
+            # The database connection only creates a client when not running
+            # against a local database, but storage always lives in Supabase
+            settings = get_settings()
+            supabase_url = settings.database.supabase_url
+            supabase_key = settings.database.supabase_key
+            
+            if not supabase_url or not supabase_key:
+                raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment")
+            
+            client = create_client(supabase_url, supabase_key)
+        
+        self.client: Client = client
         
         logger.info(f"Storage handler initialized for bucket: {self.bucket}/{self.base_path}")
     
-    def list_domains(self) -> List[str]:
+    def _get_cached_listing(self, key: Tuple) -> Optional[List]:
+        """
+        Get a cached listing if it is still fresh
+        
+        Args:
+            key: Cache key, e.g. ('files', domain)
+        
+        Returns:
+            Copy of the cached listing, or None on a miss
+        """
+        with self._listing_lock:
+            entry = self._listing_cache.get(key)
+        if entry and time.monotonic() - entry[0] < self.listing_cache_ttl:
+            return list(entry[1])
+        return None
+    
+    def _cache_listing(self, key: Tuple, listing: List) -> List:
+        """Store a successful listing and return it"""
+        with self._listing_lock:
+            # Re-insert so dict order runs from oldest to newest entry
+            self._listing_cache.pop(key, None)
+            while self._listing_cache and len(self._listing_cache) >= self.listing_cache_size:
+                del self._listing_cache[next(iter(self._listing_cache))]
+            self._listing_cache[key] = (time.monotonic(), tuple(listing))
+        return listing
+    
+    def invalidate_cache(self, domain: Optional[str] = None):
+        """
+        Forget cached listings so the next call goes back to storage
+        
+        Args:
+            domain: Only forget this domain's file listing (and the domain
+                list, in case the domain is new); forget everything if None
+        """
+        with self._listing_lock:
+            if domain is None:
+                self._listing_cache.clear()
+            else:
+                self._listing_cache.pop(('files', domain), None)
+                self._listing_cache.pop(('domains',), None)
+    
+    def list_domains(self, cache: bool = True) -> List[str]:
         """
         List all available domains in storage
         
+        Results are cached for listing_cache_ttl seconds.
+        
+        Args:
+            cache: Use a cached listing if one is fresh; pass False to force
+                a new listing (the result is still cached)
+        
         Returns:
             List of domain names
         """
+        if cache:
+            cached = self._get_cached_listing(('domains',))
+            if cached is not None:
+                return cached
+        
         try:
             # List folders in the markdown directory
-            items = self.client.storage.from_(self.bucket).list(self.base_path)
+            items = self._list_all(self.base_path)
             
             # Filter for folders (domains)
             domains = []
@@ -56,84 +136,180 @@ class StorageHandler:
                     domains.append(item['name'])
             
             logger.info(f"Found {len(domains)} domains in storage")
-            return sorted(domains)
+            return self._cache_listing(('domains',), sorted(domains))
             
         except Exception as e:
             logger.error(f"Failed to list domains: {e}")
             return []
     
-    def list_files_for_domain(self, domain: str) -> List[str]:
+    def list_files_for_domain(self, domain: str, cache: bool = True) -> List[str]:
         """
         List all markdown files for a specific domain (including nested folders)
 
+        Results are cached for listing_cache_ttl seconds.
+
         Args:
             domain: Domain name (e.g., '137law.com')
+            cache: Use a cached listing if one is fresh; pass False to force
+                a new listing (the result is still cached)
 
         Returns:
             List of file names (with relative paths for nested files)
         """
+        return [record['name'] for record in self.list_file_records(domain, cache)]
+
+    def list_file_records(self, domain: str, cache: bool = True) -> List[Dict]:
+        """
+        List all markdown files for a domain with their storage metadata
+
+        The storage listing already carries each object's size, eTag and
+        timestamps, so they are kept rather than fetched again per file.
+        Shares its cache with list_files_for_domain.
+
+        Args:
+            domain: Domain name (e.g., '137law.com')
+            cache: Use a cached listing if one is fresh; pass False to force
+                a new listing (the result is still cached)
+
+        Returns:
+            List of dicts with name, id, updated_at, size, etag and mimetype,
+            sorted by name
+        """
+        if cache:
+            cached = self._get_cached_listing(('files', domain))
+            if cached is not None:
+                return [dict(record) for record in cached]
+
         try:
             # Path structure is {domain}/markdown/
             base_path = f"{domain}/markdown" if self.base_path == '' else f"{self.base_path}/{domain}"
 
             # Recursively list all files
-            all_files = self._list_files_recursive(base_path)
+            failed: List[str] = []
+            records = self._list_files_recursive(base_path, failed=failed)
+            records.sort(key=lambda record: record['name'])
 
-            logger.info(f"Found {len(all_files)} markdown files for domain {domain}")
-            return sorted(all_files)
+            logger.info(f"Found {len(records)} markdown files for domain {domain}")
+            # An incomplete listing is returned but not cached, so a transient
+            # storage error does not hide files until the TTL expires
+            if failed:
+                logger.warning(f"Not caching listing for {domain}: {len(failed)} folder(s) failed to list")
+            else:
+                self._cache_listing(('files', domain), [dict(record) for record in records])
+            return records
 
         except Exception as e:
             logger.error(f"Failed to list files for domain {domain}: {e}")
             return []
 
-    def _list_files_recursive(self, path: str, relative_prefix: str = "") -> List[str]:
+    def _list_all(self, path: str) -> List[Dict]:
+        """
+        List every item of a storage folder, following pagination
+
+        A storage list call returns one page of items, so folders larger than
+        a page are read with successive offsets.
+
+        Args:
+            path: The path to list
+
+        Returns:
+            All storage items in the folder, sorted by name
+        """
+        bucket = self.client.storage.from_(self.bucket)
+        items = []
+        offset = 0
+        while True:
+            page = bucket.list(path, {
+                'limit': self.list_page_size,
+                'offset': offset,
+                'sortBy': {'column': 'name', 'order': 'asc'}
+            })
+            items.extend(page)
+            if len(page) < self.list_page_size:
+                return items
+            offset += self.list_page_size
+
+    def _list_folder(self, path: str, failed: Optional[List[str]] = None) -> List[Dict]:
+        """
+        List the items of a single storage folder
+
+        Args:
+            path: The path to list
+            failed: Optional list the path is appended to if the listing fails
+
+        Returns:
+            Storage items, or an empty list if the listing failed
+        """
+        try:
+            return self._list_all(path)
+        except Exception as e:
+            logger.warning(f"Error listing files in {path}: {e}")
+            if failed is not None:
+                failed.append(path)
+            return []
+
+    def _list_files_recursive(self, path: str, relative_prefix: str = "", max_workers: int = 8,
+                              failed: Optional[List[str]] = None) -> List[Dict]:
         """
         Recursively list all markdown files in a path and its subfolders
 
+        Folders are walked breadth first and every folder on a level is listed
+        concurrently, so listing time grows with tree depth, not folder count.
+
         Args:
             path: The path to list
             relative_prefix: Prefix to add to filenames for nested folders
+            max_workers: Maximum number of folder listings in flight
+            failed: Optional list collecting the paths of folders that
+                could not be listed
 
         Returns:
-            List of file names with relative paths
+            File records (see list_file_records) named by relative path
         """
         files = []
-        try:
-            items = self.client.storage.from_(self.bucket).list(path)
+        level = [(path, relative_prefix)]
 
-            for item in items:
-                item_name = item.get('name', '')
-
-                # Check if it's a file (has an 'id' and metadata)
-                if item.get('id') and item_name.endswith('.md'):
-                    # Add file with its relative path
-                    full_relative_path = f"{relative_prefix}{item_name}" if relative_prefix else item_name
-                    files.append(full_relative_path)
-
-                # Check if it's a folder (no 'id', no metadata, or metadata is None)
-                elif not item.get('id') or not item.get('metadata'):
-                    # Recursively list this subfolder
-                    subfolder_path = f"{path}/{item_name}"
-                    subfolder_prefix = f"{relative_prefix}{item_name}/" if relative_prefix else f"{item_name}/"
-                    subfolder_files = self._list_files_recursive(subfolder_path, subfolder_prefix)
-                    files.extend(subfolder_files)
-                    logger.debug(f"Found {len(subfolder_files)} files in subfolder {subfolder_path}")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while level:
+                listings = executor.map(lambda folder: self._list_folder(folder[0], failed), level)
+                next_level = []
 
-        except Exception as e:
-            logger.warning(f"Error listing files in {path}: {e}")
+                for (folder_path, prefix), items in zip(level, listings):
+                    for item in items:
+                        item_name = item.get('name', '')
+
+                        # Check if it's a file (has an 'id' and metadata)
+                        if item.get('id') and item_name.endswith('.md'):
+                            metadata = item.get('metadata') or {}
+                            files.append({
+                                'name': f"{prefix}{item_name}",
+                                'id': item['id'],
+                                'updated_at': item.get('updated_at'),
+                                'size': metadata.get('size'),
+                                'etag': metadata.get('eTag'),
+                                'mimetype': metadata.get('mimetype')
+                            })
+
+                        # Check if it's a folder (no 'id', no metadata, or metadata is None)
+                        elif not item.get('id') or not item.get('metadata'):
+                            next_level.append((f"{folder_path}/{item_name}", f"{prefix}{item_name}/"))
+
+                if next_level:
+                    logger.debug(f"Listing {len(next_level)} subfolders under {path}")
+                level = next_level
 
         return files
     
-    def download_file(self, domain: str, filename: str) -> Optional[str]:
+    def download_file_bytes(self, domain: str, filename: str) -> Optional[bytes]:
         """
-        Download a specific markdown file
+        Download a specific markdown file without decoding it
         
         Args:
             domain: Domain name
             filename: Markdown filename
         
         Returns:
-            File content as string or None if failed
+            Raw file content or None if failed
         """
         try:
             # Path structure is {domain}/markdown/{filename}
@@ -143,9 +319,9 @@ class StorageHandler:
             response = self.client.storage.from_(self.bucket).download(path)
             
             if response:
-                content = response.decode('utf-8') if isinstance(response, bytes) else str(response)
-                logger.info(f"Downloaded {path} ({len(content)} characters)")
-                return content
+                data = response if isinstance(response, bytes) else str(response).encode('utf-8')
+                logger.info(f"Downloaded {path} ({len(data)} bytes)")
+                return data
             else:
                 logger.error(f"Empty response when downloading {path}")
                 return None
@@ -154,30 +330,147 @@ class StorageHandler:
             logger.error(f"Failed to download {domain}/{filename}: {e}")
             return None
     
-    def download_domain_files(self, domain: str, limit: Optional[int] = None) -> List[Tuple[str, str]]:
+    def download_file(self, domain: str, filename: str) -> Optional[str]:
+        """
+        Download a specific markdown file
+        
+        Args:
+            domain: Domain name
+            filename: Markdown filename
+        
+        Returns:
+            File content as string or None if failed
+        """
+        data = self.download_file_bytes(domain, filename)
+        if not data:
+            return None
+        
+        try:
+            return data.decode('utf-8')
+        except UnicodeDecodeError as e:
+            logger.error(f"Failed to decode {domain}/{filename}: {e}")
+            return None
+    
+    def download_domain_files(self, domain: str, limit: Optional[int] = None,
+                              max_workers: Optional[int] = None, as_bytes: bool = False) -> List[Tuple[str, Union[str, bytes]]]:
         """
         Download all markdown files for a domain
         
+        Holds every file in memory; use iter_domain_files to process files
+        as they arrive.
+        
         Args:
             domain: Domain name
             limit: Optional limit on number of files to download
+            max_workers: Maximum number of downloads in flight (defaults to download_concurrency)
+            as_bytes: Return raw bytes instead of decoded text
         
         Returns:
             List of (filename, content) tuples
         """
-        files = self.list_files_for_domain(domain)
+        return list(self.iter_domain_files(domain, limit, max_workers, as_bytes))
+    
+    def iter_domain_files(self, domain: str, limit: Optional[int] = None,
+                          max_workers: Optional[int] = None, as_bytes: bool = False,
+                          files: Optional[List[str]] = None) -> Iterator[Tuple[str, Union[str, bytes]]]:
+        """
+        Download the markdown files for a domain lazily
+        
+        Args:
+            domain: Domain name
+            limit: Optional limit on number of files to download
+            max_workers: Maximum number of downloads in flight (defaults to download_concurrency)
+            as_bytes: Yield raw bytes instead of decoded text
+            files: File names already listed with list_files_for_domain
+                (listed here if None)
+        
+        Yields:
+            (filename, content) tuples in listing order
+        """
+        if files is None:
+            files = self.list_files_for_domain(domain)
+        yield from self._iter_listed_files(domain, files, limit, max_workers, as_bytes)
+    
+    def _iter_listed_files(self, domain: str, files: List[str], limit: Optional[int] = None,
+                           max_workers: Optional[int] = None, as_bytes: bool = False) -> Iterator[Tuple[str, Union[str, bytes]]]:
+        """
+        Download already listed markdown files of a domain concurrently
+        
+        Downloads are I/O bound, so they run on a thread pool ahead of the
+        consumer. Only max_workers files are in flight or waiting to be
+        consumed at any time, so memory stays bounded however many files the
+        domain has. Failed downloads are skipped.
         
+        Args:
+            domain: Domain name
+            files: File names from list_files_for_domain
+            limit: Optional limit on number of files to download
+            max_workers: Maximum number of downloads in flight (defaults to download_concurrency)
+            as_bytes: Yield raw bytes instead of decoded text
+        
+        Yields:
+            (filename, content) tuples in listing order
+        """
         if limit:
             files = files[:limit]
         
-        results = []
-        for filename in files:
-            content = self.download_file(domain, filename)
-            if content:
-                results.append((filename, content))
+        max_workers = max(1, min(len(files), max_workers or self.download_concurrency))
+        download = self.download_file_bytes if as_bytes else self.download_file
+        downloaded = 0
         
-        logger.info(f"Downloaded {len(results)} files for domain {domain}")
-        return results
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            remaining = iter(files)
+            pending = deque(
+                (filename, executor.submit(download, domain, filename))
+                for filename in islice(remaining, max_workers)
+            )
+            
+            while pending:
+                filename, future = pending.popleft()
+                
+                # Keep the window full while the consumer handles this file
+                next_filename = next(remaining, None)
+                if next_filename is not None:
+                    pending.append((next_filename, executor.submit(download, domain, next_filename)))
+                
+                content = future.result()
+                if content:
+                    downloaded += 1
+                    yield filename, content
+        
+        logger.info(f"Downloaded {downloaded} files for domain {domain}")
+    
+    def download_many_domains(self, domains: List[str], limit: Optional[int] = None,
+                              as_bytes: bool = False) -> Iterator[Tuple[str, List[Tuple[str, Union[str, bytes]]]]]:
+        """
+        Download the markdown files of several domains, one domain at a time
+        
+        The next domain's file listing is fetched in the background while the
+        current domain downloads, so listing round trips overlap with downloads
+        instead of adding to them. Yielding per domain keeps only one domain's
+        files in memory.
+        
+        Args:
+            domains: Domain names, in the order to download them
+            limit: Optional limit on number of files per domain
+            as_bytes: Return raw bytes instead of decoded text
+        
+        Yields:
+            (domain, files) tuples, where files is a list of (filename, content) tuples
+        """
+        if not domains:
+            return
+        
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            next_listing = prefetcher.submit(self.list_files_for_domain, domains[0])
+            
+            for index, domain in enumerate(domains):
+                # Wait for this domain's listing, then start listing the next one
+                files = next_listing.result()
+                if index + 1 < len(domains):
+                    next_listing = prefetcher.submit(self.list_files_for_domain, domains[index + 1])
+                
+                yield domain, list(self._iter_listed_files(domain, files, limit, as_bytes=as_bytes))
     
     def get_sample_domains(self, count: int = 5) -> List[str]:
         """
@@ -201,13 +494,23 @@ class StorageHandler:
             filename: File name
         
         Returns:
-            Metadata dictionary
+            Metadata dictionary (with size, etag and updated_at when the
+            domain's listing is cached)
         """
-        return {
+        metadata = {
             'domain': domain,
             'filename': filename,
             'path': f"{self.base_path}/{domain}/{filename}",
             'bucket': self.bucket,
             'url': f"https://{domain.replace('_', '.')}/{filename.replace('.md', '')}",
             'storage_path': f"supabase://{self.bucket}/{self.base_path}/{domain}/{filename}"
-        }
\ No newline at end of file
+        }
+        
+        # Add storage details from a cached listing; never list just for this
+        cached = self._get_cached_listing(('files', domain))
+        for record in cached or ():
+            if record['name'] == filename:
+                metadata.update(size=record['size'], etag=record['etag'], updated_at=record['updated_at'])
+                break
+        
+        return metadata
\ No newline at end of file
@@ -2,19 +2,22 @@
 Database module for vector storage and connections
 """
 
-from .connection import DatabaseConnection, get_database_connection
+from .connection import DatabaseConnection, DatabaseSession, get_database_connection
 from .vector_store import (
     BaseVectorStore,
     LocalPGVectorStore,
     SupabaseVectorStoreWrapper,
+    copy_document_vectors,
     create_vector_store
 )
 
 __all__ = [
     'DatabaseConnection',
+    'DatabaseSession',
     'get_database_connection',
     'BaseVectorStore',
     'LocalPGVectorStore',
     'SupabaseVectorStoreWrapper',
+    'copy_document_vectors',
     'create_vector_store'
 ]
\ No newline at end of file
@@ -4,16 +4,229 @@ Handles both local PostgreSQL and Supabase connections
 """
 
 import logging
-from typing import Optional, Dict, Any
+import threading
+from typing import Optional, Dict, Any, Set, List, Tuple
 from contextlib import contextmanager
+from itertools import groupby
 
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extensions import (
+    connection as PGConnection,
+    TRANSACTION_STATUS_IDLE,
+    TRANSACTION_STATUS_UNKNOWN,
+)
+from psycopg2.extras import RealDictCursor, execute_batch
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+from pgvector.psycopg2 import register_vector
 from supabase import create_client, Client
 from src.core.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Connections each PostgreSQL pool (one per database URI) opens up front; it
+# grows on demand to DatabaseSettings.pool_max_connections and keeps that many
+POOL_MIN_CONNECTIONS = 2
+
+# TCP keepalives stand in for a pre-ping: the OS probes idle pooled sockets
+# instead of every checkout paying for an extra query round trip
+POOL_KEEPALIVES = {
+    'keepalives': 1,
+    'keepalives_idle': 30,
+    'keepalives_interval': 10,
+    'keepalives_count': 5,
+}
+
+# Statements sent per round trip by DatabaseSession.execute_batch
+BATCH_PAGE_SIZE = 100
+
+
+class PooledConnection(PGConnection):
+    """psycopg2 connection that remembers per-connection setup done on it"""
+    
+    # Set once pgvector types have been registered on this connection
+    vector_registered = False
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Names of server-side prepared statements created on this session
+        self.prepared_statements: Set[str] = set()
+
+
+class BlockingConnectionPool(ThreadedConnectionPool):
+    """
+    ThreadedConnectionPool that waits for a free connection instead of raising
+
+    Returned connections stay open up to maxconn. psycopg2 closes every
+    connection returned beyond minconn, which under concurrent searches means
+    reconnecting (and redoing pgvector registration and PREPAREs) on most
+    checkouts.
+    """
+    
+    def __init__(self, minconn: int, maxconn: int, *args, **kwargs):
+        self._slots = threading.BoundedSemaphore(maxconn)
+        super().__init__(minconn, maxconn, *args, **kwargs)
+    
+    def getconn(self, key=None):
+        self._slots.acquire()
+        try:
+            return super().getconn(key)
+        except Exception:
+            self._slots.release()
+            raise
+    
+    def putconn(self, conn=None, key=None, close=False):
+        with self._lock:
+            if key is None:
+                key = self._rused.get(id(conn))
+            # A connection this pool did not hand out (unknown or already
+            # returned) holds no slot, so rejecting it must not free one
+            if key is None or key not in self._used:
+                raise PoolError("trying to put unkeyed connection")
+            try:
+                self._putconn(conn, key, close)
+            finally:
+                # Always free the slot of a connection we handed out, or a
+                # failed return would shrink the pool for good
+                self._slots.release()
+    
+    def _putconn(self, conn, key=None, close=False):
+        """Put away a connection, keeping it open unless maxconn are already idle"""
+        if self.closed:
+            raise PoolError("connection pool is closed")
+
+        if key is None:
+            key = self._rused.get(id(conn))
+            if key is None:
+                raise PoolError("trying to put unkeyed connection")
+
+        try:
+            if close or conn.closed or len(self._pool) >= self.maxconn:
+                conn.close()
+            else:
+                status = conn.info.transaction_status
+                if status == TRANSACTION_STATUS_UNKNOWN:
+                    # Server connection lost
+                    conn.close()
+                else:
+                    if status != TRANSACTION_STATUS_IDLE:
+                        # Connection in error or in a transaction
+                        conn.rollback()
+                    self._pool.append(conn)
+        except Exception as e:
+            # Could not reset it (e.g. the rollback failed): drop it instead
+            logger.warning(f"Discarding pooled connection that could not be reset: {e}")
+            conn.close()
+        finally:
+            del self._used[key]
+            del self._rused[id(conn)]
+
+
+_pools: Dict[str, BlockingConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_connection_pool(db_uri: str) -> BlockingConnectionPool:
+    """
+    Get or create the shared connection pool for a database URI
+    
+    Args:
+        db_uri: PostgreSQL connection string
+    
+    Returns:
+        Connection pool for that database
+    """
+    pool = _pools.get(db_uri)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(db_uri)
+            if pool is None:
+                max_connections = max(get_settings().database.pool_max_connections, 1)
+                pool = BlockingConnectionPool(
+                    min(POOL_MIN_CONNECTIONS, max_connections),
+                    max_connections,
+                    dsn=db_uri,
+                    connection_factory=PooledConnection,
+                    **POOL_KEEPALIVES
+                )
+                _pools[db_uri] = pool
+                logger.info(f"Created PostgreSQL connection pool (up to {max_connections} connections, kept open)")
+    return pool
+
+
+@contextmanager
+def pooled_connection(db_uri: str, register_vectors: bool = False):
+    """
+    Check a connection out of the shared pool for a database URI
+    
+    Args:
+        db_uri: PostgreSQL connection string
+        register_vectors: Register pgvector types on the connection
+            (done once per physical connection)
+    
+    Yields:
+        PooledConnection, returned to the pool on exit
+    """
+    pool = get_connection_pool(db_uri)
+    conn = pool.getconn()
+    
+    # Replace a connection the server has closed while it sat in the pool
+    if conn.closed:
+        pool.putconn(conn, close=True)
+        conn = pool.getconn()
+    
+    discard = False
+    try:
+        if register_vectors and not conn.vector_registered:
+            register_vector(conn)
+            conn.vector_registered = True
+        yield conn
+    except (psycopg2.OperationalError, psycopg2.InterfaceError):
+        # Broken socket or session: close it rather than recycle it
+        discard = True
+        raise
+    finally:
+        pool.putconn(conn, close=discard or bool(conn.closed))
+
+
+class DatabaseSession:
+    """One pooled connection and cursor reused across several statements"""
+    
+    def __init__(self, conn, cur):
+        self.conn = conn
+        self.cur = cur
+    
+    def execute(self, query: str, params: tuple = None, fetch: bool = True) -> Any:
+        """
+        Execute a query on the session's connection
+
+        Args:
+            query: SQL query to execute
+            params: Query parameters
+            fetch: Whether to fetch results
+
+        Returns:
+            Query results if fetch=True, otherwise row count
+        """
+        self.cur.execute(query, params)
+        return self.cur.fetchall() if fetch else self.cur.rowcount
+    
+    def execute_batch(self, statements: List[Tuple[str, tuple]]) -> int:
+        """
+        Execute parameterized statements, BATCH_PAGE_SIZE per round trip
+
+        Consecutive statements sharing the same SQL are sent together with
+        psycopg2's execute_batch instead of one round trip each.
+
+        Args:
+            statements: (query, params) pairs, executed in order
+
+        Returns:
+            Number of statements executed
+        """
+        for query, group in groupby(statements, key=lambda statement: statement[0]):
+            execute_batch(self.cur, query, [params for _, params in group], page_size=BATCH_PAGE_SIZE)
+        return len(statements)
+
 
 class DatabaseConnection:
     """Manages database connections for the application"""
@@ -50,18 +263,16 @@ class DatabaseConnection:
         """Get Supabase client if available"""
         return self.supabase_client
     
-    @contextmanager
-    def get_postgres_connection(self, cursor_factory=None):
+    def get_postgres_uri(self) -> str:
         """
-        Get PostgreSQL connection context manager
-
-        Args:
-            cursor_factory: Optional cursor factory (e.g., RealDictCursor)
-
-        Yields:
-            tuple: (connection, cursor)
+        Get the PostgreSQL connection string for the active database
+        
+        Returns:
+            Local database URI if available, otherwise the Supabase database URI
+        
+        Raises:
+            ValueError: If the relevant URI is not configured
         """
-        # Use local database if available, otherwise use Supabase database URI
         if self.use_local:
             db_uri = self.local_db_url
             if not db_uri:
@@ -70,18 +281,73 @@ class DatabaseConnection:
             db_uri = self.settings.database.supabase_database_uri
             if not db_uri:
                 raise ValueError("SUPABASE_DATABASE_URI not set")
+        return db_uri
+    
+    @contextmanager
+    def get_pooled_conn(self, register_vectors: bool = False):
+        """
+        Get a pooled PostgreSQL connection context manager
 
-        conn = None
-        cur = None
-        try:
-            conn = psycopg2.connect(db_uri)
+        Args:
+            register_vectors: Register pgvector types on the connection
+
+        Yields:
+            Connection checked out of the shared pool
+        """
+        with pooled_connection(self.get_postgres_uri(), register_vectors) as conn:
+            yield conn
+    
+    @contextmanager
+    def get_postgres_connection(self, cursor_factory=None):
+        """
+        Get PostgreSQL connection context manager
+
+        Args:
+            cursor_factory: Optional cursor factory (e.g., RealDictCursor)
+
+        Yields:
+            tuple: (connection, cursor)
+        """
+        with self.get_pooled_conn() as conn:
             cur = conn.cursor(cursor_factory=cursor_factory) if cursor_factory else conn.cursor()
-            yield conn, cur
-        finally:
-            if cur:
+            try:
+                yield conn, cur
+            finally:
                 cur.close()
-            if conn:
-                conn.close()
+    
+    @contextmanager
+    def session(self, cursor_factory=None):
+        """
+        Run several statements on one pooled connection and transaction
+
+        Commits when the block exits normally and rolls back on error.
+
+        Args:
+            cursor_factory: Optional cursor factory (e.g., RealDictCursor)
+
+        Yields:
+            DatabaseSession bound to the checked-out connection
+        """
+        with self.get_postgres_connection(cursor_factory) as (conn, cur):
+            try:
+                yield DatabaseSession(conn, cur)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+    
+    def execute_batch(self, statements: List[Tuple[str, tuple]]) -> int:
+        """
+        Execute parameterized statements in a single transaction
+
+        Args:
+            statements: (query, params) pairs, executed in order
+
+        Returns:
+            Number of statements executed
+        """
+        with self.session() as session:
+            return session.execute_batch(statements)
     
     def execute_query(self, query: str, params: tuple = None, fetch: bool = True) -> Any:
         """
@@ -120,6 +386,7 @@ class DatabaseConnection:
 
 # Global instance for shared use
 _db_connection = None
+_db_connection_lock = threading.Lock()
 
 def get_database_connection() -> DatabaseConnection:
     """
@@ -130,5 +397,7 @@ def get_database_connection() -> DatabaseConnection:
     """
     global _db_connection
     if _db_connection is None:
-        _db_connection = DatabaseConnection()
+        with _db_connection_lock:
+            if _db_connection is None:
+                _db_connection = DatabaseConnection()
     return _db_connection
\ No newline at end of file
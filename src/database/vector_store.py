@@ -3,19 +3,415 @@ Vector store implementations for document embeddings
 Supports both local PostgreSQL with pgvector and Supabase
 """
 
+import csv
+import hashlib
+import io
+import itertools
+import json
 import logging
-from typing import List, Dict, Any, Optional
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Iterable, List, Dict, Any, Optional, Tuple, FrozenSet
 from abc import ABC, abstractmethod
 
-import numpy as np
-import psycopg2
-from pgvector.psycopg2 import register_vector
 from langchain.schema import Document
 from langchain_community.vectorstores import SupabaseVectorStore
 from src.core.settings import get_settings
+from .connection import pooled_connection
 
 logger = logging.getLogger(__name__)
 
+# Map boost fields to their count fields (both are document_vectors columns)
+BOOST_FIELD_MAPPING = {
+    'contains_addresses': 'address_count',
+    'contains_money': 'money_count',
+    'contains_emails': 'email_count',
+    'contains_phone_numbers': 'phone_count',
+    'contains_contact': 'contact_count'  # Combined emails + phones
+}
+
+# Width of the stored embeddings (document_vectors.embedding is vector(768));
+# the half-precision index expression has to name it explicitly
+EMBEDDING_DIMENSION = 768
+
+# Upper bound pgvector accepts for hnsw.ef_search
+HNSW_MAX_EF_SEARCH = 1000
+
+# Rows sent per COPY when bulk loading document vectors
+COPY_BATCH_SIZE = 10000
+
+# Number of query embeddings kept in memory, shared by all vector stores
+EMBED_CACHE_SIZE = 1024
+
+_embed_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, ...]]" = OrderedDict()
+_embed_cache_lock = threading.RLock()
+
+
+def _embed_query(embeddings, query: str) -> Tuple[float, ...]:
+    """
+    Embed a search query, reusing the embedding of a repeated query
+
+    Extractors search with the same fixed queries for every domain, so most
+    searches can skip the round trip to the embedding model.
+
+    Args:
+        embeddings: Embeddings model instance
+        query: Query text
+
+    Returns:
+        Query embedding
+    """
+    # Key on the model too so swapping models never returns stale vectors
+    key = (type(embeddings).__name__, getattr(embeddings, 'model', None), query)
+    with _embed_cache_lock:
+        embedding = _embed_cache.get(key)
+        if embedding is not None:
+            _embed_cache.move_to_end(key)
+            return embedding
+
+    embedding = tuple(embeddings.embed_query(query))
+
+    with _embed_cache_lock:
+        _embed_cache[key] = embedding
+        _embed_cache.move_to_end(key)
+        while len(_embed_cache) > EMBED_CACHE_SIZE:
+            _embed_cache.popitem(last=False)
+    return embedding
+
+
+def _embed_queries(embeddings, queries: List[str]) -> List[Tuple[float, ...]]:
+    """
+    Embed several search queries with one call to the embedding model
+
+    Queries already in the query embedding cache are not sent again. The
+    rest go through embed_documents as one batch, which for Ollama embeddings
+    returns the same vectors as embed_query one at a time.
+
+    Args:
+        embeddings: Embeddings model instance
+        queries: Query texts
+
+    Returns:
+        Query embeddings, in the order of the queries
+    """
+    model_key = (type(embeddings).__name__, getattr(embeddings, 'model', None))
+    found: Dict[str, Tuple[float, ...]] = {}
+    with _embed_cache_lock:
+        for query in queries:
+            embedding = _embed_cache.get((*model_key, query))
+            if embedding is not None:
+                _embed_cache.move_to_end((*model_key, query))
+                found[query] = embedding
+
+    missing = list(dict.fromkeys(query for query in queries if query not in found))
+    if missing:
+        for query, embedding in zip(missing, embeddings.embed_documents(missing)):
+            found[query] = tuple(embedding)
+        with _embed_cache_lock:
+            for query in missing:
+                _embed_cache[(*model_key, query)] = found[query]
+                _embed_cache.move_to_end((*model_key, query))
+            while len(_embed_cache) > EMBED_CACHE_SIZE:
+                _embed_cache.popitem(last=False)
+    return [found[query] for query in queries]
+
+
+def _filter_params(filter: Optional[Dict]) -> Tuple[Optional[str], tuple]:
+    """
+    Pick the filter column and parameters for a search filter
+
+    Args:
+        filter: Optional filter dict with 'domain_id' or 'document_id'
+
+    Returns:
+        Tuple of (filter column or None, query parameters)
+    """
+    if filter and 'domain_id' in filter:
+        return 'domain_id', (filter['domain_id'],)
+    if filter and 'document_id' in filter:
+        return 'document_id', (filter['document_id'],)
+    return None, ()
+
+
+def _vector_literal(embedding: List[float]) -> str:
+    """
+    Format an embedding as a pgvector text literal
+
+    Passing the literal as a plain string parameter skips the numpy array
+    conversion and the adapter's per-element formatting on every search.
+
+    Args:
+        embedding: Embedding values
+
+    Returns:
+        Literal such as '[0.1,0.2,0.3]'
+    """
+    return '[' + ','.join(map(str, embedding)) + ']'
+
+
+@lru_cache(maxsize=None)
+def _metadata_projection(fields: Optional[FrozenSet[str]]) -> str:
+    """
+    Build the SELECT expression for the metadata column of a search
+
+    Args:
+        fields: Metadata keys to return, or None for the whole metadata object
+
+    Returns:
+        SQL expression over d.metadata
+    """
+    if fields is None:
+        return "d.metadata"
+    pairs = []
+    for field in sorted(fields):
+        # Quote as a SQL literal; % is doubled since the query goes through psycopg2 formatting
+        literal = "'" + field.replace("'", "''").replace("%", "%%") + "'"
+        pairs.append(f"{literal}, d.metadata->{literal}")
+    return f"jsonb_build_object({', '.join(pairs)})"
+
+
+@lru_cache(maxsize=None)
+def _search_sql(filter_column: Optional[str], boost_field: Optional[str] = None,
+                fields: Optional[FrozenSet[str]] = None) -> str:
+    """
+    Render the SQL for one search shape (built once per combination)
+
+    WORKAROUND: PostgreSQL query planner issue with pgvector
+    When using WHERE + ORDER BY <=> + small LIMIT, the planner may choose
+    an inefficient index scan that returns 0 results. The candidates CTE
+    therefore ranks more rows than needed (the first LIMIT) by id only, and
+    the outer query joins back for the content of just the top k. Plain
+    similarity ranks the candidates on the half-precision copy of the
+    embedding and recomputes the full-precision distance for the final order.
+
+    Args:
+        filter_column: 'domain_id', 'document_id' or None for no filter
+        boost_field: Metadata flag to rank first (a BOOST_FIELD_MAPPING key),
+            or None for plain similarity order
+        fields: Metadata keys to return, or None for all metadata
+
+    Returns:
+        Query taking (embedding, [filter value], candidate limit, k); the plain
+        similarity query takes the embedding again before k for the rerank,
+        and the unfiltered boosted query takes (embedding, candidate limit,
+        embedding, k, k) for its flagged and unflagged scans
+    """
+    where_clause = f"WHERE {filter_column} = %s" if filter_column else ""
+    metadata_column = _metadata_projection(fields)
+
+    if boost_field is None:
+        # Shortlist on half-precision distance (matches the halfvec HNSW index
+        # expression), then rerank the shortlist on the full-precision vectors
+        return f"""
+    WITH candidates AS (
+        SELECT id
+        FROM document_vectors
+        {where_clause}
+        ORDER BY embedding::halfvec({EMBEDDING_DIMENSION}) <=> %s::halfvec({EMBEDDING_DIMENSION})
+        LIMIT %s
+    )
+    SELECT d.id, d.content, {metadata_column}, d.embedding <=> %s::vector as distance
+    FROM candidates c
+    JOIN document_vectors d USING (id)
+    ORDER BY distance
+    LIMIT %s
+    """
+
+    # Boost flags and counts are generated columns (see
+    # sql/migrations/add_metadata_boost_columns.sql), so ranking reads stored
+    # values instead of parsing each candidate's metadata JSON
+    count_field = BOOST_FIELD_MAPPING[boost_field]
+
+    if filter_column is None:
+        # Without a filter, flagged and unflagged chunks each take their own
+        # nearest-neighbour scan: flagged ones through the partial HNSW index
+        # on the flag, the rest only as filler when fewer than k are flagged
+        return f"""
+    WITH flagged AS (
+        SELECT id, embedding <=> %s::vector as distance, {count_field} as boost_count
+        FROM document_vectors
+        WHERE {boost_field}
+        ORDER BY distance
+        LIMIT %s
+    ), unflagged AS (
+        SELECT id, embedding <=> %s::vector as distance, {count_field} as boost_count
+        FROM document_vectors
+        WHERE NOT {boost_field}
+        ORDER BY distance
+        LIMIT %s
+    ), candidates AS (
+        SELECT id, distance, true as boost_flag, boost_count FROM flagged
+        UNION ALL
+        SELECT id, distance, false as boost_flag, boost_count FROM unflagged
+    )
+    SELECT d.id, d.content, {metadata_column}, c.distance
+    FROM candidates c
+    JOIN document_vectors d USING (id)
+    ORDER BY c.boost_flag DESC, c.boost_count DESC, c.distance
+    LIMIT %s
+    """
+
+    # A domain or document filter narrows the rows through its btree index
+    # first, so ranking that small set directly beats a post-filtered ANN scan
+    return f"""
+    WITH candidates AS (
+        SELECT id,
+               embedding <=> %s::vector as distance,
+               {boost_field} as boost_flag,
+               {count_field} as boost_count
+        FROM document_vectors
+        {where_clause}
+        ORDER BY boost_flag DESC, boost_count DESC, distance
+        LIMIT %s
+    )
+    SELECT d.id, d.content, {metadata_column}, c.distance
+    FROM candidates c
+    JOIN document_vectors d USING (id)
+    ORDER BY c.boost_flag DESC, c.boost_count DESC, c.distance
+    LIMIT %s
+    """
+
+
+@lru_cache(maxsize=None)
+def _batch_search_sql(filter_column: Optional[str], fields: Optional[FrozenSet[str]] = None) -> str:
+    """
+    Render the SQL that runs a plain similarity search for several queries
+
+    Each query embedding gets the same half-precision shortlist and
+    full-precision rerank as _search_sql, through a LATERAL subquery, so the
+    whole batch is one statement and one round trip. The embeddings arrive
+    as a text[] of pgvector literals (psycopg2 sends a list of strings as
+    text[], which a prepared vector[] parameter would not accept) and are
+    cast per element.
+
+    Args:
+        filter_column: 'domain_id', 'document_id' or None for no filter
+        fields: Metadata keys to return, or None for all metadata
+
+    Returns:
+        Query taking (embedding literal array, [filter value], candidate
+        limit, k) and returning (query position, id, content, metadata,
+        distance) rows
+    """
+    where_clause = f"WHERE {filter_column} = %s" if filter_column else ""
+    metadata_column = _metadata_projection(fields)
+
+    return f"""
+    SELECT q.ord, r.id, r.content, r.metadata, r.distance
+    FROM unnest(%s::text[]) WITH ORDINALITY AS q(embedding, ord)
+    CROSS JOIN LATERAL (
+        SELECT d.id, d.content, {metadata_column} as metadata, d.embedding <=> q.embedding::vector as distance
+        FROM (
+            SELECT id
+            FROM document_vectors
+            {where_clause}
+            ORDER BY embedding::halfvec({EMBEDDING_DIMENSION}) <=> q.embedding::halfvec({EMBEDDING_DIMENSION})
+            LIMIT %s
+        ) c
+        JOIN document_vectors d USING (id)
+        ORDER BY distance
+        LIMIT %s
+    ) r
+    ORDER BY q.ord, r.distance
+    """
+
+
+@lru_cache(maxsize=None)
+def _prepared_statement(sql: str) -> Tuple[str, str]:
+    """
+    Turn a psycopg2-style query into a server-side prepared statement
+
+    Args:
+        sql: Query with %s placeholders
+
+    Returns:
+        Tuple of (statement name, statement body with $n placeholders)
+    """
+    counter = itertools.count(1)
+    body = re.sub(r'%[s%]', lambda m: '%' if m.group() == '%%' else f"${next(counter)}", sql)
+    name = "vs_" + hashlib.md5(sql.encode()).hexdigest()[:16]
+    return name, body
+
+
+def _execute_search(cur, sql: str, params: tuple, prepare: bool = True,
+                    ef_search: Optional[int] = None) -> None:
+    """
+    Run a search query, as a named prepared statement when enabled
+
+    The statement is prepared once per pooled connection, so Postgres parses
+    and plans each query shape once per session instead of once per search.
+
+    Args:
+        cur: Cursor on a pooled connection
+        sql: Query with %s placeholders
+        params: Query parameters
+        prepare: Use a prepared statement (disable behind transaction poolers)
+        ef_search: HNSW candidate list size for this transaction; an HNSW scan
+            returns at most this many rows, so it must cover the query's LIMIT
+    """
+    # Sent in the same round trip as the query; SET LOCAL ends with the
+    # transaction, which the pool rolls back when the connection is returned
+    prefix, prefix_params = "", ()
+    if ef_search:
+        prefix, prefix_params = "SET LOCAL hnsw.ef_search = %s; ", (min(ef_search, HNSW_MAX_EF_SEARCH),)
+
+    if not prepare:
+        cur.execute(prefix + sql, prefix_params + tuple(params))
+        return
+
+    name, body = _prepared_statement(sql)
+    prepared = cur.connection.prepared_statements
+    if name not in prepared:
+        cur.execute(f"PREPARE {name} AS {body}")
+        prepared.add(name)
+    cur.execute(f"{prefix}EXECUTE {name} ({', '.join(['%s'] * len(params))})", prefix_params + tuple(params))
+
+
+def copy_document_vectors(cur, rows: Iterable[Tuple[str, str, Dict, List[float], Optional[str], Optional[str]]]) -> int:
+    """
+    Bulk load chunk rows into document_vectors with COPY
+
+    COPY skips the per-row parse, plan and round trip of INSERT statements.
+    Rows are sent in batches of COPY_BATCH_SIZE to bound memory. The caller
+    owns the transaction and commits.
+
+    Args:
+        cur: Cursor on an open PostgreSQL connection
+        rows: (document_id, content, metadata, embedding, domain, domain_id) tuples
+
+    Returns:
+        Number of rows loaded
+    """
+    sql = """
+    COPY document_vectors (document_id, content, metadata, embedding, domain, domain_id)
+    FROM STDIN WITH (FORMAT csv, FORCE_NULL (domain, domain_id))
+    """
+    total = 0
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, COPY_BATCH_SIZE))
+        if not batch:
+            return total
+
+        # Every field is quoted; FORCE_NULL reads an empty domain or domain_id
+        # (None) back as NULL
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC, lineterminator='\n')
+        for document_id, content, metadata, embedding, domain, domain_id in batch:
+            writer.writerow((
+                document_id,
+                content,
+                json.dumps(metadata),
+                _vector_literal(embedding),
+                domain,
+                domain_id
+            ))
+        buffer.seek(0)
+        cur.copy_expert(sql, buffer)
+        total += len(batch)
+
 
 class BaseVectorStore(ABC):
     """Abstract base class for vector stores"""
@@ -34,19 +430,22 @@ class BaseVectorStore(ABC):
 class LocalPGVectorStore(BaseVectorStore):
     """PostgreSQL pgvector store for local development"""
     
-    def __init__(self, connection_string: str, embeddings):
+    def __init__(self, connection_string: str, embeddings, prepare_statements: bool = True):
         """
         Initialize local PostgreSQL vector store
         
         Args:
             connection_string: PostgreSQL connection string
             embeddings: Embeddings model instance
+            prepare_statements: Run searches as server-side prepared statements
         """
         self.conn_string = connection_string
         self.embeddings = embeddings
+        self.prepare_statements = prepare_statements
         logger.info("Initialized LocalPGVectorStore")
     
-    def similarity_search(self, query: str, k: int = 5, filter: Optional[Dict] = None) -> List[Document]:
+    def similarity_search(self, query: str, k: int = 5, filter: Optional[Dict] = None,
+                          projection: Optional[List[str]] = None) -> List[Document]:
         """
         Perform similarity search
 
@@ -54,72 +453,80 @@ class LocalPGVectorStore(BaseVectorStore):
             query: Query text
             k: Number of results to return
             filter: Optional filter dict with 'domain_id' or 'document_id'
+            projection: Optional metadata keys to return (default: all metadata)
 
         Returns:
             List of similar documents
         """
         # Generate embedding for query
-        query_embedding = self.embeddings.embed_query(query)
-        # Convert to numpy array for proper pgvector handling
-        query_embedding = np.array(query_embedding)
-
-        # Connect to database
-        conn = psycopg2.connect(self.conn_string)
-        # Register vector type for this connection
-        register_vector(conn)
-        cur = conn.cursor()
-
-        try:
-            # WORKAROUND: PostgreSQL query planner issue with pgvector
-            # When using WHERE + ORDER BY <=> + small LIMIT, the planner may choose
-            # an inefficient index scan that returns 0 results.
-            # Solution: Fetch more results than needed (min 100) and limit in Python
-            fetch_limit = max(k * 10, 100)
-
-            # Build SQL query with filter
-            if filter and 'domain_id' in filter:
-                sql = """
-                SELECT id, content, metadata, embedding <=> %s as distance
-                FROM document_vectors
-                WHERE domain_id = %s
-                ORDER BY distance
-                LIMIT %s
-                """
-                cur.execute(sql, (query_embedding, filter['domain_id'], fetch_limit))
-            elif filter and 'document_id' in filter:
-                sql = """
-                SELECT id, content, metadata, embedding <=> %s as distance
-                FROM document_vectors
-                WHERE document_id = %s
-                ORDER BY distance
-                LIMIT %s
-                """
-                cur.execute(sql, (query_embedding, filter['document_id'], fetch_limit))
-            else:
-                sql = """
-                SELECT id, content, metadata, embedding <=> %s as distance
-                FROM document_vectors
-                ORDER BY distance
-                LIMIT %s
-                """
-                cur.execute(sql, (query_embedding, fetch_limit))
-
-            results = cur.fetchall()
-            docs = []
-            # Only take the first k results
-            for row in results[:k]:
-                metadata = row[2] or {}
-                metadata['id'] = str(row[0])  # Add the ID to metadata
-                docs.append(Document(page_content=row[1], metadata=metadata))
-            return docs
-
-        finally:
-            cur.close()
-            conn.close()
+        query_embedding = _embed_query(self.embeddings, query)
+        # Format the pgvector literal once; the query casts it to halfvec and vector
+        query_embedding = _vector_literal(query_embedding)
+
+        # Check out a pooled connection (vector type registered once per connection)
+        with pooled_connection(self.conn_string, register_vectors=True) as conn:
+            cur = conn.cursor()
+            try:
+                # Oversample candidates to work around the pgvector planner issue
+                fetch_limit = max(k * 10, 100)
+                filter_column, filter_params = _filter_params(filter)
+                sql = _search_sql(filter_column, None, frozenset(projection) if projection else None)
+                _execute_search(cur, sql, (query_embedding, *filter_params, fetch_limit, query_embedding, k), self.prepare_statements, fetch_limit)
+
+                docs = []
+                for row in cur.fetchall():
+                    metadata = row[2] or {}
+                    metadata['id'] = str(row[0])  # Add the ID to metadata
+                    docs.append(Document(page_content=row[1], metadata=metadata))
+                return docs
+
+            finally:
+                cur.close()
+    
+    def similarity_search_batch(self, queries: List[str], k: int = 5, filter: Optional[Dict] = None,
+                                projection: Optional[List[str]] = None) -> List[List[Document]]:
+        """
+        Perform similarity search for several queries at once
+
+        The queries are embedded in one model call and searched in one SQL
+        statement, instead of a round trip of each per query.
+
+        Args:
+            queries: Query texts
+            k: Number of results to return per query
+            filter: Optional filter dict with 'domain_id' or 'document_id'
+            projection: Optional metadata keys to return (default: all metadata)
+
+        Returns:
+            List of similar documents for each query, in query order
+        """
+        if not queries:
+            return []
+
+        query_embeddings = [_vector_literal(embedding) for embedding in _embed_queries(self.embeddings, queries)]
+
+        with pooled_connection(self.conn_string, register_vectors=True) as conn:
+            cur = conn.cursor()
+            try:
+                fetch_limit = max(k * 10, 100)
+                filter_column, filter_params = _filter_params(filter)
+                sql = _batch_search_sql(filter_column, frozenset(projection) if projection else None)
+                _execute_search(cur, sql, (query_embeddings, *filter_params, fetch_limit, k), self.prepare_statements, fetch_limit)
+
+                results: List[List[Document]] = [[] for _ in queries]
+                for row in cur.fetchall():
+                    metadata = row[3] or {}
+                    metadata['id'] = str(row[1])  # Add the ID to metadata
+                    results[row[0] - 1].append(Document(page_content=row[2], metadata=metadata))
+                return results
+
+            finally:
+                cur.close()
     
     def similarity_search_with_metadata_boost(self, query: str, k: int = 5,
                                             filter: Optional[Dict] = None,
-                                            boost_field: Optional[str] = None) -> List[Document]:
+                                            boost_field: Optional[str] = None,
+                                            projection: Optional[List[str]] = None) -> List[Document]:
         """
         Search with metadata boosting for better retrieval
 
@@ -128,76 +535,40 @@ class LocalPGVectorStore(BaseVectorStore):
             k: Number of results
             filter: Optional filter
             boost_field: Metadata field to boost (e.g., 'contains_addresses', 'contains_money', 'contains_emails', 'contains_phone_numbers')
+            projection: Optional metadata keys to return (default: all metadata)
 
         Returns:
             List of documents sorted by boost field then similarity
         """
-        # Generate embedding for query
-        query_embedding = self.embeddings.embed_query(query)
-        # Convert to numpy array for proper pgvector handling
-        query_embedding = np.array(query_embedding)
-
-        # Connect to database
-        conn = psycopg2.connect(self.conn_string)
-        # Register vector type for this connection
-        register_vector(conn)
-        cur = conn.cursor()
-
-        try:
-            # Map boost fields to their count fields
-            boost_field_mapping = {
-                'contains_addresses': 'address_count',
-                'contains_money': 'money_count',
-                'contains_emails': 'email_count',
-                'contains_phone_numbers': 'phone_count',
-                'contains_contact': 'contact_count'  # Combined emails + phones
-            }
+        # Without a boost field this is a regular search
+        if not boost_field:
+            return self.similarity_search(query, k, filter, projection)
+        if boost_field not in BOOST_FIELD_MAPPING:
+            raise ValueError(f"Unknown boost field: {boost_field}")
+        count_field = BOOST_FIELD_MAPPING[boost_field]
 
-            # If boost field is specified and we have a mapping for it
-            if boost_field and boost_field in boost_field_mapping:
-                count_field = boost_field_mapping[boost_field]
+        # Generate embedding for query
+        query_embedding = _embed_query(self.embeddings, query)
+        # Format the pgvector literal once; the query casts it to vector
+        query_embedding = _vector_literal(query_embedding)
 
-                # WORKAROUND: Same query planner issue - fetch more and limit in Python
+        # Check out a pooled connection (vector type registered once per connection)
+        with pooled_connection(self.conn_string, register_vectors=True) as conn:
+            cur = conn.cursor()
+            try:
+                # Oversample candidates to work around the pgvector planner issue
                 fetch_limit = max(k * 10, 100)
-
-                # Build SQL with dynamic field names
-                order_clause = f"""
-                    CASE WHEN metadata->>'{boost_field}' = 'true' THEN 0 ELSE 1 END,
-                    CAST(COALESCE(metadata->>'{count_field}', '0') AS INTEGER) DESC,
-                    embedding <=> %s::vector
-                """
-
-                if filter and 'domain_id' in filter:
-                    sql = f"""
-                    SELECT id, content, metadata, embedding <=> %s::vector as distance
-                    FROM document_vectors
-                    WHERE domain_id = %s
-                    ORDER BY {order_clause}
-                    LIMIT %s
-                    """
-                    cur.execute(sql, (query_embedding, filter['domain_id'], query_embedding, fetch_limit))
-                elif filter and 'document_id' in filter:
-                    sql = f"""
-                    SELECT id, content, metadata, embedding <=> %s::vector as distance
-                    FROM document_vectors
-                    WHERE document_id = %s
-                    ORDER BY {order_clause}
-                    LIMIT %s
-                    """
-                    cur.execute(sql, (query_embedding, filter['document_id'], query_embedding, fetch_limit))
+                filter_column, filter_params = _filter_params(filter)
+                sql = _search_sql(filter_column, boost_field, frozenset(projection) if projection else None)
+                if filter_column is None:
+                    # Separate scans of flagged and unflagged chunks (partial HNSW index)
+                    _execute_search(cur, sql, (query_embedding, fetch_limit, query_embedding, k, k),
+                                    self.prepare_statements, fetch_limit)
                 else:
-                    sql = f"""
-                    SELECT id, content, metadata, embedding <=> %s::vector as distance
-                    FROM document_vectors
-                    ORDER BY {order_clause}
-                    LIMIT %s
-                    """
-                    cur.execute(sql, (query_embedding, query_embedding, fetch_limit))
-
-                results = cur.fetchall()
+                    _execute_search(cur, sql, (query_embedding, *filter_params, fetch_limit, k), self.prepare_statements)
+
                 docs = []
-                # Only take the first k results (workaround for query planner issue)
-                for row in results[:k]:
+                for row in cur.fetchall():
                     metadata = row[2] or {}
                     metadata['id'] = str(row[0])  # Add the ID to metadata
                     docs.append(Document(page_content=row[1], metadata=metadata))
@@ -210,20 +581,50 @@ class LocalPGVectorStore(BaseVectorStore):
 
                 return docs
 
-            # For other boost fields or no boost, use regular search
-            else:
-                return self.similarity_search(query, k, filter)
-
-        finally:
-            cur.close()
-            conn.close()
+            finally:
+                cur.close()
     
     def add_documents(self, documents: List[Document]) -> None:
         """
-        Add documents to vector store (not implemented for local store)
-        Documents should be added via DocumentEmbedder
+        Embed and bulk load already chunked documents
+
+        Each document's metadata must carry its document_id (as produced by
+        DocumentChunker); domain and domain_id are taken from it when present.
+
+        Args:
+            documents: Chunk documents to store
+
+        Raises:
+            ValueError: If a document has no document_id in its metadata
         """
-        raise NotImplementedError("Use DocumentEmbedder to add documents to local store")
+        if not documents:
+            return
+
+        for doc in documents:
+            if not doc.metadata.get('document_id'):
+                raise ValueError("Documents need a 'document_id' in their metadata")
+
+        # Embed every chunk in one call
+        embeddings = self.embeddings.embed_documents([doc.page_content for doc in documents])
+
+        rows = (
+            (
+                doc.metadata['document_id'],
+                doc.page_content,
+                doc.metadata,
+                embedding,
+                doc.metadata.get('domain'),
+                doc.metadata.get('domain_id')
+            )
+            for doc, embedding in zip(documents, embeddings)
+        )
+
+        with pooled_connection(self.conn_string) as conn:
+            with conn.cursor() as cur:
+                count = copy_document_vectors(cur, rows)
+            conn.commit()
+
+        logger.info(f"Added {count} documents to LocalPGVectorStore")
 
 
 class SupabaseVectorStoreWrapper(BaseVectorStore):
@@ -242,10 +643,8 @@ class SupabaseVectorStoreWrapper(BaseVectorStore):
         self.embeddings = embeddings
         self.table_name = table_name
         self.query_name = "match_documents"
-
-        # Get database URI for direct SQL access (for boosted search)
-        settings = get_settings()
-        self.db_uri = settings.database.supabase_database_uri
+        # Boosted search function (sql/migrations/add_match_documents_boosted.sql)
+        self.boosted_query_name = "match_documents_boosted"
 
         self.store = SupabaseVectorStore(
             client=client,
@@ -255,13 +654,19 @@ class SupabaseVectorStoreWrapper(BaseVectorStore):
         )
         logger.info("Initialized SupabaseVectorStore")
 
-    def similarity_search(self, query: str, k: int = 5, filter: Optional[Dict] = None) -> List[Document]:
-        """Perform similarity search with ID included in metadata"""
+    def similarity_search(self, query: str, k: int = 5, filter: Optional[Dict] = None,
+                          projection: Optional[List[str]] = None) -> List[Document]:
+        """
+        Perform similarity search with ID included in metadata
+
+        The match_documents RPC always returns the whole metadata object, so a
+        projection is applied after the fact here.
+        """
         # Generate embedding for query
-        query_embedding = self.embeddings.embed_query(query)
+        query_embedding = _embed_query(self.embeddings, query)
 
         # Call the match_documents RPC function directly
-        match_documents_params = {'query_embedding': query_embedding}
+        match_documents_params = {'query_embedding': list(query_embedding)}
         if filter:
             match_documents_params['filter'] = filter
 
@@ -274,6 +679,8 @@ class SupabaseVectorStoreWrapper(BaseVectorStore):
         docs = []
         for row in response.data:
             metadata = row.get('metadata') or {}
+            if projection:
+                metadata = {field: metadata.get(field) for field in projection}
             metadata['id'] = str(row['id'])  # Add the ID to metadata
             docs.append(Document(
                 page_content=row['content'],
@@ -282,9 +689,22 @@ class SupabaseVectorStoreWrapper(BaseVectorStore):
 
         return docs
 
+    def similarity_search_batch(self, queries: List[str], k: int = 5, filter: Optional[Dict] = None,
+                                projection: Optional[List[str]] = None) -> List[List[Document]]:
+        """
+        Perform similarity search for several queries
+
+        The queries are embedded in one model call; each search is still its
+        own match_documents RPC.
+        """
+        # Warm the query embedding cache so each search skips the model call
+        _embed_queries(self.embeddings, queries)
+        return [self.similarity_search(query, k, filter, projection) for query in queries]
+
     def similarity_search_with_metadata_boost(self, query: str, k: int = 5,
                                             filter: Optional[Dict] = None,
-                                            boost_field: Optional[str] = None) -> List[Document]:
+                                            boost_field: Optional[str] = None,
+                                            projection: Optional[List[str]] = None) -> List[Document]:
         """
         Search with metadata boosting for better retrieval (Supabase version)
 
@@ -293,94 +713,50 @@ class SupabaseVectorStoreWrapper(BaseVectorStore):
             k: Number of results
             filter: Optional filter
             boost_field: Metadata field to boost (e.g., 'contains_addresses', 'contains_money', 'contains_emails', 'contains_phone_numbers')
+            projection: Optional metadata keys to return (default: all metadata)
 
         Returns:
             List of documents sorted by boost field then similarity
         """
-        # Map boost fields to their count fields
-        boost_field_mapping = {
-            'contains_addresses': 'address_count',
-            'contains_money': 'money_count',
-            'contains_emails': 'email_count',
-            'contains_phone_numbers': 'phone_count',
-            'contains_contact': 'contact_count'  # Combined emails + phones
-        }
-
-        # If boost field is specified and we have a mapping for it
-        if boost_field and boost_field in boost_field_mapping:
-            count_field = boost_field_mapping[boost_field]
-
-            # Generate embedding for query
-            query_embedding = self.embeddings.embed_query(query)
-            # Convert to numpy array for proper pgvector handling
-            query_embedding = np.array(query_embedding)
-
-            # Connect to Supabase database directly
-            conn = psycopg2.connect(self.db_uri)
-            # Register vector type for this connection
-            register_vector(conn)
-            cur = conn.cursor()
+        # Without a boost field this is a regular search
+        if not boost_field:
+            return self.similarity_search(query, k, filter, projection)
+        if boost_field not in BOOST_FIELD_MAPPING:
+            raise ValueError(f"Unknown boost field: {boost_field}")
+        count_field = BOOST_FIELD_MAPPING[boost_field]
 
-            try:
-                # WORKAROUND: Same query planner issue - fetch more and limit in Python
-                fetch_limit = max(k * 10, 100)
+        # Generate embedding for query
+        query_embedding = _embed_query(self.embeddings, query)
 
-                # Build SQL with dynamic field names
-                order_clause = f"""
-                    CASE WHEN metadata->>'{boost_field}' = 'true' THEN 0 ELSE 1 END,
-                    CAST(COALESCE(metadata->>'{count_field}', '0') AS INTEGER) DESC,
-                    embedding <=> %s::vector
-                """
-
-                if filter and 'domain_id' in filter:
-                    sql = f"""
-                    SELECT id, content, metadata, embedding <=> %s::vector as distance
-                    FROM document_vectors
-                    WHERE domain_id = %s
-                    ORDER BY {order_clause}
-                    LIMIT %s
-                    """
-                    cur.execute(sql, (query_embedding, filter['domain_id'], query_embedding, fetch_limit))
-                elif filter and 'document_id' in filter:
-                    sql = f"""
-                    SELECT id, content, metadata, embedding <=> %s::vector as distance
-                    FROM document_vectors
-                    WHERE document_id = %s
-                    ORDER BY {order_clause}
-                    LIMIT %s
-                    """
-                    cur.execute(sql, (query_embedding, filter['document_id'], query_embedding, fetch_limit))
-                else:
-                    sql = f"""
-                    SELECT id, content, metadata, embedding <=> %s::vector as distance
-                    FROM document_vectors
-                    ORDER BY {order_clause}
-                    LIMIT %s
-                    """
-                    cur.execute(sql, (query_embedding, query_embedding, fetch_limit))
-
-                results = cur.fetchall()
-                docs = []
-                # Only take the first k results (workaround for query planner issue)
-                for row in results[:k]:
-                    metadata = row[2] or {}
-                    metadata['id'] = str(row[0])  # Add the ID to metadata
-                    docs.append(Document(page_content=row[1], metadata=metadata))
+        # Rank in the database with the boost-aware RPC (one round trip, no
+        # direct database connection); same candidate oversampling as LocalPG
+        filter_column, filter_params = _filter_params(filter)
+        response = self.client.rpc(
+            self.boosted_query_name,
+            {
+                'query_embedding': list(query_embedding),
+                'boost_field': boost_field,
+                'match_count': k,
+                'filter': {filter_column: filter_params[0]} if filter_column else {},
+                'candidate_count': max(k * 10, 100)
+            }
+        ).execute()
 
-                # Log what we retrieved
-                logger.info(f"Retrieved {len(docs)} chunks with {boost_field} boosting")
-                for i, doc in enumerate(docs[:3]):
-                    meta = doc.metadata
-                    logger.debug(f"Chunk {i}: {boost_field}={meta.get(boost_field)}, {count_field}={meta.get(count_field)}")
+        docs = []
+        for row in response.data:
+            metadata = row.get('metadata') or {}
+            if projection:
+                metadata = {field: metadata.get(field) for field in projection}
+            metadata['id'] = str(row['id'])  # Add the ID to metadata
+            docs.append(Document(page_content=row['content'], metadata=metadata))
 
-                return docs
+        # Log what we retrieved
+        logger.info(f"Retrieved {len(docs)} chunks with {boost_field} boosting")
+        for i, doc in enumerate(docs[:3]):
+            meta = doc.metadata
+            logger.debug(f"Chunk {i}: {boost_field}={meta.get(boost_field)}, {count_field}={meta.get(count_field)}")
 
-            finally:
-                cur.close()
-                conn.close()
-        else:
-            # For no boost field, use regular search
-            return self.similarity_search(query, k, filter)
+        return docs
 
     def add_documents(self, documents: List[Document]) -> None:
         """Add documents to store"""
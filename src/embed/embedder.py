@@ -4,15 +4,14 @@ Simplified to use new database and chunker modules
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import Iterable, List, Dict, Any, Optional
 from pathlib import Path
 
 from langchain_ollama import OllamaEmbeddings
-from psycopg2.extras import Json
 
 from ..core.storage_handler import StorageHandler
 from ..core.settings import get_settings, Settings
-from ..database import get_database_connection
+from ..database import copy_document_vectors, get_database_connection
 from .chunker import DocumentChunker
 
 logger = logging.getLogger(__name__)
@@ -120,17 +119,17 @@ class DocumentEmbedder:
             files = files[:max_files]
             logger.info(f"Limited to {max_files} files")
         
-        # Download and prepare documents
-        documents = []
-        for filename in files:
-            content = self.storage.download_file(domain, filename)
-            if content:
-                documents.append({
-                    'domain': domain,
-                    'filename': filename,
-                    'content': content,
-                    'document_id': f"{domain}/{filename}"
-                })
+        # Download and prepare documents lazily, so only a few files are
+        # held in memory while earlier ones are chunked and embedded
+        documents = (
+            {
+                'domain': domain,
+                'filename': filename,
+                'content': content,
+                'document_id': f"{domain}/{filename}"
+            }
+            for filename, content in self.storage.iter_domain_files(domain, files=files)
+        )
         
         return self._embed_documents(documents, force)
     
@@ -197,36 +196,45 @@ class DocumentEmbedder:
             logger.error(f"Clear failed: {str(e)}")
             return {'error': str(e)}
     
-    def _embed_documents(self, documents: List[Dict[str, Any]],
+    def _embed_documents(self, documents: Iterable[Dict[str, Any]],
                         force: bool = False) -> Dict[str, Any]:
         """
         Internal method to embed documents
 
+        Documents are consumed one at a time, so a lazy iterable keeps only
+        the current document's content in memory.
+
         Args:
-            documents: List of document dictionaries
+            documents: Document dictionaries (list or iterator)
             force: Whether to re-embed existing documents
 
         Returns:
             Embedding result summary
         """
-        logger.info(f"Processing {len(documents)} documents")
+        # Content-free records of the processed documents, for tracking
+        processed: List[Dict[str, Any]] = []
         
         try:
+            # One transaction for the whole batch, so a forced re-embed swaps a
+            # domain's vectors atomically. The trade-off is that the pooled
+            # connection stays open while documents are downloaded (a few
+            # files ahead, on the storage thread pool) and embedded.
             with self.db_conn.get_postgres_connection() as (conn, cur):
-                # Clear existing embeddings if force=True
-                if force:
-                    for doc in documents:
-                        cur.execute(
-                            "DELETE FROM document_vectors WHERE document_id = %s", 
-                            (doc['document_id'],)
-                        )
-                    if cur.rowcount > 0:
-                        logger.info(f"Cleared {cur.rowcount} existing embeddings")
-                
                 # Process each document
                 total_chunks = 0
+                cleared = 0
                 
                 for doc in documents:
+                    processed.append({key: doc[key] for key in ('domain', 'filename', 'document_id') if key in doc})
+                    
+                    # Clear existing embeddings if force=True
+                    if force:
+                        cur.execute(
+                            "DELETE FROM document_vectors WHERE document_id = %s", 
+                            (doc['document_id'],)
+                        )
+                        cleared += max(cur.rowcount, 0)
+                    
                     # Chunk the document
                     chunks = self.chunker.chunk_document(
                         content=doc['content'],
@@ -241,33 +249,27 @@ class DocumentEmbedder:
                     chunk_texts = [chunk.page_content for chunk in chunks]
                     chunk_embeddings = self.embeddings.embed_documents(chunk_texts)
                     
-                    # Store each chunk
-                    for chunk, embedding in zip(chunks, chunk_embeddings):
-                        # Convert embedding to PostgreSQL array format
-                        embedding_str = '[' + ','.join(map(str, embedding)) + ']'
-                        
-                        # Insert into database
-                        # Note: When force=True, we've already deleted existing embeddings
-                        # so we don't need ON CONFLICT. For safety, we'll use DO NOTHING
-                        # only if there's an id conflict (primary key)
-                        cur.execute("""
-                            INSERT INTO document_vectors 
-                            (document_id, content, metadata, embedding, 
-                             domain, domain_id, created_at, updated_at)
-                            VALUES (%s, %s, %s, %s::vector, %s, %s, NOW(), NOW())
-                        """, (
+                    # Store all chunks of the document with one COPY
+                    # Note: When force=True, we've already deleted existing embeddings
+                    copy_document_vectors(cur, (
+                        (
                             doc['document_id'],
                             chunk.page_content,
-                            Json(chunk.metadata),
-                            embedding_str,
+                            chunk.metadata,
+                            embedding,
                             doc['domain'],
                             chunk.metadata.get('domain_id')
-                        ))
+                        )
+                        for chunk, embedding in zip(chunks, chunk_embeddings)
+                    ))
                     
                     total_chunks += len(chunks)
                 
+                if cleared > 0:
+                    logger.info(f"Cleared {cleared} existing embeddings")
+                
                 conn.commit()
-                logger.info(f"✅ Embedded {total_chunks} chunks from {len(documents)} documents")
+                logger.info(f"✅ Embedded {total_chunks} chunks from {len(processed)} documents")
 
                 # Update domain_paths tracking if table exists
                 try:
@@ -280,7 +282,7 @@ class DocumentEmbedder:
                     """)
                     if cur.fetchone()[0]:
                         # Update tracking for each embedded document
-                        for doc in documents:
+                        for doc in processed:
                             # Extract path slug from filename, preserving subfolder structure
                             # e.g., "atlanta/mri-scan.md" -> "atlanta/mri-scan"
                             # e.g., "index.md" -> "index"
@@ -302,16 +304,16 @@ class DocumentEmbedder:
                                 logger.debug(f"Updated embedding tracking for {doc['domain']}/{path_slug}")
 
                         conn.commit()
-                        logger.info(f"Updated domain_paths tracking for {len(documents)} documents")
+                        logger.info(f"Updated domain_paths tracking for {len(processed)} documents")
                 except Exception as e:
                     logger.warning(f"Could not update domain_paths tracking: {e}")
                     # Don't fail the whole operation if tracking update fails
 
                 return {
                     'success': True,
-                    'documents_processed': len(documents),
+                    'documents_processed': len(processed),
                     'total_chunks': total_chunks,
-                    'domain': documents[0]['domain'] if documents else None
+                    'domain': processed[0]['domain'] if processed else None
                 }
                 
         except Exception as e:
@@ -319,7 +321,7 @@ class DocumentEmbedder:
             return {
                 'success': False,
                 'error': str(e),
-                'documents': len(documents)
+                'documents': len(processed)
             }
     
     def _extract_domain_from_filename(self, filename: str) -> str:
@@ -8,12 +8,14 @@ import os
 import re
 import requests
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, ClassVar
+from functools import lru_cache
+from typing import Dict, Any, Optional, ClassVar, Tuple
 from enum import Enum
 from pathlib import Path
 from datetime import datetime
 import hashlib
 
+import orjson
 from langchain_ollama import OllamaLLM, OllamaEmbeddings
 from supabase import Client
 
@@ -26,6 +28,26 @@ from ..llm import get_llm_provider, LLMProvider
 logger = logging.getLogger(__name__)
 
 
+def _json_loads(data):
+    """
+    Parse JSON with orjson, falling back to json for what orjson rejects
+
+    orjson refuses the NaN/Infinity literals that json accepts and that LLM
+    responses sometimes contain; json still raises json.JSONDecodeError on
+    input that is not JSON at all.
+    """
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
+@lru_cache(maxsize=None)
+def _parse_schema(schema_text: str) -> Dict[str, Any]:
+    """Parse an extractor schema once per distinct file content (shared; do not mutate)"""
+    return _json_loads(schema_text)
+
+
 class BaseExtractor(ABC):
     """Base class with shared LLM, schema support, and API request storage"""
 
@@ -35,6 +57,9 @@ class BaseExtractor(ABC):
     # Cache for config modules
     _config_cache: ClassVar[Dict[str, Any]] = {}
 
+    # Per-extractor prompt files, read through the shared prompt cache
+    _extractor_prompts: ClassVar[PromptTemplates] = PromptTemplates(Path(__file__).parent / "extractors")
+
     def __init__(self, settings: Settings = None, supabase_client: Optional[Client] = None):
         """
         Initialize enhanced extractor with shared components
@@ -134,22 +159,18 @@ class BaseExtractor(ABC):
 
         return content
 
-    def _load_prompt(self) -> str:
+    def _load_prompt_parts(self) -> Tuple[str, ...]:
         """
-        Load the prompt template for this extractor from its directory
+        Load the prompt template pre-split around {content}
 
         Returns:
-            Prompt template string
+            Template pieces to join with the content
         """
-        # Find the extractor's directory
-        extractor_dir = Path(__file__).parent / "extractors" / self.extraction_name
-        prompt_file = extractor_dir / "prompt.md"
-
-        if not prompt_file.exists():
-            logger.error(f"Prompt file not found: {prompt_file}")
-            raise FileNotFoundError(f"Prompt file not found for {self.extraction_name}")
-
-        return prompt_file.read_text()
+        try:
+            return self._extractor_prompts.get_template_parts(f"{self.extraction_name}/prompt.md")
+        except FileNotFoundError as e:
+            logger.error(str(e))
+            raise FileNotFoundError(f"Prompt file not found for {self.extraction_name}") from None
 
     def extract(self, markdown_content: str, metadata: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -167,10 +188,10 @@ class BaseExtractor(ABC):
 
         try:
             # Load the prompt template from the extractor's directory
-            prompt_template = self._load_prompt()
+            prompt_parts = self._load_prompt_parts()
 
-            # Replace the content placeholder
-            prompt = prompt_template.replace("{content}", markdown_content[:30000])
+            # Fill the content placeholder (same result as str.replace, no template rescan)
+            prompt = markdown_content[:30000].join(prompt_parts)
 
         except FileNotFoundError as e:
             logger.error(f"Failed to load prompt: {str(e)}")
@@ -301,19 +322,21 @@ class BaseExtractor(ABC):
         """
         Load the JSON schema for this extractor
 
+        Read from the extractor prompt snapshot and parsed once, so LLM calls
+        do not go back to disk.
+
         Returns:
             Schema dictionary or None if not found
         """
         try:
-            # Look in the new modular structure
-            schema_path = Path(__file__).parent / "extractors" / self.extraction_name / "schema.json"
-            if schema_path.exists():
-                with open(schema_path, 'r') as f:
-                    return json.load(f)
-            else:
-                # Schema is optional - don't warn if not found
-                logger.debug(f"No schema file at: {schema_path}")
-                return None
+            schema_text = self._extractor_prompts.get_prompt(f"{self.extraction_name}/schema.json")
+        except FileNotFoundError:
+            # Schema is optional - don't warn if not found
+            logger.debug(f"No schema file for {self.extraction_name}")
+            return None
+
+        try:
+            return _parse_schema(schema_text)
         except Exception as e:
             logger.error(f"Failed to load schema: {str(e)}")
             return None
@@ -336,9 +359,10 @@ class BaseExtractor(ABC):
         schema = self._load_extraction_schema()
 
         # Build options dict with parameters
+        extraction = self.settings.extraction
         options = {
-            "temperature": self.settings.extraction.temperature,
-            "top_p": self.settings.extraction.top_p,
+            "temperature": extraction.temperature,
+            "top_p": extraction.top_p,
         }
 
         # Add provider-specific options
@@ -366,7 +390,7 @@ class BaseExtractor(ABC):
                            f"Output: {llm_response.tokens_used.get('output', 0)}, "
                            f"Total: {sum(llm_response.tokens_used.values())}")
 
-            if llm_response.cost_estimate and self.settings.extraction.track_costs:
+            if llm_response.cost_estimate and extraction.track_costs:
                 logger.info(f"[{self.extraction_name}] Estimated cost: ${llm_response.cost_estimate:.6f}")
 
             return llm_response, request_info
@@ -442,7 +466,7 @@ class BaseExtractor(ABC):
             Parsed JSON or None
         """
         try:
-            return json.loads(response)
+            return _json_loads(response)
         except json.JSONDecodeError as e:
             logger.warning(f"JSON parsing failed: {str(e)}")
 
@@ -452,7 +476,7 @@ class BaseExtractor(ABC):
                 json_end = response.rfind("}") + 1
                 if json_start >= 0 and json_end > json_start:
                     json_str = response[json_start:json_end]
-                    return json.loads(json_str)
+                    return _json_loads(json_str)
             except:
                 pass
 
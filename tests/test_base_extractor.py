@@ -0,0 +1,32 @@
+"""
+Tests for BaseExtractor response parsing
+"""
+
+import json
+import math
+
+import pytest
+
+from src.extract.base_extractor import BaseExtractor, _json_loads
+
+
+def test_json_loads_uses_orjson_result_for_plain_json():
+    assert _json_loads('{"name": "Smith & Jones", "offices": [1, 2]}') == {"name": "Smith & Jones", "offices": [1, 2]}
+    assert _json_loads(b'{"a": 1}') == {"a": 1}
+
+
+def test_json_loads_accepts_non_finite_literals_like_json():
+    result = _json_loads('{"score": NaN, "max": Infinity, "min": -Infinity}')
+    assert math.isnan(result["score"])
+    assert result["max"] == math.inf and result["min"] == -math.inf
+
+
+def test_json_loads_still_rejects_invalid_json():
+    with pytest.raises(json.JSONDecodeError):
+        _json_loads('{"score": }')
+
+
+def test_parse_json_result_handles_non_finite_values_in_prose():
+    result = BaseExtractor._parse_json_result(None, 'Here you go: {"confidence": NaN} done')
+    assert math.isnan(result["confidence"])
+    assert BaseExtractor._parse_json_result(None, 'no json here') is None
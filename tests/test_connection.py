@@ -0,0 +1,188 @@
+"""
+Tests for DatabaseConnection query helpers
+"""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+from psycopg2 import extensions, pool
+
+from src.database import connection
+from src.database.connection import BlockingConnectionPool, DatabaseConnection
+
+
+class FakeConnection:
+    """Connection stand-in that counts commits and rollbacks"""
+
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class FakeCursor:
+    """Cursor stand-in that records executed statements"""
+
+    def __init__(self):
+        self.executed = []
+        self.rowcount = 1
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+
+    def fetchall(self):
+        return [('row',)]
+
+
+@pytest.fixture
+def db():
+    """DatabaseConnection whose PostgreSQL connection is a fake"""
+    db = DatabaseConnection.__new__(DatabaseConnection)
+    db.conn = FakeConnection()
+    db.cur = FakeCursor()
+
+    @contextmanager
+    def fake_postgres_connection(cursor_factory=None):
+        yield db.conn, db.cur
+
+    db.get_postgres_connection = fake_postgres_connection
+    return db
+
+
+def test_execute_query_commits_only_writes(db):
+    assert db.execute_query("SELECT 1") == [('row',)]
+    assert db.conn.commits == 0
+
+    assert db.execute_query("DELETE FROM t WHERE id = %s", (1,), fetch=False) == 1
+    assert db.conn.commits == 1
+
+
+def test_session_commits_on_success_and_rolls_back_on_error(db):
+    with db.session() as session:
+        session.execute("UPDATE t SET x = 1", fetch=False)
+    assert (db.conn.commits, db.conn.rollbacks) == (1, 0)
+
+    with pytest.raises(RuntimeError):
+        with db.session():
+            raise RuntimeError("boom")
+    assert (db.conn.commits, db.conn.rollbacks) == (1, 1)
+
+
+def test_execute_batch_groups_consecutive_statements(db, monkeypatch):
+    batches = []
+    monkeypatch.setattr(connection, 'execute_batch',
+                        lambda cur, sql, seq, page_size: batches.append((sql, list(seq))))
+
+    count = db.execute_batch([("INSERT a", (1,)), ("INSERT a", (2,)), ("INSERT b", (3,)), ("INSERT a", (4,))])
+
+    assert count == 4
+    assert batches == [("INSERT a", [(1,), (2,)]), ("INSERT b", [(3,)]), ("INSERT a", [(4,)])]
+    assert db.conn.commits == 1
+
+
+class FakePoolConnection:
+    """Connection stand-in the psycopg2 pool can hand out and take back"""
+
+    def __init__(self):
+        self.closed = 0
+        self.info = SimpleNamespace(transaction_status=extensions.TRANSACTION_STATUS_IDLE)
+
+    def close(self):
+        self.closed = 1
+
+    def rollback(self):
+        self.info.transaction_status = extensions.TRANSACTION_STATUS_IDLE
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    """Record every physical connection the pool opens"""
+    connections = []
+
+    def connect(*args, **kwargs):
+        connections.append(FakePoolConnection())
+        return connections[-1]
+
+    monkeypatch.setattr(pool.psycopg2, 'connect', connect)
+    return connections
+
+
+def test_rejected_putconn_keeps_the_slot_taken(opened):
+    blocking_pool = BlockingConnectionPool(0, 1, dsn='postgresql://test')
+
+    conn = blocking_pool.getconn()
+    with pytest.raises(pool.PoolError):
+        blocking_pool.putconn(FakePoolConnection())
+    assert not blocking_pool._slots.acquire(blocking=False)
+
+    blocking_pool.putconn(conn)
+    assert blocking_pool._slots.acquire(blocking=False)
+
+
+def test_returned_connections_are_kept_up_to_maxconn(opened):
+    blocking_pool = BlockingConnectionPool(2, 5, dsn='postgresql://test')
+
+    for _ in range(3):
+        burst = [blocking_pool.getconn() for _ in range(5)]
+        # Returned mid-transaction: rolled back and kept
+        burst[0].info.transaction_status = extensions.TRANSACTION_STATUS_INTRANS
+        for conn in burst:
+            blocking_pool.putconn(conn)
+
+    assert len(opened) == 5
+    assert not any(conn.closed for conn in opened)
+
+
+def test_closed_or_discarded_connections_are_not_kept(opened):
+    blocking_pool = BlockingConnectionPool(0, 2, dsn='postgresql://test')
+
+    first, second = blocking_pool.getconn(), blocking_pool.getconn()
+    second.info.transaction_status = extensions.TRANSACTION_STATUS_UNKNOWN
+    blocking_pool.putconn(first, close=True)
+    blocking_pool.putconn(second)
+
+    assert first.closed and second.closed
+    assert blocking_pool.getconn() not in (first, second)
+
+
+def test_failed_reset_discards_the_connection_and_frees_its_slot(opened):
+    blocking_pool = BlockingConnectionPool(0, 1, dsn='postgresql://test')
+    conn = blocking_pool.getconn()
+    conn.info.transaction_status = extensions.TRANSACTION_STATUS_INERROR
+
+    def failing_rollback():
+        raise extensions.OperationalError("server closed the connection")
+
+    conn.rollback = failing_rollback
+    blocking_pool.putconn(conn)
+
+    assert conn.closed
+    assert conn not in blocking_pool._pool
+    assert blocking_pool._slots.acquire(blocking=False)
+
+
+def test_putconn_to_closed_pool_raises_and_frees_the_slot(opened):
+    blocking_pool = BlockingConnectionPool(0, 1, dsn='postgresql://test')
+    conn = blocking_pool.getconn()
+    blocking_pool.closeall()
+
+    with pytest.raises(pool.PoolError):
+        blocking_pool.putconn(conn)
+    assert blocking_pool._slots.acquire(blocking=False)
+
+
+def test_pool_size_follows_settings(opened, monkeypatch):
+    settings = SimpleNamespace(database=SimpleNamespace(pool_max_connections=4))
+    monkeypatch.setattr(connection, 'get_settings', lambda: settings)
+    monkeypatch.setattr(connection, '_pools', {})
+
+    sized_pool = connection.get_connection_pool('postgresql://test')
+
+    assert (sized_pool.minconn, sized_pool.maxconn) == (connection.POOL_MIN_CONNECTIONS, 4)
+    assert connection.get_connection_pool('postgresql://test') is sized_pool
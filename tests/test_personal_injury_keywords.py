@@ -0,0 +1,164 @@
+"""
+Tests for the personal injury keyword tables and matchers
+"""
+
+import pytest
+
+from src.core import personal_injury_keywords as keywords
+from src.core.personal_injury_keywords import PIKeywordHit
+
+CAR = (0, 0)  # motor_vehicle_accidents.car_accidents
+SCOOTER_OWNERS = ((0, 1), (0, 7))  # motorcycle_accidents, electric_scooter_accidents
+
+
+@pytest.fixture(params=['automaton', 'fallback'])
+def scanner(request, monkeypatch):
+    """Run scanner tests with pyahocorasick and with the per-phrase fallback"""
+    if request.param == 'fallback':
+        monkeypatch.setattr(keywords, '_get_automaton', lambda: None)
+    return request.param
+
+
+def phrase_id(phrase):
+    return keywords.PHRASES.index(phrase)
+
+
+def test_phrase_tables_are_parallel_and_normalized():
+    assert len(keywords.PHRASES) == len(keywords.PHRASE_OWNERS)
+    assert keywords.PHRASES[0] == 'car accident'
+    assert keywords.PHRASE_OWNERS[0] == CAR
+    assert all(phrase == ' '.join(phrase.lower().split()) for phrase in keywords.PHRASES)
+
+
+def test_unknown_module_attribute_raises():
+    with pytest.raises(AttributeError):
+        keywords.NOT_A_TABLE
+
+
+def test_category_accessors():
+    assert 'car accident' in keywords.get_category('motor_vehicle_accidents')['car_accidents']
+    assert b'car accident' in keywords.get_category_bytes('motor_vehicle_accidents')['car_accidents']
+    assert 'car accident' in keywords.get_keyword_set('motor_vehicle_accidents', 'car_accidents')
+    assert keywords.name_of(*CAR) == ('motor_vehicle_accidents', 'car_accidents')
+    with pytest.raises(KeyError):
+        keywords.get_category_bytes('no_such_category')
+
+
+def test_findall_prefers_longest_phrase_on_word_boundaries():
+    text = 'Call a Car Accident Lawyer Needed today; no scar accidents.'
+    assert keywords.findall('motor_vehicle_accidents', 'car_accidents', text) == ['Car Accident Lawyer Needed']
+
+
+def test_find_keyword_hits(scanner):
+    hits = keywords.find_keyword_hits('Car accident lawyer needed! Not a scar accidents case.')
+
+    assert hits == [
+        PIKeywordHit(0, 0, 0, 12, phrase_id('car accident')),
+        PIKeywordHit(0, 0, 0, 26, phrase_id('car accident lawyer needed')),
+    ]
+
+
+def test_hits_keep_offsets_of_non_ascii_text(scanner):
+    hits = keywords.find_keyword_hits('Café — car accident')
+    assert [(hit.start, hit.end) for hit in hits] == [(7, 19)]
+
+
+def test_shared_phrase_hits_every_owner(scanner):
+    hits = keywords.find_keyword_hits('a scooter accident')
+    assert sorted((hit.top, hit.sub) for hit in hits) == list(SCOOTER_OWNERS)
+
+
+def test_count_keyword_hits(scanner):
+    counts = keywords.count_keyword_hits('car accident, then another car accident')
+    assert counts[phrase_id('car accident')] == 2
+
+
+def test_iter_matches(scanner):
+    assert list(keywords.iter_matches('my car accident')) == [
+        ('motor_vehicle_accidents', 'car_accidents', 'car accident'),
+    ]
+
+
+def test_stream_finds_phrases_split_across_pieces(scanner):
+    text = 'We handle every car accident lawyer needed call, car accident or not.'
+    pieces = [text[:20], text[20:23], text[23:]]
+
+    streamed = list(keywords.iter_keyword_hits_stream(pieces))
+
+    assert sorted(streamed, key=lambda hit: (hit.start, hit.end)) == keywords.find_keyword_hits(text)
+
+
+def test_stream_defers_hit_at_piece_end_until_next_character(scanner):
+    # 'car accident' ends the first piece but is part of 'car accidents'
+    streamed = list(keywords.iter_keyword_hits_stream(['car accident', 's everywhere']))
+    assert phrase_id('car accident') not in [hit.phrase_id for hit in streamed]
+
+
+def test_candidates_are_longest_first():
+    ids = keywords.candidates('CAR')
+    lengths = [len(keywords.PHRASES[phrase_id]) for phrase_id in ids]
+    assert phrase_id('car accident') in ids
+    assert lengths == sorted(lengths, reverse=True)
+
+
+@pytest.mark.parametrize('phrase', ['car accident', 'Car Accident', '  car   accident '])
+def test_phrase_lookups_normalize_case_and_whitespace(phrase):
+    assert keywords.is_keyword(phrase)
+    assert keywords.category_of(phrase) == CAR
+    assert keywords.lookup(phrase) == (CAR,)
+    assert keywords.membership(phrase) & keywords.category_mask('motor_vehicle_accidents')
+
+
+def test_lookups_of_unknown_phrase():
+    assert not keywords.is_keyword('car accidentx')
+    assert keywords.lookup('car accidentx') == ()
+    assert keywords.membership('car accidentx') == 0
+    with pytest.raises(KeyError):
+        keywords.category_of('car accidentx')
+
+
+def test_lookup_and_membership_cover_every_owner():
+    assert keywords.lookup('scooter accident') == SCOOTER_OWNERS
+    assert bin(keywords.membership('scooter accident')).count('1') == 2
+
+
+def test_category_masks_partition_subcategories():
+    masks = [keywords.category_mask(category) for category in keywords.CATEGORIES]
+    total = sum(len(subcategories) for subcategories in keywords.SUBCATEGORIES)
+    assert sum(masks) == (1 << total) - 1
+    with pytest.raises(KeyError):
+        keywords.category_mask('no_such_category')
+
+
+def test_keywords_with_prefix():
+    matches = keywords.keywords_with_prefix('Car Accident S')
+    assert matches == sorted(matches)
+    assert 'car accident settlement' in matches
+    assert all(match.startswith('car accident s') for match in matches)
+    assert keywords.keywords_with_prefix('zzzz') == []
+
+
+def test_longest_keyword_prefix():
+    assert keywords.longest_keyword_prefix('Car accident lawyer needed, urgently') == 'car accident lawyer needed'
+    assert keywords.longest_keyword_prefix('car accidents happen') is None
+    assert keywords.longest_keyword_prefix('nothing here') is None
+
+
+def test_pack_ids_round_trip():
+    for top, subcategories in enumerate(keywords.SUBCATEGORIES):
+        for sub in range(len(subcategories)):
+            assert keywords.resolve(keywords.pack_ids(top, sub)) == keywords.name_of(top, sub)
+
+
+def test_phrase_buffer_slices_back_to_phrases():
+    buffer, offsets = keywords.phrase_buffer()
+    assert len(offsets) == len(keywords.PHRASES) + 1
+    index = phrase_id('car accident settlement')
+    assert buffer[offsets[index]:offsets[index + 1]] == b'car accident settlement'
+
+
+def test_keyword_table():
+    pytest.importorskip('pandas')
+    table = keywords.keyword_table()
+    assert len(table) == len(keywords.PHRASES)
+    assert table.iloc[0].tolist() == ['motor_vehicle_accidents', 'car_accidents', 'car accident']
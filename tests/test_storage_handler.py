@@ -0,0 +1,86 @@
+"""
+Tests for StorageHandler listing and caching
+"""
+
+from src.core.storage_handler import StorageHandler
+
+
+def file_item(name):
+    return {'name': name, 'id': f'id-{name}', 'metadata': {'size': 1, 'eTag': 'e'}}
+
+
+def folder_item(name):
+    return {'name': name, 'id': None, 'metadata': None}
+
+
+class FakeBucket:
+    """Storage bucket stand-in serving listings from a dict of folders"""
+
+    def __init__(self, tree, failing=()):
+        self.tree = tree
+        self.failing = set(failing)
+        self.list_calls = []
+
+    def list(self, path, options=None):
+        self.list_calls.append(path)
+        if path in self.failing:
+            raise RuntimeError(f"storage unavailable for {path}")
+        items = self.tree.get(path, [])
+        if options:
+            items = items[options['offset']:options['offset'] + options['limit']]
+        return items
+
+    def download(self, path):
+        return f"content of {path}".encode()
+
+
+class FakeClient:
+    """Supabase client stand-in exposing one bucket"""
+
+    def __init__(self, bucket):
+        self.bucket = bucket
+        self.storage = self
+
+    def from_(self, name):
+        return self.bucket
+
+
+TREE = {
+    'a.com/markdown': [file_item('index.md'), folder_item('blog'), file_item('notes.txt')],
+    'a.com/markdown/blog': [file_item('post.md')],
+}
+
+
+def make_handler(bucket):
+    return StorageHandler({'list_page_size': 2}, client=FakeClient(bucket))
+
+
+def test_list_file_records_walks_subfolders_and_caches():
+    bucket = FakeBucket(TREE)
+    handler = make_handler(bucket)
+
+    assert handler.list_files_for_domain('a.com') == ['blog/post.md', 'index.md']
+    calls = len(bucket.list_calls)
+    assert handler.list_files_for_domain('a.com') == ['blog/post.md', 'index.md']
+    assert len(bucket.list_calls) == calls
+
+
+def test_failed_folder_listing_is_not_cached():
+    bucket = FakeBucket(TREE, failing={'a.com/markdown/blog'})
+    handler = make_handler(bucket)
+
+    assert handler.list_files_for_domain('a.com') == ['index.md']
+
+    # Once storage recovers, the next call lists again and finds every file
+    bucket.failing.clear()
+    assert handler.list_files_for_domain('a.com') == ['blog/post.md', 'index.md']
+
+
+def test_iter_domain_files_uses_given_listing():
+    bucket = FakeBucket(TREE)
+    handler = make_handler(bucket)
+
+    downloaded = list(handler.iter_domain_files('a.com', files=['index.md']))
+
+    assert downloaded == [('index.md', 'content of a.com/markdown/index.md')]
+    assert bucket.list_calls == []
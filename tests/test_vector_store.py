@@ -0,0 +1,285 @@
+"""
+Tests for the SQL the vector stores send to PostgreSQL
+"""
+
+import csv
+import io
+import json
+from contextlib import contextmanager
+
+import pytest
+
+from src.database import vector_store
+from src.database.vector_store import LocalPGVectorStore
+
+
+class FakeConnection:
+    """Connection stand-in that hands out one recording cursor"""
+
+    def __init__(self, rows=None):
+        self.prepared_statements = set()
+        self.cursor_obj = FakeCursor(self, rows or [])
+
+    def cursor(self):
+        return self.cursor_obj
+
+
+class FakeCursor:
+    """Cursor stand-in that records executed statements"""
+
+    def __init__(self, connection, rows):
+        self.connection = connection
+        self.rows = rows
+        self.executed = []
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+
+    def fetchall(self):
+        return self.rows
+
+    def copy_expert(self, sql, file):
+        self.executed.append((sql, file.read()))
+
+    def close(self):
+        pass
+
+
+class FakeEmbeddings:
+    """Embeddings stand-in returning a fixed small vector per text"""
+
+    model = 'fake'
+
+    def embed_query(self, text):
+        return [float(len(text)), 0.5]
+
+    def embed_documents(self, texts):
+        return [self.embed_query(text) for text in texts]
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """LocalPGVectorStore whose pooled connection is a FakeConnection"""
+    conn = FakeConnection()
+
+    @contextmanager
+    def fake_pooled_connection(db_uri, register_vectors=False):
+        yield conn
+
+    monkeypatch.setattr(vector_store, 'pooled_connection', fake_pooled_connection)
+    vector_store._embed_cache.clear()
+    store = LocalPGVectorStore('postgresql://test', FakeEmbeddings())
+    store.fake_connection = conn
+    return store
+
+
+def test_copy_document_vectors_writes_quoted_csv_batches(monkeypatch):
+    monkeypatch.setattr(vector_store, 'COPY_BATCH_SIZE', 2)
+    cur = FakeCursor(FakeConnection(), [])
+    rows = [
+        ('a.com/index.md', 'Say "hi",\nthen leave', {'domain': 'a.com', 'n': 1}, [0.5, 1.0], 'a.com', 'abc123'),
+        ('b.com/index.md', 'plain', {}, [0.25, -2.0], None, None),
+        ('c.com/index.md', '', {'x': None}, [1.5, 0.0], 'c.com', 'def456'),
+    ]
+
+    assert vector_store.copy_document_vectors(cur, iter(rows)) == 3
+
+    assert len(cur.executed) == 2
+    sql, payload = cur.executed[0]
+    assert 'FROM STDIN WITH (FORMAT csv, FORCE_NULL (domain, domain_id))' in sql
+    # Every field is quoted, so a missing domain/domain_id is a quoted empty
+    # string, which FORCE_NULL loads as NULL
+    assert payload.splitlines()[-1] == '"b.com/index.md","plain","{}","[0.25,-2.0]","",""'
+
+    parsed = [record for _, data in cur.executed for record in csv.reader(io.StringIO(data))]
+    assert [record[1] for record in parsed] == ['Say "hi",\nthen leave', 'plain', '']
+    assert json.loads(parsed[0][2]) == {'domain': 'a.com', 'n': 1}
+    assert [record[3] for record in parsed] == ['[0.5,1.0]', '[0.25,-2.0]', '[1.5,0.0]']
+
+
+def test_copy_document_vectors_skips_empty_input():
+    cur = FakeCursor(FakeConnection(), [])
+    assert vector_store.copy_document_vectors(cur, []) == 0
+    assert cur.executed == []
+
+
+@pytest.mark.parametrize('prepare', [True, False])
+def test_similarity_search_batch_binds_embeddings_as_text_array(store, prepare):
+    store.prepare_statements = prepare
+    cur = store.fake_connection.cursor_obj
+    cur.rows = [(1, 'id-a', 'first', {'domain': 'a.com'}, 0.1),
+                (2, 'id-b', 'second', {}, 0.2)]
+
+    results = store.similarity_search_batch(['ab', 'abc'], k=2, filter={'domain_id': 'abc123'})
+
+    assert [[doc.page_content for doc in docs] for docs in results] == [['first'], ['second']]
+    assert results[0][0].metadata == {'domain': 'a.com', 'id': 'id-a'}
+
+    sql, params = cur.executed[-1]
+    assert params[1:] == (['[2.0,0.5]', '[3.0,0.5]'], 'abc123', 100, 2)
+    if prepare:
+        prepare_sql = cur.executed[0][0]
+        assert prepare_sql.startswith('PREPARE vs_')
+        # A list of str is adapted as text[], so the parameter must be declared text[]
+        assert 'unnest($1::text[])' in prepare_sql
+        assert 'q.embedding::vector' in prepare_sql
+        assert sql.startswith('SET LOCAL hnsw.ef_search = %s; EXECUTE vs_')
+    else:
+        assert 'unnest(%s::text[])' in sql
+        assert sql.startswith('SET LOCAL hnsw.ef_search = %s; ')
+
+
+def test_prepared_statement_numbers_placeholders_and_unescapes_percent():
+    name, body = vector_store._prepared_statement(
+        "SELECT '50%%', %s::vector FROM t WHERE a = %s LIMIT %s"
+    )
+    assert name.startswith('vs_') and len(name) == 19
+    assert body == "SELECT '50%', $1::vector FROM t WHERE a = $2 LIMIT $3"
+    assert vector_store._prepared_statement("SELECT %s")[0] != name
+
+
+def test_search_sql_shortlists_on_halfvec_and_reranks_full_precision():
+    sql = vector_store._search_sql('domain_id')
+
+    assert 'WHERE domain_id = %s' in sql
+    assert 'ORDER BY embedding::halfvec(768) <=> %s::halfvec(768)' in sql
+    assert 'd.embedding <=> %s::vector as distance' in sql
+    # (embedding, filter value, candidate limit, embedding, k)
+    assert sql.replace('%%', '').count('%s') == 5
+    assert 'WHERE' not in vector_store._search_sql(None)
+
+
+def test_metadata_projection_quotes_keys():
+    projection = vector_store._metadata_projection(frozenset(["it's", '50%']))
+    assert projection == "jsonb_build_object('50%%', d.metadata->'50%%', 'it''s', d.metadata->'it''s')"
+    assert vector_store._metadata_projection(None) == 'd.metadata'
+
+
+@pytest.mark.parametrize('prepare', [True, False])
+def test_similarity_search_projection_percent_survives_both_paths(store, prepare):
+    store.prepare_statements = prepare
+    cur = store.fake_connection.cursor_obj
+    cur.rows = [('id-a', 'content', {'50%': 1})]
+
+    docs = store.similarity_search('abc', k=3, filter={'document_id': 'a.com/index.md'}, projection=['50%'])
+
+    assert docs[0].metadata == {'50%': 1, 'id': 'id-a'}
+    sql, params = cur.executed[-1]
+    literal = '[3.0,0.5]'
+    assert params == (100, literal, 'a.com/index.md', 100, literal, 3)
+    if prepare:
+        # PREPARE runs without parameters, so its body carries a single %
+        prepare_sql = cur.executed[0][0]
+        assert cur.executed[0][1] is None
+        assert "'50%', d.metadata->'50%'" in prepare_sql
+        assert '%%' not in prepare_sql
+    else:
+        # psycopg2 formats the query, turning %% back into %
+        assert "'50%%', d.metadata->'50%%'" in sql
+        assert "'50%', d.metadata->'50%'" in sql % tuple('?' * len(params))
+
+
+def test_batch_search_sql_renders_one_lateral_search_per_query():
+    sql = vector_store._batch_search_sql('document_id', frozenset(['domain']))
+
+    assert 'FROM unnest(%s::text[]) WITH ORDINALITY AS q(embedding, ord)' in sql
+    assert 'CROSS JOIN LATERAL' in sql
+    assert 'WHERE document_id = %s' in sql
+    assert "jsonb_build_object('domain', d.metadata->'domain') as metadata" in sql
+    assert 'ORDER BY q.ord, r.distance' in sql
+    # (embedding literals, filter value, candidate limit, k)
+    assert sql.count('%s') == 4
+
+
+def test_similarity_search_batch_embeds_only_uncached_queries(store, monkeypatch):
+    calls = []
+    embed_documents = store.embeddings.embed_documents
+    monkeypatch.setattr(store.embeddings, 'embed_documents', lambda texts: calls.append(texts) or embed_documents(texts))
+
+    store.similarity_search_batch(['ab', 'abc'])
+    store.similarity_search_batch(['abc', 'abcd', 'abcd'])
+
+    assert calls == [['ab', 'abc'], ['abcd']]
+    assert store.similarity_search_batch([]) == []
+
+
+class FakeSearchCursor:
+    """Minimal cursor for calling _execute_search directly"""
+
+    def __init__(self):
+        self.connection = FakeConnection()
+        self.executed = []
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+
+
+@pytest.mark.parametrize('prepare', [True, False])
+def test_execute_search_sets_ef_search_in_the_same_round_trip(prepare):
+    cur = FakeSearchCursor()
+
+    vector_store._execute_search(cur, "SELECT %s LIMIT %s", ('[1]', 5), prepare, 150)
+
+    sql, params = cur.executed[-1]
+    assert sql.startswith('SET LOCAL hnsw.ef_search = %s; ')
+    assert params == (150, '[1]', 5)
+    assert len(cur.executed) == (2 if prepare else 1)
+
+
+def test_execute_search_caps_ef_search_and_prepares_once():
+    cur = FakeSearchCursor()
+
+    vector_store._execute_search(cur, "SELECT %s", ('[1]',), True, 5000)
+    vector_store._execute_search(cur, "SELECT %s", ('[1]',), True)
+
+    assert [sql.split(' ', 1)[0] for sql, _ in cur.executed] == ['PREPARE', 'SET', 'EXECUTE']
+    assert cur.executed[1][1] == (vector_store.HNSW_MAX_EF_SEARCH, '[1]')
+    assert cur.executed[2][1] == ('[1]',)
+
+
+def test_similarity_search_raises_ef_search_to_candidate_limit(store):
+    cur = store.fake_connection.cursor_obj
+
+    store.similarity_search('abc', k=20)
+
+    sql, params = cur.executed[-1]
+    assert sql.startswith('SET LOCAL hnsw.ef_search = %s; EXECUTE ')
+    assert params == (200, '[3.0,0.5]', 200, '[3.0,0.5]', 20)
+
+
+def test_unfiltered_boost_sql_scans_flagged_and_unflagged_separately():
+    sql = vector_store._search_sql(None, 'contains_money')
+
+    assert 'WHERE contains_money\n' in sql
+    assert 'WHERE NOT contains_money\n' in sql
+    assert sql.count('money_count as boost_count') == 2
+    assert 'UNION ALL' in sql
+    assert 'ORDER BY c.boost_flag DESC, c.boost_count DESC, c.distance' in sql
+    # (embedding, candidate limit, embedding, k, k)
+    assert sql.count('%s') == 5
+
+
+def test_filtered_boost_sql_ranks_the_filtered_rows_directly():
+    sql = vector_store._search_sql('domain_id', 'contains_emails')
+
+    assert 'WHERE domain_id = %s' in sql
+    assert 'UNION ALL' not in sql
+    assert 'ORDER BY boost_flag DESC, boost_count DESC, distance' in sql
+    assert sql.count('%s') == 4
+
+
+@pytest.mark.parametrize('search_filter, expected', [
+    (None, (100, '[3.0,0.5]', 100, '[3.0,0.5]', 5, 5)),
+    ({'domain_id': 'abc123'}, ('[3.0,0.5]', 'abc123', 100, 5)),
+])
+def test_boosted_search_parameters(store, search_filter, expected):
+    cur = store.fake_connection.cursor_obj
+
+    store.similarity_search_with_metadata_boost('abc', k=5, filter=search_filter, boost_field='contains_addresses')
+
+    assert cur.executed[-1][1] == expected
+
+
+def test_boosted_search_rejects_unknown_field(store):
+    with pytest.raises(ValueError):
+        store.similarity_search_with_metadata_boost('abc', boost_field='contains_anything')